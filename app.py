@@ -2,37 +2,41 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 
-from database import disconnect_db
-from routers import exercises_router, health_router
+from configs import configs
+from database import disconnect_db, readiness
+from database.notifications import notifier
+from metrics.middleware import MetricsMiddleware
+from routers import exercises_router, health_router, metrics_router, stats_router
+from routers.exercises import catalog_snapshot
 from service_logging import logger
-from fastapi import Request
-
-import hashlib
-from random import randbytes
-from typing import Callable
+from service_logging.middleware import RequestIDMiddleware
 
 
 @asynccontextmanager
 async def lifespan(_: FastAPI):
     # on_startup
     logger.info("FastAPI application starting up...")
+    if configs.cache.NOTIFY_ENABLE:
+        await notifier.start()
+
+    await catalog_snapshot.start()
+    await readiness.start()
+
     yield
 
     # on_shutdown
     logger.info("FastAPI application shutting down...")
+    await readiness.stop()
+    await catalog_snapshot.stop()
+    await notifier.stop()
     await disconnect_db()
 
 
 service = FastAPI(lifespan=lifespan)
-
-
-@service.middleware("http")
-async def add_request_hash(request: Request, call_next: Callable):
-    request_hash = hashlib.sha1(randbytes(32)).hexdigest()[:10]
-    with logger.contextualize(request_hash=request_hash):
-        response = await call_next(request)
-        return response
-
+service.add_middleware(MetricsMiddleware)
+service.add_middleware(RequestIDMiddleware)
 
 service.include_router(health_router)
+service.include_router(stats_router)
+service.include_router(metrics_router)
 service.include_router(exercises_router)
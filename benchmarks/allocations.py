@@ -0,0 +1,65 @@
+"""Бенчмарк выделения памяти при чтении страницы списка упражнений.
+
+Сравнивает через tracemalloc загрузку страницы полными ORM объектами
+и строками Row только со столбцами ExerciseResponse, включая
+построение моделей ответа:
+
+    python -m benchmarks.allocations --rows 100000 --size 5000
+"""
+
+import argparse
+import asyncio
+import gc
+import tracemalloc
+
+from database import engine
+from database.engine import LocalAsyncSession
+from database.repository import ExerciseRepository
+from routers.exercises import LIST_COLUMNS
+from schemas import ExerciseResponse
+
+from .common import report, seed
+
+
+async def load_page(size: int, columns: list | None) -> dict[str, int]:
+    async with LocalAsyncSession() as db:
+        repo = ExerciseRepository(db)
+        # Прогрев: соединение, кеш скомпилированных выражений и подготовленных запросов
+        await repo.list_page([], sort="seq_number", limit=size, columns=columns)
+        db.expunge_all()
+        gc.collect()
+
+        tracemalloc.start()
+        rows = await repo.list_page([], sort="seq_number", limit=size, columns=columns)
+        items = [ExerciseResponse.model_validate(row) for row in rows]
+        retained, peak = tracemalloc.get_traced_memory()
+        blocks = sum(stat.count for stat in tracemalloc.take_snapshot().statistics("filename"))
+        tracemalloc.stop()
+
+    return {
+        "rows": len(items),
+        "peak_bytes_per_row": peak // max(len(items), 1),
+        "retained_bytes_per_row": retained // max(len(items), 1),
+        "retained_blocks_per_row": blocks // max(len(items), 1),
+    }
+
+
+async def main(rows: int, size: int) -> None:
+    await seed(engine, rows)
+
+    results = {
+        "size": size,
+        "entities": await load_page(size, columns=None),
+        "columns": await load_page(size, columns=LIST_COLUMNS),
+    }
+
+    await engine.dispose()
+    report(results)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000, help="Размер таблицы")
+    parser.add_argument("--size", type=int, default=5_000, help="Размер страницы")
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.size))
@@ -0,0 +1,77 @@
+import asyncio
+from urllib.parse import urlsplit
+
+
+class HTTPConnection:
+    """Минимальный HTTP/1.1 клиент с постоянным соединением для нагрузочных тестов.
+
+    Поддерживает ответы с Content-Length и chunked. Не зависит от сторонних
+    библиотек, чтобы накладные расходы клиента были минимальными и
+    предсказуемыми.
+    """
+
+    def __init__(self, url: str) -> None:
+        """
+        Args:
+            url (str): Базовый адрес сервиса, например http://localhost:8068.
+        """
+        parts = urlsplit(url)
+        self.host = parts.hostname or "localhost"
+        self.port = parts.port or 80
+        self.prefix = parts.path.rstrip("/")
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+
+    async def request(self, method: str, path: str, body: bytes | None = None) -> tuple[int, bytes]:
+        """Выполняет HTTP запрос.
+
+        Args:
+            method (str): HTTP метод.
+            path (str): Путь относительно базового адреса.
+            body (bytes | None): Тело запроса в формате JSON.
+
+        Returns:
+            tuple[int, bytes]: Код ответа и тело ответа.
+        """
+        if self._writer is None:
+            self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+
+        head = f"{method} {self.prefix}{path} HTTP/1.1\r\nHost: {self.host}\r\n"
+        if body is not None:
+            head += f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n"
+
+        self._writer.write(head.encode() + b"\r\n" + (body or b""))
+        try:
+            return await self._read_response()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            await self.close()
+            raise
+
+    async def close(self) -> None:
+        """Закрывает соединение."""
+        if self._writer is not None:
+            self._writer.close()
+            self._reader = self._writer = None
+
+    async def _read_response(self) -> tuple[int, bytes]:
+        lines = (await self._reader.readuntil(b"\r\n\r\n")).decode("latin-1").split("\r\n")
+        status = int(lines[0].split(" ", 2)[1])
+        headers = {}
+        for line in lines[1:]:
+            if line:
+                name, _, value = line.partition(":")
+                headers[name.strip().lower()] = value.strip().lower()
+
+        if headers.get("transfer-encoding") == "chunked":
+            body = b""
+            while size := int((await self._reader.readuntil(b"\r\n")).strip(), 16):
+                body += (await self._reader.readexactly(size + 2))[:-2]
+
+            await self._reader.readuntil(b"\r\n")
+        else:
+            body = await self._reader.readexactly(int(headers.get("content-length", 0)))
+
+        if headers.get("connection") == "close":
+            await self.close()
+
+        return status, body
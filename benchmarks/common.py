@@ -0,0 +1,168 @@
+"""Общие инструменты бенчмарков сервиса упражнений.
+
+Бенчмарки работают с базой данных, указанной в конфигурации сервиса,
+и изменяют ее содержимое. Запускайте их только на отдельном экземпляре PGSQL.
+"""
+
+import json
+import statistics
+import time
+from collections.abc import Awaitable, Callable, Iterable
+
+from sqlalchemy import String, bindparam, text
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+# Слова, из которых составляются названия синтетических упражнений
+TITLE_WORDS = (
+    "Произношение",
+    "Комплексное",
+    "Детальное",
+    "Гласные",
+    "Согласные",
+    "Интонация",
+    "Ударение",
+    "Диалог",
+    "Скороговорка",
+    "Чтение",
+)
+
+SEED_STMT = text(
+    """
+    INSERT INTO exercises (id, difficulty, title, text_id, lang, tags, preview_image)
+    SELECT gen_random_uuid(),
+           -- Простых упражнений больше, чем сложных
+           least(floor(-ln(1 - random()) * 3), 10)::int,
+           left(
+               (:words)[1 + floor(random() * cardinality(:words))::int] || ' ' ||
+               (:words)[1 + floor(random() * cardinality(:words))::int] || ' ' ||
+               chr(65 + (random() * 25)::int) || ' ' || n,
+               50
+           ),
+           gen_random_uuid(),
+           'ENGLISH',
+           CASE WHEN random() < 0.7
+                THEN ARRAY['TIMIT']::exercisetag[]
+                ELSE '{}'::exercisetag[]
+           END,
+           CASE WHEN random() < 0.5 THEN 'previews/' || n || '.png' END
+    FROM generate_series(1, :rows) AS n
+    """
+).bindparams(bindparam("words", value=list(TITLE_WORDS), type_=ARRAY(String)))
+
+
+async def seed(engine: AsyncEngine, rows: int) -> int:
+    """Дополняет таблицу упражнений синтетическими записями до заданного количества.
+
+    Args:
+        engine (AsyncEngine): Движок БД.
+        rows (int): Требуемое количество записей.
+
+    Returns:
+        int: Количество добавленных записей.
+    """
+    async with engine.begin() as conn:
+        existing = (await conn.execute(text("SELECT count(*) FROM exercises"))).scalar_one()
+        missing = max(rows - existing, 0)
+        if missing:
+            await conn.execute(SEED_STMT, {"rows": missing})
+
+    async with engine.connect() as conn:
+        await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.execute(text("ANALYZE exercises"))
+
+    return missing
+
+
+async def sample_ids(engine: AsyncEngine, count: int) -> list:
+    """Возвращает случайную выборку идентификаторов упражнений.
+
+    Args:
+        engine (AsyncEngine): Движок БД.
+        count (int): Размер выборки.
+
+    Returns:
+        list: Список UUID упражнений.
+    """
+    stmt = text("SELECT id FROM exercises ORDER BY random() LIMIT :count")
+    async with engine.connect() as conn:
+        result = await conn.execute(stmt, {"count": count})
+        return list(result.scalars().all())
+
+
+async def measure(
+    operation: Callable[..., Awaitable[object]], args: Iterable[object]
+) -> list[float]:
+    """Последовательно выполняет операцию для каждого аргумента и замеряет время.
+
+    Args:
+        operation (Callable[..., Awaitable[object]]): Асинхронная операция.
+        args (Iterable[object]): Аргументы, по одному на каждый вызов.
+
+    Returns:
+        list[float]: Длительности вызовов в секундах.
+    """
+    samples = []
+    for arg in args:
+        started = time.perf_counter()
+        await operation(arg)
+        samples.append(time.perf_counter() - started)
+
+    return samples
+
+
+def percentiles(samples: list[float]) -> dict[str, float]:
+    """Считает перцентили длительностей в миллисекундах.
+
+    Args:
+        samples (list[float]): Длительности в секундах.
+
+    Returns:
+        dict[str, float]: Значения p50, p95 и p99.
+    """
+    if len(samples) < 2:
+        value = samples[0] * 1000 if samples else 0.0
+        return {"p50": value, "p95": value, "p99": value}
+
+    cuts = statistics.quantiles(samples, n=100, method="inclusive")
+    return {
+        "p50": round(cuts[49] * 1000, 3),
+        "p95": round(cuts[94] * 1000, 3),
+        "p99": round(cuts[98] * 1000, 3),
+    }
+
+
+def plan_uses_index(plan: dict, index_name: str) -> bool:
+    """Проверяет, что план выполнения EXPLAIN (FORMAT JSON) использует индекс.
+
+    Args:
+        plan (dict): Узел плана выполнения.
+        index_name (str): Имя индекса.
+
+    Returns:
+        bool: True, если индекс используется в узле или его потомках.
+    """
+    if plan.get("Index Name") == index_name:
+        return True
+
+    return any(plan_uses_index(child, index_name) for child in plan.get("Plans", []))
+
+
+def plan_sorts(plan: dict) -> bool:
+    """Проверяет, что план выполнения EXPLAIN (FORMAT JSON) содержит сортировку.
+
+    Args:
+        plan (dict): Узел плана выполнения.
+
+    Returns:
+        bool: True, если в узле или его потомках есть узел Sort.
+    """
+    if plan.get("Node Type") in ("Sort", "Incremental Sort"):
+        return True
+
+    return any(plan_sorts(child) for child in plan.get("Plans", []))
+
+
+def report(results: dict) -> None:
+    """Выводит результаты бенчмарка в stdout в формате JSON."""
+    print(json.dumps(results, ensure_ascii=False, indent=2))
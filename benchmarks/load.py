@@ -0,0 +1,176 @@
+"""Нагрузочный тест HTTP API сервиса упражнений.
+
+Заполняет БД синтетическими упражнениями, нагружает сценарии GET /,
+GET /{uuid}, POST /, PATCH /{uuid} и DELETE /{uuid} заданным числом
+параллельных клиентов и выводит p50/p95/p99 и RPS каждого сценария в JSON.
+Окружение (PGSQL и сервис) поднимается из benchmarks/docker-compose.yml:
+
+    docker compose -f benchmarks/docker-compose.yml up -d --build
+    export EXERCISES_DB_POSTGRES_HOST=localhost EXERCISES_DB_POSTGRES_PORT=5433 \\
+        EXERCISES_DB_POSTGRES_PASSWORD=benchmark
+    python -m benchmarks.load --rows 100000 --concurrency 32 --save-baseline baseline.json
+    python -m benchmarks.load --rows 100000 --concurrency 32 --baseline baseline.json
+
+При сравнении с базовой линией завершается с кодом 1, если RPS сценария
+упал или p95 вырос больше, чем на допустимую долю.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+import uuid
+from collections.abc import Callable
+
+from database import engine
+
+from .client import HTTPConnection
+from .common import TITLE_WORDS, percentiles, report, sample_ids, seed
+
+# Сценарий: имя -> функция, возвращающая (метод, путь, тело) очередного запроса
+Scenario = Callable[[], tuple[str, str, bytes | None]]
+
+
+def scenarios(ids: list, created: list) -> dict[str, Scenario]:
+    def listing():
+        page = random.randint(1, 20)
+        return "GET", f"/?size=50&page={page}", None
+
+    def detail():
+        return "GET", f"/{random.choice(ids)}", None
+
+    def create():
+        body = {
+            "difficulty": min(int(random.expovariate(1 / 3)), 10),
+            "title": " ".join(random.sample(TITLE_WORDS, 2)),
+            "text_id": str(uuid.uuid4()),
+            "lang": "english",
+            "tags": ["TIMIT"] if random.random() < 0.7 else [],
+        }
+        return "POST", "/", json.dumps(body).encode()
+
+    def patch():
+        body = {"difficulty": random.randint(0, 10)}
+        return "PATCH", f"/{random.choice(ids)}", json.dumps(body).encode()
+
+    def delete():
+        # Удаляются только упражнения, созданные сценарием create
+        return "DELETE", f"/{created.pop()}", None
+
+    return {
+        "list": listing,
+        "detail": detail,
+        "create": create,
+        "patch": patch,
+        "delete": delete,
+    }
+
+
+async def run(
+    url: str, name: str, scenario: Scenario, requests: int, concurrency: int, created: list
+) -> dict:
+    samples: list[float] = []
+    errors = 0
+    remaining = requests
+
+    async def worker() -> None:
+        nonlocal remaining, errors
+        connection = HTTPConnection(url)
+        while remaining > 0:
+            remaining -= 1
+            method, path, body = scenario()
+            started = time.perf_counter()
+            try:
+                status, content = await connection.request(method, path, body)
+            except (OSError, asyncio.IncompleteReadError):
+                errors += 1
+                continue
+
+            samples.append(time.perf_counter() - started)
+            if status >= 400:
+                errors += 1
+            elif name == "create":
+                created.append(json.loads(content)["id"])
+
+        await connection.close()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    return {
+        "requests": len(samples),
+        "errors": errors,
+        "rps": round(len(samples) / elapsed, 1),
+        **percentiles(samples),
+    }
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+
+        if current["rps"] < previous["rps"] * (1 - tolerance):
+            regressions.append(f"{name}: rps {previous['rps']} -> {current['rps']}")
+        if current["p95"] > previous["p95"] * (1 + tolerance):
+            regressions.append(f"{name}: p95 {previous['p95']} -> {current['p95']} ms")
+
+    return regressions
+
+
+async def main(args: argparse.Namespace) -> int:
+    await seed(engine, args.rows)
+    ids = await sample_ids(engine, 10_000)
+    await engine.dispose()
+
+    created: list = []
+    results = {}
+    for name, scenario in scenarios(ids, created).items():
+        # Удаляется не больше упражнений, чем создано
+        requests = min(args.requests, len(created)) if name == "delete" else args.requests
+        # Прогрев соединений и кешей сервиса не учитывается
+        if name in ("list", "detail"):
+            await run(args.url, name, scenario, args.concurrency * 10, args.concurrency, created)
+
+        results[name] = await run(
+            args.url, name, scenario, requests, args.concurrency, created
+        )
+
+    output = {
+        "config": {"rows": args.rows, "requests": args.requests, "concurrency": args.concurrency},
+        "scenarios": results,
+    }
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as file:
+            json.dump(results, file, indent=2)
+
+    status = 0
+    if args.baseline:
+        with open(args.baseline) as file:
+            regressions = compare(results, json.load(file), args.tolerance)
+
+        output["regressions"] = regressions
+        status = 1 if regressions else 0
+
+    report(output)
+    return status
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default="http://localhost:8068", help="Адрес сервиса")
+    parser.add_argument("--rows", type=int, default=100_000, help="Размер таблицы")
+    parser.add_argument("--requests", type=int, default=5_000, help="Число запросов на сценарий")
+    parser.add_argument("--concurrency", type=int, default=32, help="Число параллельных клиентов")
+    parser.add_argument("--baseline", help="Файл базовой линии для сравнения")
+    parser.add_argument("--save-baseline", help="Сохранить результаты как базовую линию")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.15, help="Допустимое ухудшение RPS и p95 (доля)"
+    )
+    sys.exit(asyncio.run(main(parser.parse_args())))
@@ -0,0 +1,99 @@
+"""Бенчмарк пропускной способности обработчика запросов в режимах логирования.
+
+Прогоняет запросы через ASGI приложение, обработчик которого пишет
+в лог столько же строк, сколько обработчики упражнений, и сравнивает
+запросы в секунду без логирования, с синхронной записью и с записью
+через очередь в текстовом и JSON форматах. Не требует БД:
+
+    python -m benchmarks.log_throughput --requests 20000 --output /tmp/bench.log
+"""
+
+import argparse
+import asyncio
+import os
+import time
+
+from fastapi import FastAPI, Response
+
+from configs.graylog import GraylogConfiguration
+from configs.logging import LoggingConfiguration
+from service_logging.setup import setup_logger
+
+from .common import report
+
+MODES = {
+    "sync_text": {"FORMAT": "text", "QUEUE_ENABLE": False},
+    "queue_text": {"FORMAT": "text", "QUEUE_ENABLE": True},
+    "sync_json": {"FORMAT": "json", "QUEUE_ENABLE": False},
+    "queue_json": {"FORMAT": "json", "QUEUE_ENABLE": True},
+}
+
+SCOPE = {
+    "type": "http",
+    "http_version": "1.1",
+    "method": "GET",
+    "scheme": "http",
+    "path": "/exercises/1",
+    "raw_path": b"/exercises/1",
+    "root_path": "",
+    "query_string": b"",
+    "headers": [],
+    "server": ("benchmark", 80),
+    "client": ("benchmark", 1),
+}
+
+
+def make_app(log) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/exercises/{number}")
+    async def get_exercise(number: int) -> Response:
+        with log.contextualize(request_hash=f"{number:010x}"):
+            log.info("Getting information about an exercise...")
+            log.success(f"Exercise received: ({number})")
+
+        return Response(b"{}", media_type="application/json")
+
+    return app
+
+
+async def throughput(app: FastAPI, requests: int) -> float:
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(_message):
+        pass
+
+    started = time.perf_counter()
+    for _ in range(requests):
+        await app(dict(SCOPE), receive, send)
+
+    return round(requests / (time.perf_counter() - started))
+
+
+async def main(requests: int, output: str) -> None:
+    results = {"requests": requests}
+    with open(output, "w") as stream:
+        for mode, settings in MODES.items():
+            log, log_queue = setup_logger(
+                stream,
+                config=LoggingConfiguration(LEVEL="INFO", **settings),
+                graylog=GraylogConfiguration(ENABLE=False),
+            )
+            results[mode] = {"rps": await throughput(make_app(log), requests)}
+            if log_queue is not None:
+                log_queue.stop()
+                results[mode]["dropped"] = log_queue.dropped
+
+        log.remove()
+        results["off"] = {"rps": await throughput(make_app(log), requests)}
+
+    report(results)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=20_000, help="Число запросов на режим")
+    parser.add_argument("--output", default=os.devnull, help="Файл вывода логов")
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.output))
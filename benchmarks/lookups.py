@@ -0,0 +1,131 @@
+"""Бенчмарк точечных операций над упражнением: детали, обновление, удаление.
+
+Замеряет p50/p95/p99 операций, которые выполняют обработчики
+GET/PATCH/DELETE /{uuid}. Обе части сравнения выполняются на текущей
+схеме БД (alembic upgrade head):
+
+    python -m benchmarks.lookups --rows 1000000 --baseline
+    python -m benchmarks.lookups --rows 1000000
+
+С флагом --baseline операции выполняются так, как до добавления индексов
+идентичности: поиск упражнения запросом SELECT ... WHERE id, затем
+изменение ORM объекта и refresh. На время замера индексы ix_exercises_id
+и ix_exercises_seq_number удаляются и после него создаются заново.
+Откат миграций для этого сравнения не подходит: код сервиса использует
+столбцы и таблицы более поздних ревизий.
+"""
+
+import argparse
+import asyncio
+
+from sqlalchemy import select, text
+
+from database import engine
+from database.engine import LocalAsyncSession
+from database.models import Exercise
+from database.repository import ExerciseRepository
+
+from .common import measure, percentiles, report, sample_ids, seed
+
+# Индексы идентичности ревизии 7b3e9c1f5a20
+IDENTITY_INDEXES = {
+    "ix_exercises_id": "CREATE UNIQUE INDEX IF NOT EXISTS ix_exercises_id ON exercises (id)",
+    "ix_exercises_seq_number": (
+        "CREATE UNIQUE INDEX IF NOT EXISTS ix_exercises_seq_number ON exercises (seq_number)"
+    ),
+}
+
+
+async def detail(uuid) -> None:
+    async with LocalAsyncSession() as db:
+        await ExerciseRepository(db).get(uuid)
+
+
+async def patch(uuid) -> None:
+    async with LocalAsyncSession() as db:
+        await ExerciseRepository(db).update(uuid, {"difficulty": Exercise.difficulty + 1})
+        await db.commit()
+
+
+async def delete(uuid) -> None:
+    async with LocalAsyncSession() as db:
+        await ExerciseRepository(db).delete(uuid)
+        await db.commit()
+
+
+async def baseline_detail(uuid) -> None:
+    async with LocalAsyncSession() as db:
+        result = await db.execute(select(Exercise).where(Exercise.id == uuid))
+        result.scalar_one_or_none()
+
+
+async def baseline_patch(uuid) -> None:
+    async with LocalAsyncSession() as db:
+        result = await db.execute(select(Exercise).where(Exercise.id == uuid))
+        exercise = result.scalar_one()
+        exercise.difficulty += 1
+        await db.commit()
+        await db.refresh(exercise)
+
+
+async def baseline_delete(uuid) -> None:
+    async with LocalAsyncSession() as db:
+        result = await db.execute(select(Exercise).where(Exercise.id == uuid))
+        await db.delete(result.scalar_one())
+        await db.commit()
+
+
+async def drop_identity_indexes() -> None:
+    async with engine.begin() as conn:
+        for name in IDENTITY_INDEXES:
+            await conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
+
+        await conn.execute(text("ANALYZE exercises"))
+
+
+async def create_identity_indexes() -> None:
+    async with engine.begin() as conn:
+        for statement in IDENTITY_INDEXES.values():
+            await conn.execute(text(statement))
+
+        await conn.execute(text("ANALYZE exercises"))
+
+
+async def main(rows: int, requests: int, baseline: bool) -> None:
+    await seed(engine, rows)
+    ids = await sample_ids(engine, requests * 2)
+    reads, writes = ids[:requests], ids[requests:]
+
+    if baseline:
+        operations = (baseline_detail, baseline_patch, baseline_delete)
+        await drop_identity_indexes()
+    else:
+        operations = (detail, patch, delete)
+
+    results = {"rows": rows, "requests": requests, "baseline": baseline}
+    try:
+        names, samples = ("detail", "patch", "delete"), (reads, reads, writes)
+        for name, operation, args in zip(names, operations, samples):
+            results[name] = percentiles(await measure(operation, args))
+
+    finally:
+        if baseline:
+            await create_identity_indexes()
+
+        await engine.dispose()
+
+    report(results)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Размер таблицы")
+    parser.add_argument("--requests", type=int, default=2_000, help="Число замеров на операцию")
+    parser.add_argument(
+        "--baseline",
+        action="store_true",
+        help="Замерить операции в том виде, как до добавления индексов идентичности",
+    )
+    args = parser.parse_args()
+
+    asyncio.run(main(args.rows, args.requests, args.baseline))
@@ -0,0 +1,96 @@
+"""Бенчмарк пропускной способности middleware идентификатора запроса.
+
+Сравнивает прежнюю реализацию на BaseHTTPMiddleware (sha1 от случайных
+байтов) с ASGI RequestIDMiddleware на обработчике, который пишет строку
+в лог. Не требует БД:
+
+    python -m benchmarks.middleware --requests 20000
+"""
+
+import argparse
+import asyncio
+import hashlib
+import time
+from random import randbytes
+
+from fastapi import FastAPI, Request, Response
+
+from service_logging import logger
+from service_logging.middleware import RequestIDMiddleware
+
+from .common import report
+
+SCOPE = {
+    "type": "http",
+    "http_version": "1.1",
+    "method": "GET",
+    "scheme": "http",
+    "path": "/",
+    "raw_path": b"/",
+    "root_path": "",
+    "query_string": b"",
+    "headers": [],
+    "server": ("benchmark", 80),
+    "client": ("benchmark", 1),
+}
+
+
+def make_app(middleware: str) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/")
+    async def index() -> Response:
+        logger.debug("Handling request...")
+        return Response(b"{}", media_type="application/json")
+
+    if middleware == "base_http":
+
+        @app.middleware("http")
+        async def add_request_hash(request: Request, call_next):
+            request_hash = hashlib.sha1(randbytes(32)).hexdigest()[:10]
+            with logger.contextualize(request_hash=request_hash):
+                return await call_next(request)
+
+    elif middleware == "asgi":
+        app.add_middleware(RequestIDMiddleware)
+
+    return app
+
+
+async def throughput(app: FastAPI, requests: int) -> float:
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(_message):
+        pass
+
+    started = time.perf_counter()
+    for _ in range(requests):
+        await app(dict(SCOPE), receive, send)
+
+    return round(requests / (time.perf_counter() - started))
+
+
+async def main(requests: int, rounds: int) -> None:
+    # Вывод логов не должен влиять на сравнение
+    logger.remove()
+
+    results = {"requests": requests}
+    apps = {name: make_app(name) for name in ("none", "base_http", "asgi")}
+    samples = {name: [] for name in apps}
+    for _ in range(rounds):
+        for name, app in apps.items():
+            samples[name].append(await throughput(app, requests))
+
+    for name, rates in samples.items():
+        results[name] = {"rps": max(rates)}
+
+    report(results)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=20_000, help="Число запросов на замер")
+    parser.add_argument("--rounds", type=int, default=3, help="Число чередующихся замеров")
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.rounds))
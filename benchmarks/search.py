@@ -0,0 +1,81 @@
+"""Бенчмарк поиска упражнений по названию.
+
+Проверяет через EXPLAIN ANALYZE, что поисковый запрос читает результаты
+из триграммного GiST индекса ix_exercises_title_trgm в порядке релевантности
+без сортировки совпадений, и замеряет p50/p95/p99:
+
+    python -m benchmarks.search --rows 1000000 --max-p95-ms 10
+
+Завершается с кодом 1, если индекс не используется, план сортирует
+совпадения или p95 не меньше заданного предела (по умолчанию 10 мс:
+цель - единицы миллисекунд на 1M строк).
+"""
+
+import argparse
+import asyncio
+import sys
+
+from database import engine
+from database.engine import LocalAsyncSession
+from database.repository import ExerciseRepository
+
+from .common import TITLE_WORDS, measure, percentiles, plan_sorts, plan_uses_index, report, seed
+
+INDEX_NAME = "ix_exercises_title_trgm"
+
+QUERIES = [*TITLE_WORDS, "Произн", "гласн", "Интонация B", "Чтение Скороговорка"]
+
+
+async def explain(query: str, size: int) -> dict:
+    stmt = ExerciseRepository(None).search_statement(query, limit=size)
+    sql = stmt.compile(dialect=engine.dialect, compile_kwargs={"literal_binds": True})
+    async with engine.connect() as conn:
+        result = await conn.exec_driver_sql(f"EXPLAIN (ANALYZE, FORMAT JSON) {sql}")
+        return result.scalar_one()[0]
+
+
+async def search(query: str, size: int) -> None:
+    async with LocalAsyncSession() as db:
+        await ExerciseRepository(db).search(query, limit=size)
+
+
+async def main(rows: int, repeat: int, size: int, max_p95_ms: float) -> int:
+    await seed(engine, rows)
+
+    plans = {query: await explain(query, size) for query in QUERIES}
+    index_used = {query: plan_uses_index(plan["Plan"], INDEX_NAME) for query, plan in plans.items()}
+    sorted_matches = {query: plan_sorts(plan["Plan"]) for query, plan in plans.items()}
+
+    samples = await measure(lambda query: search(query, size), QUERIES * repeat)
+    latency = percentiles(samples)
+    await engine.dispose()
+
+    report(
+        {
+            "rows": rows,
+            "page_size": size,
+            "index": INDEX_NAME,
+            "index_used": index_used,
+            "sorted_matches": sorted_matches,
+            "execution_ms": {q: plan["Execution Time"] for q, plan in plans.items()},
+            "search": latency,
+            "max_p95_ms": max_p95_ms,
+        }
+    )
+    passed = (
+        all(index_used.values())
+        and not any(sorted_matches.values())
+        and latency["p95"] < max_p95_ms
+    )
+    return 0 if passed else 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Размер таблицы")
+    parser.add_argument("--repeat", type=int, default=100, help="Число повторов каждого запроса")
+    parser.add_argument("--size", type=int, default=50, help="Размер страницы")
+    parser.add_argument("--max-p95-ms", type=float, default=10.0, help="Предел p95 поиска в мс (строго меньше)")
+    args = parser.parse_args()
+
+    sys.exit(asyncio.run(main(args.rows, args.repeat, args.size, args.max_p95_ms)))
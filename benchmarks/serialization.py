@@ -0,0 +1,89 @@
+"""Микробенчмарк сериализации страницы списка упражнений.
+
+Сравнивает пропускную способность стандартного пути (ORM объекты ->
+ExerciseResponse -> повторная валидация PaginatedResponse в FastAPI ->
+json.dumps) и быстрого пути (строки столбцов -> pydantic-core to_json).
+Не требует БД:
+
+    python -m benchmarks.serialization --sizes 50 500 5000
+"""
+
+import argparse
+import json
+import random
+import time
+import uuid
+
+from pydantic import TypeAdapter
+from pydantic_core import to_json
+
+from database.models import Exercise
+from database.types import ExerciseLang, ExerciseTag
+from routers.utils.pagination import PaginatedResponse
+from schemas import ExerciseResponse
+
+from .common import TITLE_WORDS, report
+
+Page = PaginatedResponse[ExerciseResponse]
+page_adapter = TypeAdapter(Page)
+
+
+def make_rows(size: int) -> list[dict]:
+    return [
+        {
+            "id": uuid.uuid4(),
+            "seq_number": number,
+            "title": " ".join(random.sample(TITLE_WORDS, 3)),
+            "difficulty": random.randint(0, 10),
+            "preview_image": None,
+            "lang": random.choice(list(ExerciseLang)),
+            "tags": list(ExerciseTag),
+        }
+        for number in range(1, size + 1)
+    ]
+
+
+def baseline(rows: list[dict]) -> bytes:
+    exercises = [Exercise(**row) for row in rows]
+    items = [ExerciseResponse.model_validate(exercise) for exercise in exercises]
+    page = Page(items=items, page=1, size=len(items))
+    # Так FastAPI обрабатывает возвращаемое значение с аннотацией типа ответа
+    data = page_adapter.dump_python(page_adapter.validate_python(page), mode="json")
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def fast(rows: list[dict]) -> bytes:
+    return Page(items=[], page=1, size=len(rows)).dump_json_with_items(to_json(rows))
+
+
+def throughput(serialize, rows: list[dict], duration: float) -> float:
+    done, started = 0, time.perf_counter()
+    while (elapsed := time.perf_counter() - started) < duration:
+        serialize(rows)
+        done += 1
+
+    return round(done * len(rows) / elapsed)
+
+
+def main(sizes: list[int], duration: float) -> None:
+    results = {}
+    for size in sizes:
+        rows = make_rows(size)
+        assert json.loads(baseline(rows)) == json.loads(fast(rows))
+
+        rates = {
+            "baseline": throughput(baseline, rows, duration),
+            "fast": throughput(fast, rows, duration),
+        }
+        rates["speedup"] = round(rates["fast"] / rates["baseline"], 1)
+        results[f"rows_per_second_{size}"] = rates
+
+    report(results)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[50, 500, 5000])
+    parser.add_argument("--duration", type=float, default=2.0, help="Время замера в секундах")
+    args = parser.parse_args()
+    main(args.sizes, args.duration)
@@ -0,0 +1,116 @@
+"""Бенчмарк листинга упражнений из снимка каталога и из БД.
+
+Заполняет БД синтетическими упражнениями и прогоняет через ASGI приложение
+запросы GET / с разными страницами, фильтрами и сортировками: сначала
+с чтением из БД, затем из снимка каталога в памяти процесса. Выводит RPS,
+p50/p95/p99 каждого режима и время загрузки снимка:
+
+    python -m benchmarks.snapshot --rows 100000 --requests 5000 --concurrency 32
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+from app import service
+from database import engine
+from routers.exercises import catalog_snapshot
+from service_logging import logger
+
+from .common import percentiles, report, seed
+
+SCOPE = {
+    "type": "http",
+    "http_version": "1.1",
+    "method": "GET",
+    "scheme": "http",
+    "path": "/",
+    "raw_path": b"/",
+    "root_path": "",
+    "headers": [],
+    "server": ("benchmark", 80),
+    "client": ("benchmark", 1),
+}
+
+QUERIES = (
+    "size=50&page={page}",
+    "size=50&page={page}&sort=-difficulty",
+    "size=20&page={page}&difficulty_min=3&difficulty_max=6",
+    "size=20&page={page}&tags=TIMIT&sort=difficulty",
+    "size=20&page={page}&title_prefix=%D0%A7%D1%82%D0%B5%D0%BD%D0%B8%D0%B5",
+)
+
+
+async def request(query: str) -> int:
+    status = 0
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await service({**SCOPE, "query_string": query.encode()}, receive, send)
+    return status
+
+
+async def run(requests: int, concurrency: int) -> dict:
+    samples: list[float] = []
+    errors = 0
+    remaining = requests
+
+    async def worker() -> None:
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            query = random.choice(QUERIES).format(page=random.randint(1, 20))
+            started = time.perf_counter()
+            if await request(query) != 200:
+                errors += 1
+
+            samples.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    return {
+        "requests": len(samples),
+        "errors": errors,
+        "rps": round(len(samples) / elapsed, 1),
+        **percentiles(samples),
+    }
+
+
+async def main(args: argparse.Namespace) -> None:
+    # Вывод логов не должен влиять на сравнение
+    logger.remove()
+    await seed(engine, args.rows)
+
+    results = {"rows": args.rows, "requests": args.requests, "concurrency": args.concurrency}
+
+    catalog_snapshot.enabled = False
+    await run(args.concurrency * 10, args.concurrency)
+    results["database"] = await run(args.requests, args.concurrency)
+
+    catalog_snapshot.enabled = True
+    started = time.perf_counter()
+    await catalog_snapshot.refresh()
+    results["snapshot_load_seconds"] = round(time.perf_counter() - started, 3)
+
+    await run(args.concurrency * 10, args.concurrency)
+    results["snapshot"] = await run(args.requests, args.concurrency)
+
+    await engine.dispose()
+    report(results)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000, help="Размер таблицы")
+    parser.add_argument("--requests", type=int, default=5_000, help="Число запросов на режим")
+    parser.add_argument("--concurrency", type=int, default=32, help="Число параллельных клиентов")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,27 @@
+from uuid import UUID
+
+from configs import configs
+
+from .lru import LRUCache
+from .singleflight import SingleFlight
+from .snapshot import CatalogSnapshot, SnapshotStore
+
+# ETag и сериализованные ответы с детальной информацией об упражнениях
+detail_cache: LRUCache[UUID, tuple[str, bytes]] = LRUCache(
+    maxsize=configs.cache.DETAIL_SIZE,
+    ttl=configs.cache.DETAIL_TTL,
+)
+
+# Одновременные чтения одного упражнения и одной страницы списка
+detail_flight: SingleFlight = SingleFlight(enabled=configs.cache.SINGLEFLIGHT_ENABLE)
+list_flight: SingleFlight = SingleFlight(enabled=configs.cache.SINGLEFLIGHT_ENABLE)
+
+__all__ = (
+    "CatalogSnapshot",
+    "LRUCache",
+    "SingleFlight",
+    "SnapshotStore",
+    "detail_cache",
+    "detail_flight",
+    "list_flight",
+)
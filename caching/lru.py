@@ -0,0 +1,110 @@
+import time
+from collections import OrderedDict
+from typing import Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class LRUCache(Generic[K, V]):
+    """Ограниченный по размеру кеш в памяти процесса с вытеснением LRU и TTL.
+
+    Кеш не защищен блокировками и рассчитан на работу в одном event loop.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        """
+        Args:
+            maxsize (int): Максимальное количество записей. 0 отключает кеш.
+            ttl (float): Время жизни записи в секундах.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._epoch = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    @property
+    def epoch(self) -> int:
+        """Номер эпохи кеша, увеличивающийся при каждой инвалидации.
+
+        Запоминается перед чтением из источника и передается в set(), чтобы
+        не сохранить значение, устаревшее за время чтения.
+        """
+        return self._epoch
+
+    def get(self, key: K) -> V | None:
+        """Возвращает значение по ключу или None, если его нет или оно устарело.
+
+        Args:
+            key (K): Ключ записи.
+
+        Returns:
+            V | None: Закешированное значение.
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            self.expirations += 1
+            self.misses += 1
+            return None
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: K, value: V, epoch: int | None = None) -> None:
+        """Сохраняет значение, вытесняя давно не используемые записи.
+
+        Args:
+            key (K): Ключ записи.
+            value (V): Значение.
+            epoch (int | None): Эпоха, в которой было прочитано значение. Если с тех
+                пор кеш инвалидировался, значение не сохраняется.
+        """
+        if self.maxsize <= 0 or (epoch is not None and epoch != self._epoch):
+            return
+
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, key: K) -> None:
+        """Удаляет запись по ключу.
+
+        Args:
+            key (K): Ключ записи.
+        """
+        self._epoch += 1
+        self.invalidations += 1
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Удаляет все записи."""
+        self._epoch += 1
+        self.invalidations += 1
+        self._data.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Возвращает счетчики работы кеша."""
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+        }
@@ -0,0 +1,82 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class SingleFlight(Generic[K, V]):
+    """Объединяет одновременные одинаковые вызовы в один.
+
+    Первый вызов с данным ключом (ведущий) выполняет функцию, а вызовы
+    с тем же ключом, пришедшие до ее завершения, ожидают и получают тот же
+    результат или то же исключение. Результат разделяется между вызывающими,
+    поэтому не должен изменяться после получения.
+
+    Объект не защищен блокировками и рассчитан на работу в одном event loop.
+    """
+
+    def __init__(self, enabled: bool = True) -> None:
+        """
+        Args:
+            enabled (bool): Объединять ли вызовы. Если False, каждый вызов
+                выполняет функцию самостоятельно.
+        """
+        self.enabled = enabled
+        self._calls: dict[K, asyncio.Future[V]] = {}
+
+        self.leaders = 0
+        self.coalesced = 0
+
+    async def do(self, key: K, fn: Callable[[], Awaitable[V]]) -> V:
+        """Выполняет функцию или присоединяется к уже выполняющемуся вызову с тем же ключом.
+
+        Args:
+            key (K): Ключ вызова, однозначно определяющий результат.
+            fn (Callable[[], Awaitable[V]]): Функция, выполняемая ведущим вызовом.
+
+        Returns:
+            V: Результат функции.
+        """
+        if not self.enabled:
+            return await fn()
+
+        call = self._calls.get(key)
+        if call is not None:
+            self.coalesced += 1
+            try:
+                # Отмена ожидающего вызова не должна отменять общий результат
+                return await asyncio.shield(call)
+            except asyncio.CancelledError:
+                if not call.cancelled() or asyncio.current_task().cancelling():
+                    raise
+
+            # Ведущий вызов отменен вместе со своим запросом, вызов повторяется
+            return await self.do(key, fn)
+
+        call = self._calls[key] = asyncio.get_running_loop().create_future()
+        self.leaders += 1
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            call.cancel()
+            raise
+        except BaseException as error:
+            call.set_exception(error)
+            # Исключение считается полученным, даже если ожидающих вызовов не было
+            call.exception()
+            raise
+        else:
+            call.set_result(result)
+            return result
+        finally:
+            del self._calls[key]
+
+    def stats(self) -> dict[str, int]:
+        """Возвращает счетчики ведущих и объединенных вызовов."""
+        return {
+            "in_flight": len(self._calls),
+            "leaders": self.leaders,
+            "coalesced": self.coalesced,
+        }
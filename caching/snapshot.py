@@ -0,0 +1,343 @@
+import asyncio
+import random
+from bisect import bisect_left, bisect_right
+from collections.abc import Awaitable, Callable, Container, Sequence
+from typing import Any
+from uuid import UUID
+
+from pydantic_core import to_json
+from sqlalchemy import Row
+
+from database.repository import SORT_KEYS
+from service_logging import logger
+
+
+class CatalogSnapshot:
+    """Неизменяемый снимок каталога упражнений в памяти процесса.
+
+    Хранит строки списка упражнений, их порядок по каждому ключу сортировки
+    и заранее сериализованный JSON каждой строки, поэтому страница списка
+    собирается из готовых фрагментов без обращения к БД и без сериализации.
+    Снимок не изменяется после создания и заменяется целиком.
+    """
+
+    def __init__(self, version: int, rows: Sequence[Row], max_selections: int = 256) -> None:
+        """
+        Args:
+            version (int): Версия каталога, из которой построен снимок.
+            rows (Sequence[Row]): Строки столбцов схемы списка упражнений.
+            max_selections (int): Количество запоминаемых результатов фильтрации.
+        """
+        self.version = version
+        self.rows = tuple(rows)
+        self.encoded = tuple(to_json(row._asdict()) for row in self.rows)
+        self.max_selections = max_selections
+
+        # Ключ сортировки -> значения ключа каждой строки и номера строк по возрастанию
+        self._keys: dict[str, list[tuple[int, ...]]] = {}
+        self._orders: dict[str, tuple[int, ...]] = {}
+        for sort, columns in SORT_KEYS.items():
+            keys = [tuple(getattr(row, column.key) for column in columns) for row in self.rows]
+            self._keys[sort] = keys
+            self._orders[sort] = tuple(sorted(range(len(keys)), key=keys.__getitem__))
+
+        self._selections: dict[tuple[str, str], tuple[int, ...]] = {}
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def select(
+        self, key: str, predicate: Callable[[Row], bool] | None, sort: str
+    ) -> tuple[int, ...]:
+        """Возвращает номера строк, удовлетворяющих условию, по возрастанию ключа сортировки.
+
+        Результат запоминается по ключу условия, поэтому повторные запросы
+        с теми же фильтрами не просматривают каталог.
+
+        Args:
+            key (str): Ключ, однозначно описывающий условие.
+            predicate (Callable[[Row], bool] | None): Условие отбора строк.
+                None - все строки.
+            sort (str): Поле сортировки из SORT_KEYS, префикс '-' игнорируется.
+
+        Returns:
+            tuple[int, ...]: Номера строк.
+        """
+        sort = sort.lstrip("-")
+        order = self._orders[sort]
+        if predicate is None:
+            return order
+
+        selection = self._selections.get((key, sort))
+        if selection is None:
+            if len(self._selections) >= self.max_selections:
+                self._selections.clear()
+
+            selection = tuple(index for index in order if predicate(self.rows[index]))
+            self._selections[key, sort] = selection
+
+        return selection
+
+    def page(
+        self,
+        selection: Sequence[int],
+        sort: str,
+        limit: int,
+        offset: int = 0,
+        after: Sequence[Any] | None = None,
+        backward: bool = False,
+    ) -> list[int]:
+        """Возвращает номера строк страницы так же, как ExerciseRepository.list_page().
+
+        Args:
+            selection (Sequence[int]): Номера строк, полученные из select().
+            sort (str): Поле сортировки из SORT_KEYS, префикс '-' - по убыванию.
+            limit (int): Количество записей.
+            offset (int): Количество пропускаемых записей.
+            after (Sequence[Any] | None): Значения ключа сортировки, после которых
+                начинается страница (keyset-пагинация).
+            backward (bool): Читать страницу в обратном направлении от after.
+
+        Returns:
+            list[int]: Номера строк в порядке сортировки.
+        """
+        keys = self._keys[sort.lstrip("-")].__getitem__
+        descending = sort.startswith("-") != backward
+
+        start, end = 0, len(selection)
+        if after is not None:
+            if descending:
+                end = bisect_left(selection, tuple(after), key=keys)
+            else:
+                start = bisect_right(selection, tuple(after), key=keys)
+
+        if descending:
+            stop = max(end - offset, start)
+            indices = list(selection[max(stop - limit, start) : stop])
+            indices.reverse()
+        else:
+            first = start + offset
+            indices = list(selection[first : min(first + limit, end)])
+
+        if backward:
+            indices.reverse()
+
+        return indices
+
+    def difficulty_band(self, selection: Sequence[int], low: int, high: int) -> range:
+        """Возвращает позиции строк со сложностью в диапазоне [low, high].
+
+        Args:
+            selection (Sequence[int]): Номера строк, полученные из select()
+                с сортировкой по сложности.
+            low (int): Минимальная сложность.
+            high (int): Максимальная сложность.
+
+        Returns:
+            range: Позиции в selection.
+        """
+        keys = self._keys["difficulty"].__getitem__
+        start = bisect_left(selection, (low,), key=keys)
+        return range(start, bisect_left(selection, (high + 1,), key=keys, lo=start))
+
+    def pick_random(
+        self,
+        selection: Sequence[int],
+        low: int,
+        high: int,
+        exclude: Container[UUID] = (),
+        attempts: int = 8,
+    ) -> int | None:
+        """Возвращает номер случайной строки со сложностью в диапазоне [low, high].
+
+        Строка выбирается равновероятно из диапазона, найденного бинарным
+        поиском. Исключенные строки отбрасываются повторным выбором, а если
+        несколько попыток подряд неудачны, выбор делается из всех допустимых.
+
+        Args:
+            selection (Sequence[int]): Номера строк, полученные из select()
+                с сортировкой по сложности.
+            low (int): Минимальная сложность.
+            high (int): Максимальная сложность.
+            exclude (Container[UUID]): Идентификаторы исключаемых упражнений.
+            attempts (int): Количество попыток случайного выбора.
+
+        Returns:
+            int | None: Номер строки или None, если подходящих строк нет.
+        """
+        band = self.difficulty_band(selection, low, high)
+        if not band:
+            return None
+
+        for _ in range(attempts):
+            index = selection[random.choice(band)]
+            if self.rows[index].id not in exclude:
+                return index
+
+        allowed = [selection[i] for i in band if self.rows[selection[i]].id not in exclude]
+        return random.choice(allowed) if allowed else None
+
+    def pick_next(
+        self,
+        selection: Sequence[int],
+        low: int,
+        high: int,
+        after: int = 0,
+        exclude: Container[UUID] = (),
+    ) -> int | None:
+        """Возвращает номер строки с наименьшим seq_number больше after и сложностью в [low, high].
+
+        Внутри одной сложности строки упорядочены по seq_number, поэтому
+        для каждой сложности диапазона выполняется один бинарный поиск.
+
+        Args:
+            selection (Sequence[int]): Номера строк, полученные из select()
+                с сортировкой по сложности.
+            low (int): Минимальная сложность.
+            high (int): Максимальная сложность.
+            after (int): Номер упражнения, после которого ищется следующее.
+            exclude (Container[UUID]): Идентификаторы исключаемых упражнений.
+
+        Returns:
+            int | None: Номер строки или None, если подходящих строк нет.
+        """
+        keys = self._keys["difficulty"].__getitem__
+        band = self.difficulty_band(selection, low, high)
+        found = None
+        for difficulty in range(low, high + 1):
+            position = bisect_right(
+                selection, (difficulty, after), key=keys, lo=band.start, hi=band.stop
+            )
+            while position < band.stop and keys(selection[position])[0] == difficulty:
+                index = selection[position]
+                if self.rows[index].id not in exclude:
+                    if found is None or self.rows[index].seq_number < self.rows[found].seq_number:
+                        found = index
+                    break
+
+                position += 1
+
+        return found
+
+    def dump_json(self, indices: Sequence[int]) -> bytes:
+        """Возвращает JSON массив заранее сериализованных строк.
+
+        Args:
+            indices (Sequence[int]): Номера строк.
+
+        Returns:
+            bytes: JSON массив.
+        """
+        return b"[" + b",".join([self.encoded[index] for index in indices]) + b"]"
+
+
+class SnapshotStore:
+    """Хранит актуальный снимок каталога и заменяет его при изменениях.
+
+    Снимок загружается при запуске и перезагружается фоновой задачей
+    по событию изменения каталога или по истечении интервала обновления.
+    Новый снимок подменяет старый одним присваиванием. Пока снимок отстает
+    от известных изменений, get() возвращает None и чтения выполняются из БД.
+    """
+
+    def __init__(
+        self,
+        load: Callable[[], Awaitable[CatalogSnapshot]],
+        interval: float,
+        enabled: bool = True,
+    ) -> None:
+        """
+        Args:
+            load (Callable[[], Awaitable[CatalogSnapshot]]): Загрузчик снимка из БД.
+            interval (float): Период обновления снимка в секундах.
+            enabled (bool): Использовать ли снимок.
+        """
+        self.load = load
+        self.interval = interval
+        self.enabled = enabled
+        self._snapshot: CatalogSnapshot | None = None
+        # Номер последнего известного изменения и изменения, учтенного в снимке
+        self._generation = 0
+        self._loaded_generation = -1
+        self._changed = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+        self.hits = 0
+        self.misses = 0
+        self.loads = 0
+        self.failures = 0
+
+    def get(self) -> CatalogSnapshot | None:
+        """Возвращает снимок, если он учитывает все известные изменения каталога."""
+        if not self.enabled:
+            return None
+
+        if self._snapshot is None or self._loaded_generation != self._generation:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return self._snapshot
+
+    def invalidate(self) -> None:
+        """Помечает снимок устаревшим и запрашивает его перезагрузку."""
+        self._generation += 1
+        self._changed.set()
+
+    async def refresh(self) -> None:
+        """Загружает новый снимок и подменяет им текущий."""
+        generation = self._generation
+        snapshot = await self.load()
+        self._snapshot, self._loaded_generation = snapshot, generation
+        self.loads += 1
+        logger.info(f"Catalog snapshot loaded: {len(snapshot)} exercises, v{snapshot.version}.")
+
+    async def start(self) -> None:
+        """Загружает первый снимок и запускает фоновое обновление."""
+        if not self.enabled or self._task is not None:
+            return
+
+        try:
+            await self.refresh()
+        except Exception as error:
+            # Сервис запускается и читает из БД, пока снимок не загрузится
+            self.failures += 1
+            logger.error(f"Catalog snapshot load failed: {error}")
+
+        self._task = asyncio.create_task(self._run(), name="catalog-snapshot-refresh")
+
+    async def stop(self) -> None:
+        """Останавливает фоновое обновление."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+            self._task = None
+
+    def stats(self) -> dict[str, int]:
+        """Возвращает счетчики использования и загрузок снимка."""
+        return {
+            "size": len(self._snapshot) if self._snapshot is not None else 0,
+            "version": self._snapshot.version if self._snapshot is not None else 0,
+            "hits": self.hits,
+            "misses": self.misses,
+            "loads": self.loads,
+            "failures": self.failures,
+        }
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._changed.wait(), timeout=self.interval)
+            except asyncio.TimeoutError:
+                pass
+
+            self._changed.clear()
+            try:
+                await self.refresh()
+            except Exception as error:
+                self.failures += 1
+                logger.error(f"Catalog snapshot refresh failed: {error}")
@@ -1,7 +1,14 @@
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from .bulk import BulkConfiguration
+from .cache import CacheConfiguration
 from .database import DatabaseConfiguration
 from .graylog import GraylogConfiguration
+from .health import HealthConfiguration
+from .http import HTTPConfiguration
+from .logging import LoggingConfiguration
+from .pagination import PaginationConfiguration
+from .server import ServerConfiguration
 
 
 class ProjectConfiguration(BaseSettings):
@@ -10,9 +17,16 @@ class ProjectConfiguration(BaseSettings):
     # * Вложенные группы настроек
     database: DatabaseConfiguration = DatabaseConfiguration()
     graylog: GraylogConfiguration = GraylogConfiguration()
+    pagination: PaginationConfiguration = PaginationConfiguration()
+    bulk: BulkConfiguration = BulkConfiguration()
+    cache: CacheConfiguration = CacheConfiguration()
+    http: HTTPConfiguration = HTTPConfiguration()
+    logging: LoggingConfiguration = LoggingConfiguration()
+    server: ServerConfiguration = ServerConfiguration()
+    health: HealthConfiguration = HealthConfiguration()
 
     # * Опциональные переменные
-    DEBUG_MODE: bool = True
+    DEBUG_MODE: bool = False
     SERVICE_NAME: str = "ilps-service-exercises"
 
 
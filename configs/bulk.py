@@ -0,0 +1,11 @@
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class BulkConfiguration(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="EXERCISES_BULK_")
+
+    # * Опциональные переменные
+    BATCH_SIZE: int = 1000
+    MAX_ITEMS: int = 100_000
+    MAX_ITEM_SIZE: int = 65_536
+    EXPORT_BATCH_SIZE: int = 1000
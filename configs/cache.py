@@ -0,0 +1,13 @@
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class CacheConfiguration(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="EXERCISES_CACHE_")
+
+    # * Опциональные переменные
+    DETAIL_SIZE: int = 1024
+    DETAIL_TTL: float = 30.0
+    NOTIFY_ENABLE: bool = True
+    SINGLEFLIGHT_ENABLE: bool = True
+    SNAPSHOT_ENABLE: bool = False
+    SNAPSHOT_REFRESH_INTERVAL: float = 60.0
@@ -13,6 +13,19 @@ class DatabaseConfiguration(BaseSettings):
     POSTGRES_NAME: str = "exercises"
     POSTGRES_PORT: int = 5432
 
+    POOL_SIZE: int = 10
+    POOL_MAX_OVERFLOW: int = 10
+    POOL_TIMEOUT: float = 30.0
+    POOL_RECYCLE: int = 1800
+    POOL_PING_IDLE: float = 30.0
+    STATEMENT_CACHE_SIZE: int = 100
+    ECHO: bool = False
+    QUERY_COMMENTS: bool = False
+
+    REPLICA_HOSTS: list[str] = []
+    REPLICA_COOLDOWN: float = 30.0
+    READ_AFTER_WRITE_WINDOW: float = 5.0
+
     @property
     def URL(self) -> str:
         return "postgresql+asyncpg://{user}:{password}@{host}:{port}/{db_name}".format(
@@ -22,3 +35,30 @@ class DatabaseConfiguration(BaseSettings):
             port=self.POSTGRES_PORT,
             db_name=self.POSTGRES_NAME,
         )
+
+    @property
+    def REPLICA_URLS(self) -> list[str]:
+        urls = []
+        for replica in self.REPLICA_HOSTS:
+            host, _, port = replica.partition(":")
+            urls.append(
+                "postgresql+asyncpg://{user}:{password}@{host}:{port}/{db_name}".format(
+                    user=self.POSTGRES_USER,
+                    password=self.POSTGRES_PASSWORD,
+                    host=host,
+                    port=port or self.POSTGRES_PORT,
+                    db_name=self.POSTGRES_NAME,
+                )
+            )
+
+        return urls
+
+    @property
+    def DSN(self) -> str:
+        return "postgresql://{user}:{password}@{host}:{port}/{db_name}".format(
+            user=self.POSTGRES_USER,
+            password=self.POSTGRES_PASSWORD,
+            host=self.POSTGRES_HOST,
+            port=self.POSTGRES_PORT,
+            db_name=self.POSTGRES_NAME,
+        )
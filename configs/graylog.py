@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -8,3 +10,5 @@ class GraylogConfiguration(BaseSettings):
     HOST: str = "localhost"
     PORT: int = 12201
     ENABLE: bool = False
+    PROTOCOL: Literal["udp", "tcp"] = "udp"
+    CHUNK_SIZE: int = 1420
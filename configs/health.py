@@ -0,0 +1,10 @@
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class HealthConfiguration(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="EXERCISES_HEALTH_")
+
+    # * Опциональные переменные
+    CHECK_INTERVAL: float = 5.0
+    CHECK_TIMEOUT: float = 2.0
+    MAX_POOL_UTILIZATION: float = 1.0
@@ -0,0 +1,9 @@
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class HTTPConfiguration(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="EXERCISES_HTTP_")
+
+    # * Опциональные переменные
+    CACHE_MAX_AGE: int = 0
+    FAST_JSON: bool = False
@@ -0,0 +1,16 @@
+from typing import Literal
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class LoggingConfiguration(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="EXERCISES_LOG_")
+
+    # * Опциональные переменные
+    LEVEL: str = "DEBUG"
+    FORMAT: Literal["text", "json"] = "text"
+    DIAGNOSE: bool = True
+    QUEUE_ENABLE: bool = False
+    QUEUE_SIZE: int = 10_000
+    BATCH_SIZE: int = 256
+    FLUSH_INTERVAL: float = 0.5
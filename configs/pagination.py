@@ -0,0 +1,11 @@
+from typing import Literal
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class PaginationConfiguration(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="EXERCISES_PAGINATION_")
+
+    # * Опциональные переменные
+    COUNT_STRATEGY: Literal["exact", "cached", "estimate"] = "cached"
+    COUNT_CACHE_TTL: float = 5.0
@@ -0,0 +1,53 @@
+import math
+import os
+from pathlib import Path
+from typing import Literal
+
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+# Квота CPU контейнера в cgroup v2: "<квота> <период>" или "max <период>"
+CGROUP_CPU_MAX = Path("/sys/fs/cgroup/cpu.max")
+
+
+def available_cpus(cpu_max: Path = CGROUP_CPU_MAX) -> int:
+    """Возвращает количество CPU, доступных процессу.
+
+    Учитывает привязку процесса к ядрам и квоту CPU контейнера, поэтому
+    в контейнере с ограничением CPU не возвращает число ядер хоста.
+
+    Args:
+        cpu_max (Path): Файл квоты CPU cgroup v2.
+
+    Returns:
+        int: Количество CPU, не меньше 1.
+    """
+    if hasattr(os, "sched_getaffinity"):
+        cpus = len(os.sched_getaffinity(0))
+    else:
+        cpus = os.cpu_count() or 1
+
+    try:
+        quota, period = cpu_max.read_text().split()
+        if quota != "max":
+            cpus = min(cpus, math.ceil(int(quota) / int(period)))
+    except (OSError, ValueError):
+        pass
+
+    return max(cpus, 1)
+
+
+class ServerConfiguration(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="EXERCISES_SERVER_")
+
+    # * Опциональные переменные
+    HOST: str = "0.0.0.0"
+    PORT: int = 8068
+    WORKERS: int = Field(default_factory=available_cpus, ge=1)
+    LOOP: Literal["auto", "asyncio", "uvloop"] = "auto"
+    HTTP: Literal["auto", "h11", "httptools"] = "auto"
+    BACKLOG: int = 2048
+    KEEP_ALIVE_TIMEOUT: int = 65
+    LIMIT_MAX_REQUESTS: int = 0
+    LIMIT_MAX_REQUESTS_JITTER: int = Field(default=0, ge=0)
+    GRACEFUL_SHUTDOWN_TIMEOUT: int = 30
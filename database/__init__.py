@@ -1,3 +1,21 @@
-from .engine import BaseORM, disconnect_db, engine, get_db
+from .engine import (
+    BaseORM,
+    LocalAsyncSession,
+    disconnect_db,
+    engine,
+    get_db,
+    get_read_db,
+    replicas,
+)
+from .health import readiness
 
-__all__ = ("BaseORM", "disconnect_db", "engine", "get_db")
+__all__ = (
+    "BaseORM",
+    "LocalAsyncSession",
+    "disconnect_db",
+    "engine",
+    "get_db",
+    "get_read_db",
+    "readiness",
+    "replicas",
+)
@@ -0,0 +1,27 @@
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from service_logging.context import request_id
+
+
+def comment_queries(engine: AsyncEngine) -> None:
+    """Дописывает к SQL запросам движка комментарий с идентификатором запроса.
+
+    Комментарий в формате sqlcommenter (/*request_id='...'*/) позволяет
+    найти запрос сервиса в pg_stat_activity и логах PostgreSQL.
+
+    Текст запроса становится уникальным для каждого HTTP запроса, поэтому
+    подготовленные выражения перестают переиспользоваться между запросами.
+
+    Args:
+        engine (AsyncEngine): Движок БД.
+    """
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute", retval=True)
+    def add_comment(_conn, _cursor, statement, parameters, _context, _executemany):
+        value = request_id.get()
+        if value is not None:
+            # Значение проверено RequestIDMiddleware и не содержит кавычек и '*/'
+            statement = f"{statement} /*request_id='{value}'*/"
+
+        return statement, parameters
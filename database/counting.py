@@ -0,0 +1,105 @@
+import time
+from enum import Enum
+
+from sqlalchemy import Select, func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .engine import BaseORM
+
+
+class CountStrategy(str, Enum):
+    """Способ, которым было получено общее количество записей."""
+
+    EXACT = "exact"
+    CACHED = "cached"
+    ESTIMATE = "estimate"
+    SKIPPED = "skipped"
+
+
+class CountProvider:
+    """Поставщик общего количества записей таблицы для пагинации.
+
+    Точный подсчет требует полного прохода по таблице, поэтому поставщик
+    умеет кешировать результат в памяти процесса на время TTL или
+    использовать оценку планировщика PostgreSQL из pg_class.reltuples.
+    """
+
+    def __init__(
+        self, model: type[BaseORM], strategy: str, ttl: float, max_entries: int = 256
+    ) -> None:
+        """
+        Args:
+            model (type[BaseORM]): ORM модель, записи которой подсчитываются.
+            strategy (str): Стратегия подсчета: exact, cached или estimate.
+            ttl (float): Время жизни закешированного значения в секундах.
+            max_entries (int): Количество запоминаемых значений. Ключом служит
+                набор фильтров из запроса, поэтому кеш ограничивается.
+        """
+        self.model = model
+        self.strategy = CountStrategy(strategy)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._cache: dict[str, tuple[float, int]] = {}
+
+    def invalidate(self) -> None:
+        """Сбрасывает все закешированные значения."""
+        self._cache.clear()
+
+    async def count(
+        self,
+        db: AsyncSession,
+        key: str = "",
+        stmt: Select | None = None,
+    ) -> tuple[int, CountStrategy]:
+        """Возвращает количество записей согласно настроенной стратегии.
+
+        Оценка планировщика применима только к таблице целиком, поэтому для
+        запроса с условиями (stmt) она заменяется кешированным подсчетом.
+
+        Args:
+            db (AsyncSession): Асинхронная сессия работы с БД.
+            key (str): Ключ кеша, однозначно описывающий запрос.
+            stmt (Select | None): Запрос подсчета. По умолчанию - вся таблица.
+
+        Returns:
+            tuple[int, CountStrategy]: Количество записей и способ его получения.
+        """
+        if self.strategy is CountStrategy.ESTIMATE and stmt is None:
+            estimate = await self._estimate(db)
+            # reltuples равен -1, если таблица ещё ни разу не анализировалась
+            if estimate >= 0:
+                return estimate, CountStrategy.ESTIMATE
+
+        if stmt is None:
+            stmt = select(func.count()).select_from(self.model)
+
+        if self.strategy is CountStrategy.EXACT:
+            return await self._exact(db, stmt), CountStrategy.EXACT
+
+        now = time.monotonic()
+        cached = self._cache.get(key)
+        if cached is not None and cached[0] > now:
+            return cached[1], CountStrategy.CACHED
+
+        total = await self._exact(db, stmt)
+        if key not in self._cache and len(self._cache) >= self.max_entries:
+            self._prune(now)
+
+        self._cache[key] = (now + self.ttl, total)
+        return total, CountStrategy.EXACT
+
+    def _prune(self, now: float) -> None:
+        self._cache = {key: entry for key, entry in self._cache.items() if entry[0] > now}
+        # Все значения актуальны - освобождается место под новые фильтры
+        if len(self._cache) >= self.max_entries:
+            self._cache.clear()
+
+    async def _exact(self, db: AsyncSession, stmt: Select) -> int:
+        result = await db.execute(stmt)
+        return result.scalar_one()
+
+    async def _estimate(self, db: AsyncSession) -> int:
+        stmt = text("SELECT reltuples::bigint FROM pg_class WHERE oid = CAST(:table AS regclass)")
+        result = await db.execute(stmt, {"table": self.model.__tablename__})
+        estimate = result.scalar_one_or_none()
+        return -1 if estimate is None else estimate
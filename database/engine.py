@@ -2,12 +2,41 @@ from sqlalchemy.ext.asyncio import AsyncAttrs, AsyncEngine, AsyncSession, create
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
 
 from configs import configs
+from metrics.database import observe_queries
 
-engine: AsyncEngine = create_async_engine(
-    configs.database.URL,
-    echo=configs.DEBUG_MODE,
-    pool_pre_ping=True,
-)
+from .comments import comment_queries
+from .pool import InstrumentedPool, ping_idle_connections
+from .replicas import ReplicaSet
+
+
+def _create_engine(url: str) -> AsyncEngine:
+    """Создает движок БД с настроенным и инструментированным пулом соединений."""
+    engine = create_async_engine(
+        url,
+        echo=configs.database.ECHO,
+        poolclass=InstrumentedPool,
+        pool_size=configs.database.POOL_SIZE,
+        max_overflow=configs.database.POOL_MAX_OVERFLOW,
+        pool_timeout=configs.database.POOL_TIMEOUT,
+        pool_recycle=configs.database.POOL_RECYCLE,
+        connect_args={
+            # Кеш подготовленных выражений SQLAlchemy и собственный кеш asyncpg.
+            # Для работы через PgBouncer в режиме transaction оба отключаются (0)
+            "prepared_statement_cache_size": configs.database.STATEMENT_CACHE_SIZE,
+            "statement_cache_size": configs.database.STATEMENT_CACHE_SIZE,
+        },
+    )
+    ping_idle_connections(
+        engine.pool, engine.dialect.do_ping, idle_threshold=configs.database.POOL_PING_IDLE
+    )
+    observe_queries(engine)
+    if configs.database.QUERY_COMMENTS:
+        comment_queries(engine)
+
+    return engine
+
+
+engine: AsyncEngine = _create_engine(configs.database.URL)
 
 LocalAsyncSession: AsyncSession = sessionmaker(
     bind=engine,
@@ -17,6 +46,13 @@ LocalAsyncSession: AsyncSession = sessionmaker(
     autocommit=False,
 )
 
+replicas = ReplicaSet(
+    [_create_engine(url) for url in configs.database.REPLICA_URLS],
+    primary=LocalAsyncSession,
+    cooldown=configs.database.REPLICA_COOLDOWN,
+    sticky_window=configs.database.READ_AFTER_WRITE_WINDOW,
+)
+
 
 class BaseORM(AsyncAttrs, DeclarativeBase):
     """Базовый класс модели ORM.
@@ -29,6 +65,7 @@ class BaseORM(AsyncAttrs, DeclarativeBase):
 
 async def disconnect_db():
     """Закрывает подключение к БД, освобождает ресурсы."""
+    await replicas.dispose()
     await engine.dispose()
 
 
@@ -41,3 +78,14 @@ async def get_db():
     """
     async with LocalAsyncSession() as session:
         yield session
+
+
+async def get_read_db():
+    """Функция возвращает асинхронную сессию только для чтения,
+    открытую на одной из реплик или на основном сервере БД.
+
+    Yields:
+        AsyncSession: Асинхронная сессия работы с БД.
+    """
+    async with replicas.session() as session:
+        yield session
@@ -0,0 +1,142 @@
+import asyncio
+import datetime
+from pathlib import Path
+
+from alembic.script import ScriptDirectory
+from pydantic_core import to_json
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from configs import configs
+from service_logging import logger
+
+from .engine import engine
+
+# Каталог миграций Alembic в корне проекта
+MIGRATIONS = Path(__file__).resolve().parent.parent / "migrations"
+
+
+class ReadinessChecker:
+    """Периодически проверяет готовность сервиса принимать запросы.
+
+    Проверка выполняется фоновой задачей с заданным интервалом, а ее результат
+    хранится уже сериализованным, поэтому частые запросы проб оркестратора
+    не создают нагрузки на БД. Сервис готов, если БД отвечает, пул соединений
+    не исчерпан и схема БД соответствует последней миграции кода.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        migrations: Path,
+        interval: float,
+        timeout: float,
+        max_utilization: float,
+    ) -> None:
+        """
+        Args:
+            engine (AsyncEngine): Движок основного сервера БД.
+            migrations (Path): Каталог миграций Alembic.
+            interval (float): Период проверки в секундах.
+            timeout (float): Максимальное время получения ответа БД в секундах.
+            max_utilization (float): Доля занятых соединений пула, начиная с которой
+                сервис считается неготовым.
+        """
+        self.engine = engine
+        self.migrations = migrations
+        self.interval = interval
+        self.timeout = timeout
+        self.max_utilization = max_utilization
+        self._heads: list[str] | None = None
+        self._task: asyncio.Task | None = None
+
+        self.ready = False
+        self.content = to_json({"status": "starting"})
+
+    @property
+    def heads(self) -> list[str]:
+        """Головные ревизии миграций, с которыми работает текущий код."""
+        if self._heads is None:
+            self._heads = sorted(ScriptDirectory(str(self.migrations)).get_heads())
+
+        return self._heads
+
+    async def check(self) -> None:
+        """Выполняет проверку и сохраняет ее результат."""
+        # Состояние пула снимается до того, как проверка займет соединение
+        pool = self.engine.pool.snapshot()
+        database: dict = {"reachable": False}
+        revisions: list[str] = []
+        try:
+            async with asyncio.timeout(self.timeout):
+                async with self.engine.connect() as connection:
+                    result = await connection.execute(text("SELECT version_num FROM alembic_version"))
+                    revisions = sorted(result.scalars().all())
+
+            database["reachable"] = True
+
+        except Exception as error:
+            database["error"] = str(error) or type(error).__name__
+
+        saturated = pool["utilization"] >= self.max_utilization
+        migrated = revisions == self.heads
+        ready = database["reachable"] and not saturated and migrated
+
+        checks = {
+            "database": database,
+            "pool": {
+                "utilization": pool["utilization"],
+                "checked_out": pool["checked_out"],
+                "timeouts": pool["timeouts"],
+                "saturated": saturated,
+            },
+            "migrations": {"expected": self.heads, "current": revisions, "up_to_date": migrated},
+        }
+        if ready != self.ready:
+            if ready:
+                logger.info("Service is ready.")
+            else:
+                logger.warning(f"Service is not ready: {checks}")
+
+        self.ready = ready
+        self.content = to_json(
+            {
+                "status": "ready" if ready else "not_ready",
+                "checks": checks,
+                "checked_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            }
+        )
+
+    async def start(self) -> None:
+        """Запускает фоновую проверку готовности."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="readiness-check")
+
+    async def stop(self) -> None:
+        """Останавливает фоновую проверку готовности."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.check()
+            except Exception as error:
+                logger.error(f"Readiness check failed: {error}")
+
+            await asyncio.sleep(self.interval)
+
+
+readiness = ReadinessChecker(
+    engine,
+    MIGRATIONS,
+    interval=configs.health.CHECK_INTERVAL,
+    timeout=configs.health.CHECK_TIMEOUT,
+    max_utilization=configs.health.MAX_POOL_UTILIZATION,
+)
@@ -1,19 +1,22 @@
 import uuid
 
-from sqlalchemy import ARRAY, CheckConstraint, Column, Enum, Integer, String
+from sqlalchemy import ARRAY, BigInteger, CheckConstraint, Column, Enum, Index, Integer, String
 from sqlalchemy.dialects.postgresql import UUID
 
 from .engine import BaseORM
 from .types import ExerciseLang, ExerciseTag
 
+# Количество строк счетчика версии каталога (см. ExerciseCatalog)
+CATALOG_SHARDS = 64
+
 
 class Exercise(BaseORM):
     """ORM модель для описания обучающего упражнения."""
 
     __tablename__ = "exercises"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    seq_number = Column(Integer, primary_key=True, autoincrement=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True, unique=True)
+    seq_number = Column(Integer, primary_key=True, autoincrement=True, index=True, unique=True)
     difficulty = Column(Integer, nullable=False, default=0)
     title = Column(String(50), nullable=False, default="Обычное упражнение")
     preview_image = Column(String(500), nullable=True, default=None)
@@ -21,8 +24,42 @@ class Exercise(BaseORM):
     text_id = Column(UUID(as_uuid=True), nullable=False)
     lang = Column(Enum(ExerciseLang), nullable=False, default=ExerciseLang.ENGLISH)
     tags = Column(ARRAY(Enum(ExerciseTag)), nullable=False, default=[])
+    version = Column(Integer, nullable=False, default=1, server_default="1")
 
     __table_args__ = (
         CheckConstraint(difficulty >= 0, name="check_difficulty_non_neg"),
         CheckConstraint(seq_number > 0, name="check_seq_number_natural"),
+        Index("ix_exercises_tags", tags, postgresql_using="gin"),
+        Index("ix_exercises_lang_difficulty_seq_number", lang, difficulty, seq_number),
+        Index("ix_exercises_difficulty_seq_number", difficulty, seq_number),
+        Index("ix_exercises_title_prefix", title, postgresql_ops={"title": "text_pattern_ops"}),
+        Index(
+            "ix_exercises_title_trgm",
+            title,
+            postgresql_using="gist",
+            postgresql_ops={"title": "gist_trgm_ops"},
+        ),
+    )
+
+    # Упражнение однозначно определяется своим id, поэтому identity map и
+    # session.get() работают по нему, а не по составному первичному ключу таблицы.
+    __mapper_args__ = {"primary_key": [id]}
+
+
+class ExerciseCatalog(BaseORM):
+    """ORM модель версии каталога упражнений.
+
+    Версия каталога - сумма версий строк таблицы. Триггер увеличивает версию
+    строки с номером pg_backend_pid() % CATALOG_SHARDS при любом изменении
+    таблицы exercises, поэтому изменения из разных соединений не ожидают
+    друг друга на блокировке одной строки.
+    """
+
+    __tablename__ = "exercises_catalog"
+
+    id = Column(Integer, primary_key=True, default=0)
+    version = Column(BigInteger, nullable=False, default=1, server_default="1")
+
+    __table_args__ = (
+        CheckConstraint((id >= 0) & (id < CATALOG_SHARDS), name="check_catalog_shard"),
     )
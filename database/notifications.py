@@ -0,0 +1,141 @@
+import asyncio
+from collections.abc import Callable
+from typing import Literal
+from uuid import UUID
+
+import asyncpg
+from pydantic import BaseModel, ValidationError
+
+from configs import configs
+from service_logging import logger
+
+# Канал, в который триггеры таблицы exercises публикуют изменения (см. миграции)
+CHANNEL = "exercises_changes"
+
+
+class ExerciseChange(BaseModel):
+    """Событие изменения каталога упражнений.
+
+    Событие reset означает, что часть событий могла быть пропущена,
+    и локальные кеши необходимо сбросить целиком.
+    """
+
+    op: Literal["insert", "update", "delete", "reset"]
+    id: UUID | None = None
+
+
+ChangeHandler = Callable[[ExerciseChange], None]
+
+
+class ChangeNotifier:
+    """Распространяет события изменения упражнений между репликами сервиса.
+
+    События публикуются в PostgreSQL триггерами таблицы exercises через
+    NOTIFY и доставляются только после фиксации транзакции. Фоновый
+    слушатель получает их по LISTEN и передает подписчикам, которые
+    сбрасывают локальные кеши.
+    """
+
+    def __init__(self, dsn: str, channel: str = CHANNEL, ping_interval: float = 30.0) -> None:
+        """
+        Args:
+            dsn (str): Адрес подключения к PostgreSQL в формате libpq.
+            channel (str): Имя канала LISTEN/NOTIFY.
+            ping_interval (float): Период проверки соединения слушателя в секундах.
+        """
+        self.dsn = dsn
+        self.channel = channel
+        self.ping_interval = ping_interval
+        self._handlers: list[ChangeHandler] = []
+        self._task: asyncio.Task | None = None
+
+    def subscribe(self, handler: ChangeHandler) -> ChangeHandler:
+        """Регистрирует обработчик событий. Может использоваться как декоратор.
+
+        Args:
+            handler (ChangeHandler): Синхронный обработчик события.
+
+        Returns:
+            ChangeHandler: Тот же обработчик.
+        """
+        self._handlers.append(handler)
+        return handler
+
+    def dispatch(self, change: ExerciseChange) -> None:
+        """Передает событие всем подписчикам текущего процесса.
+
+        Вызывается обработчиками записи сразу после фиксации транзакции,
+        не дожидаясь доставки уведомления через PostgreSQL.
+
+        Args:
+            change (ExerciseChange): Событие изменения.
+        """
+        for handler in self._handlers:
+            try:
+                handler(change)
+            except Exception as error:
+                logger.error(f"Change handler failed: {error}")
+
+    async def start(self) -> None:
+        """Запускает фоновый слушатель уведомлений."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._listen(), name="exercises-change-listener")
+
+    async def stop(self) -> None:
+        """Останавливает фоновый слушатель уведомлений."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+            self._task = None
+
+    async def _listen(self) -> None:
+        delay = 1.0
+        while True:
+            connection = None
+            try:
+                connection = await asyncpg.connect(self.dsn)
+                terminated = asyncio.Event()
+                connection.add_termination_listener(lambda _: terminated.set())
+                await connection.add_listener(self.channel, self._on_notification)
+                logger.info(f"Listening for exercise changes on '{self.channel}'.")
+
+                # Пока слушатель был отключен, события могли быть потеряны
+                self.dispatch(ExerciseChange(op="reset"))
+                delay = 1.0
+
+                while not terminated.is_set():
+                    try:
+                        await asyncio.wait_for(terminated.wait(), timeout=self.ping_interval)
+                    except asyncio.TimeoutError:
+                        await connection.fetchval("SELECT 1", timeout=self.ping_interval)
+
+                logger.warning("Change listener connection terminated.")
+
+            except asyncio.CancelledError:
+                raise
+
+            except Exception as error:
+                logger.error(f"Change listener failed: {error}. Retrying in {delay:.0f}s...")
+
+            finally:
+                if connection is not None and not connection.is_closed():
+                    connection.terminate()
+
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 30.0)
+
+    def _on_notification(self, _connection, _pid: int, _channel: str, payload: str) -> None:
+        try:
+            change = ExerciseChange.model_validate_json(payload)
+        except ValidationError as error:
+            logger.error(f"Malformed change notification: {error}")
+            return
+
+        self.dispatch(change)
+
+
+notifier = ChangeNotifier(configs.database.DSN)
@@ -0,0 +1,119 @@
+import time
+from collections.abc import Callable
+from typing import Any
+
+from sqlalchemy import event, exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, PoolProxiedConnection
+
+from service_logging import logger
+
+
+class PoolStats:
+    """Счетчики выдачи соединений из пула."""
+
+    def __init__(self) -> None:
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_seconds = 0.0
+        self.wait_max_seconds = 0.0
+        self.pings = 0
+        self.ping_failures = 0
+
+    def record_wait(self, seconds: float) -> None:
+        """Учитывает время ожидания выдачи соединения.
+
+        Args:
+            seconds (float): Время ожидания в секундах.
+        """
+        self.checkouts += 1
+        self.wait_seconds += seconds
+        self.wait_max_seconds = max(self.wait_max_seconds, seconds)
+
+
+# Счетчики общие для всех пулов процесса и не сбрасываются при пересоздании
+# пула (engine.dispose), поэтому остаются монотонными
+pool_stats = PoolStats()
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """Пул соединений, замеряющий время ожидания выдачи соединения.
+
+    Время включает ожидание свободного соединения, открытие нового
+    соединения и проверку его живости при выдаче.
+    """
+
+    def connect(self) -> PoolProxiedConnection:
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            pool_stats.timeouts += 1
+            raise
+
+        pool_stats.record_wait(time.perf_counter() - started)
+        return connection
+
+    def snapshot(self) -> dict[str, int | float]:
+        """Возвращает текущее состояние пула и счетчики выдачи соединений.
+
+        Returns:
+            dict[str, int | float]: Состояние и счетчики пула.
+        """
+        capacity = self.size() + max(self._max_overflow, 0)
+        checked_out = self.checkedout()
+        return {
+            "size": self.size(),
+            "max_overflow": self._max_overflow,
+            "checked_in": self.checkedin(),
+            "checked_out": checked_out,
+            "overflow": max(self.overflow(), 0),
+            "utilization": round(checked_out / capacity, 3) if capacity else 0.0,
+            "checkouts": pool_stats.checkouts,
+            "timeouts": pool_stats.timeouts,
+            "wait_seconds_total": round(pool_stats.wait_seconds, 6),
+            "wait_seconds_max": round(pool_stats.wait_max_seconds, 6),
+            "pings": pool_stats.pings,
+            "ping_failures": pool_stats.ping_failures,
+        }
+
+
+def ping_idle_connections(
+    pool: Pool, ping: Callable[[Any], bool], idle_threshold: float
+) -> None:
+    """Включает проверку живости соединений, простаивавших в пуле дольше порога.
+
+    В отличие от pool_pre_ping, не выполняет лишний запрос при каждой
+    выдаче соединения: недавно возвращенные в пул соединения считаются
+    живыми. Мертвое соединение отбрасывается, и пул выдает новое.
+
+    Args:
+        pool (Pool): Пул соединений.
+        ping (Callable[[Any], bool]): Функция проверки DBAPI соединения.
+        idle_threshold (float): Время простоя в секундах, после которого
+            соединение проверяется. Отрицательное значение отключает проверку.
+    """
+    if idle_threshold < 0:
+        return
+
+    @event.listens_for(pool, "checkin")
+    def remember_checkin(_dbapi_connection, record) -> None:
+        record.info["checked_in_at"] = time.monotonic()
+
+    @event.listens_for(pool, "checkout")
+    def ping_if_idle(dbapi_connection, record, _proxy) -> None:
+        checked_in_at = record.info.get("checked_in_at")
+        # Только что открытое соединение проверять не нужно
+        if checked_in_at is None or time.monotonic() - checked_in_at < idle_threshold:
+            return
+
+        pool_stats.pings += 1
+
+        try:
+            alive = ping(dbapi_connection)
+        except Exception as error:
+            logger.warning(f"Pooled connection ping failed: {error}")
+            alive = False
+
+        if not alive:
+            pool_stats.ping_failures += 1
+            raise exc.DisconnectionError("Pooled connection is no longer alive.")
@@ -0,0 +1,160 @@
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+from sqlalchemy import Result
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncResult, AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from service_logging import logger
+
+
+class ReplicaSet:
+    """Распределяет чтение между репликами БД с откатом на основной сервер.
+
+    Реплики выбираются по кругу. Реплика, к которой не удалось
+    подключиться, исключается из выбора на время cooldown. Если доступных
+    реплик нет, чтение выполняется на основном сервере.
+
+    После записи в течение sticky_window все чтения процесса направляются
+    на основной сервер, чтобы клиент видел собственные изменения
+    несмотря на отставание реплик.
+    """
+
+    def __init__(
+        self,
+        engines: list[AsyncEngine],
+        primary: sessionmaker,
+        cooldown: float,
+        sticky_window: float,
+    ) -> None:
+        """
+        Args:
+            engines (list[AsyncEngine]): Движки реплик.
+            primary (sessionmaker): Фабрика сессий основного сервера.
+            cooldown (float): Время исключения недоступной реплики в секундах.
+            sticky_window (float): Время чтения с основного сервера после записи в секундах.
+        """
+        self.engines = engines
+        self.primary = primary
+        self.cooldown = cooldown
+        self.sticky_window = sticky_window
+        self._next = 0
+        self._down_until = [0.0] * len(engines)
+        self._sticky_until = 0.0
+        self._sessions = sessionmaker(**{**primary.kw, "class_": ReplicaSession, "replicas": self})
+
+    def stick(self) -> None:
+        """Направляет чтения на основной сервер на время sticky_window."""
+        self._sticky_until = time.monotonic() + self.sticky_window
+
+    def candidates(self) -> list[int]:
+        """Возвращает номера доступных реплик в порядке попыток подключения.
+
+        Returns:
+            list[int]: Номера реплик. Пустой список означает чтение с основного сервера.
+        """
+        now = time.monotonic()
+        if not self.engines or now < self._sticky_until:
+            return []
+
+        start = self._next
+        self._next = (start + 1) % len(self.engines)
+        order = [(start + shift) % len(self.engines) for shift in range(len(self.engines))]
+        return [index for index in order if self._down_until[index] <= now]
+
+    def mark_down(self, index: int) -> None:
+        """Исключает реплику из выбора на время cooldown.
+
+        Args:
+            index (int): Номер реплики.
+        """
+        self._down_until[index] = time.monotonic() + self.cooldown
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[AsyncSession]:
+        """Открывает сессию чтения на реплике или на основном сервере.
+
+        Сервер выбирается при первом обращении сессии к БД, поэтому запрос,
+        обслуженный из кеша, не занимает соединение с репликой.
+
+        Yields:
+            AsyncSession: Асинхронная сессия работы с БД.
+        """
+        async with self._sessions() as session:
+            yield session
+
+    async def connect(self, session: "ReplicaSession") -> None:
+        """Привязывает сессию к первой доступной реплике или к основному серверу.
+
+        Соединение с репликой устанавливается сразу, чтобы при ее
+        недоступности перейти к следующей реплике до выполнения запроса.
+
+        Args:
+            session (ReplicaSession): Сессия, еще не обращавшаяся к БД.
+        """
+        primary = session.sync_session.bind
+        for index in self.candidates():
+            session.sync_session.bind = self.engines[index].sync_engine
+            try:
+                await AsyncSession.connection(session)
+                return
+            except (SQLAlchemyError, OSError) as error:
+                await session.rollback()
+                self.mark_down(index)
+                logger.warning(f"Read replica #{index} is unavailable: {error}")
+
+        session.sync_session.bind = primary
+
+    async def dispose(self) -> None:
+        """Закрывает подключения к репликам."""
+        for engine in self.engines:
+            await engine.dispose()
+
+
+class ReplicaSession(AsyncSession):
+    """Сессия чтения, привязываемая к реплике при первом обращении к БД.
+
+    До выбора реплики сессия привязана к основному серверу.
+    """
+
+    def __init__(self, replicas: ReplicaSet, **kwargs: Any) -> None:
+        """
+        Args:
+            replicas (ReplicaSet): Набор реплик, из которого выбирается сервер.
+            **kwargs (Any): Параметры AsyncSession.
+        """
+        super().__init__(**kwargs)
+        self.replicas = replicas
+        self._connected = False
+
+    async def _connect(self) -> None:
+        if not self._connected:
+            self._connected = True
+            await self.replicas.connect(self)
+
+    async def connection(self, *args: Any, **kwargs: Any) -> AsyncConnection:
+        await self._connect()
+        return await super().connection(*args, **kwargs)
+
+    async def execute(self, *args: Any, **kwargs: Any) -> Result:
+        await self._connect()
+        return await super().execute(*args, **kwargs)
+
+    async def scalar(self, *args: Any, **kwargs: Any) -> Any:
+        await self._connect()
+        return await super().scalar(*args, **kwargs)
+
+    async def get(self, *args: Any, **kwargs: Any) -> Any:
+        await self._connect()
+        return await super().get(*args, **kwargs)
+
+    async def get_one(self, *args: Any, **kwargs: Any) -> Any:
+        await self._connect()
+        return await super().get_one(*args, **kwargs)
+
+    async def stream(self, *args: Any, **kwargs: Any) -> AsyncResult:
+        await self._connect()
+        return await super().stream(*args, **kwargs)
@@ -0,0 +1,371 @@
+from collections.abc import Sequence
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import (
+    BigInteger,
+    ColumnElement,
+    Float,
+    Integer,
+    Row,
+    Select,
+    any_,
+    bindparam,
+    delete,
+    func,
+    insert,
+    literal,
+    select,
+    tuple_,
+    union_all,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.ext.asyncio import AsyncResult, AsyncScalarResult, AsyncSession
+from sqlalchemy.orm import aliased
+
+from .models import Exercise, ExerciseCatalog
+
+
+# Экранирование спецсимволов шаблона LIKE с символом экранирования '/'
+LIKE_ESCAPES = str.maketrans({"/": "//", "%": "/%", "_": "/_"})
+
+# Поля, по которым допускается сортировка списка. Каждое поле дополняется
+# seq_number, чтобы порядок был однозначным и пригодным для keyset-пагинации.
+SORT_KEYS = {
+    "seq_number": (Exercise.seq_number,),
+    "difficulty": (Exercise.difficulty, Exercise.seq_number),
+}
+
+
+class ExerciseRepository:
+    """Репозиторий упражнений.
+
+    Каждая операция изменения выполняется одним SQL выражением с RETURNING,
+    поэтому не требует предварительной выборки записи и последующего refresh.
+    Фиксация транзакции остается за вызывающей стороной.
+    """
+
+    def __init__(self, db: AsyncSession) -> None:
+        """
+        Args:
+            db (AsyncSession): Асинхронная сессия работы с БД.
+        """
+        self.db = db
+
+    async def get(self, uuid: UUID) -> Exercise | None:
+        """Возвращает упражнение по его UUID.
+
+        Args:
+            uuid (UUID): Идентификатор упражнения.
+
+        Returns:
+            Exercise | None: Упражнение или None, если оно не найдено.
+        """
+        return await self.db.get(Exercise, uuid)
+
+    async def get_columns(self, uuid: UUID, columns: Sequence[ColumnElement]) -> Row | None:
+        """Возвращает выбранные столбцы упражнения, не создавая ORM объект.
+
+        Args:
+            uuid (UUID): Идентификатор упражнения.
+            columns (Sequence[ColumnElement]): Загружаемые столбцы.
+
+        Returns:
+            Row | None: Строка со столбцами упражнения или None, если оно не найдено.
+        """
+        stmt = select(*columns).where(Exercise.id == uuid)
+        result = await self.db.execute(stmt)
+        return result.one_or_none()
+
+    async def get_version(self, uuid: UUID) -> int | None:
+        """Возвращает версию упражнения, не загружая остальные поля.
+
+        Args:
+            uuid (UUID): Идентификатор упражнения.
+
+        Returns:
+            int | None: Версия упражнения или None, если оно не найдено.
+        """
+        stmt = select(Exercise.version).where(Exercise.id == uuid)
+        result = await self.db.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def get_catalog_version(self) -> int:
+        """Возвращает версию каталога, меняющуюся при любом изменении упражнений.
+
+        Returns:
+            int: Версия каталога.
+        """
+        stmt = select(func.sum(ExerciseCatalog.version).cast(BigInteger))
+        result = await self.db.execute(stmt)
+        return result.scalar_one_or_none() or 0
+
+    async def list_page(
+        self,
+        where: Sequence[ColumnElement[bool]],
+        sort: str,
+        limit: int,
+        offset: int = 0,
+        after: Sequence[Any] | None = None,
+        backward: bool = False,
+        columns: Sequence[ColumnElement] | None = None,
+    ) -> list[Exercise] | list[Row]:
+        """Возвращает страницу упражнений, отфильтрованных и отсортированных.
+
+        Если переданы столбцы, загружаются только они в виде строк Row,
+        без создания ORM объектов.
+
+        Args:
+            where (Sequence[ColumnElement[bool]]): Условия выборки.
+            sort (str): Поле сортировки из SORT_KEYS, префикс '-' - по убыванию.
+            limit (int): Количество записей.
+            offset (int): Количество пропускаемых записей.
+            after (Sequence[Any] | None): Значения ключа сортировки, после которых
+                начинается страница (keyset-пагинация).
+            backward (bool): Читать страницу в обратном направлении от after.
+            columns (Sequence[ColumnElement] | None): Загружаемые столбцы.
+
+        Returns:
+            list[Exercise] | list[Row]: Упражнения в порядке сортировки.
+        """
+        keys = SORT_KEYS[sort.lstrip("-")]
+        # При чтении назад порядок обращается, а страница затем разворачивается
+        descending = sort.startswith("-") != backward
+
+        stmt = (select(*columns) if columns else select(Exercise)).where(*where)
+        if after is not None:
+            key = keys[0] if len(keys) == 1 else tuple_(*keys)
+            value = after[0] if len(keys) == 1 else tuple_(*after)
+            stmt = stmt.where(key < value if descending else key > value)
+
+        stmt = (
+            stmt.order_by(*(key.desc() if descending else key for key in keys))
+            .offset(offset or None)
+            .limit(limit)
+        )
+        result = await self.db.execute(stmt)
+        exercises = list(result.all() if columns else result.scalars().all())
+        if backward:
+            exercises.reverse()
+
+        return exercises
+
+    async def next_in_band(
+        self,
+        where: Sequence[ColumnElement[bool]],
+        low: int,
+        high: int,
+        after: int | ColumnElement | None = None,
+        columns: Sequence[ColumnElement] | None = None,
+    ) -> Exercise | Row | None:
+        """Возвращает упражнение с наименьшим номером больше after и сложностью в [low, high].
+
+        Для каждой сложности диапазона выполняется отдельная выборка первого
+        подходящего упражнения по индексу (difficulty, seq_number), а из
+        найденных выбирается упражнение с наименьшим номером. Поэтому объем
+        просмотра не зависит от доли упражнений диапазона в каталоге.
+
+        Args:
+            where (Sequence[ColumnElement[bool]]): Условия выборки, кроме сложности.
+            low (int): Минимальная сложность.
+            high (int): Максимальная сложность.
+            after (int | ColumnElement | None): Номер или выражение номера, после
+                которого ищется упражнение. None - с начала каталога.
+            columns (Sequence[ColumnElement] | None): Загружаемые столбцы.
+
+        Returns:
+            Exercise | Row | None: Упражнение или None, если подходящих нет.
+        """
+        probes = []
+        for difficulty in range(low, high + 1):
+            probe = select(*(columns or Exercise.__table__.columns)).where(
+                *where, Exercise.difficulty == difficulty
+            )
+            if after is not None:
+                probe = probe.where(Exercise.seq_number > after)
+
+            probes.append(probe.order_by(Exercise.seq_number).limit(1))
+
+        if not probes:
+            return None
+
+        found = union_all(*probes).subquery("found")
+        stmt = select(*found.c) if columns else select(aliased(Exercise, found))
+        result = await self.db.execute(stmt.order_by(found.c.seq_number).limit(1))
+        return result.first() if columns else result.scalars().first()
+
+    @staticmethod
+    def random_seq_number() -> ColumnElement:
+        """Возвращает выражение случайной точки в диапазоне номеров упражнений.
+
+        Максимальный номер читается из индекса seq_number. Точка вычисляется
+        в CTE один раз на запрос, даже если выражение используется в запросе
+        несколько раз. Точка целочисленная: сравнение seq_number с double
+        precision не использует индекс по seq_number.
+        """
+        point = func.floor(func.random() * func.max(Exercise.seq_number)).cast(Integer)
+        start = select(point.label("value")).cte("start")
+        return select(start.c.value).scalar_subquery()
+
+    async def search(
+        self,
+        query: str,
+        limit: int,
+        offset: int = 0,
+        columns: Sequence[ColumnElement] | None = None,
+    ) -> list[Exercise] | list[Row]:
+        """Ищет упражнения по названию с ранжированием по триграммному сходству.
+
+        Args:
+            query (str): Поисковая строка.
+            limit (int): Количество записей.
+            offset (int): Количество пропускаемых записей.
+            columns (Sequence[ColumnElement] | None): Загружаемые столбцы.
+
+        Returns:
+            list[Exercise] | list[Row]: Упражнения в порядке убывания релевантности.
+        """
+        result = await self.db.execute(self.search_statement(query, limit, offset, columns))
+        return list(result.all() if columns else result.scalars().all())
+
+    def search_statement(
+        self,
+        query: str,
+        limit: int,
+        offset: int = 0,
+        columns: Sequence[ColumnElement] | None = None,
+    ) -> Select:
+        """Возвращает запрос поиска упражнений по названию.
+
+        Условие (word similarity не ниже порога) и порядок по расстоянию
+        title <->> query (1 - word_similarity) обслуживаются GiST индексом
+        ix_exercises_title_trgm, поэтому первые результаты читаются из индекса
+        в порядке релевантности без сортировки всех совпадений. Дополнительный
+        ключ порядка потребовал бы сортировки поверх индекса, поэтому порядок
+        упражнений с одинаковым сходством не гарантируется.
+        """
+        distance = Exercise.title.op("<->>", return_type=Float)(query)
+        return (
+            (select(*columns) if columns else select(Exercise))
+            .where(literal(query).op("<%")(Exercise.title))
+            .order_by(distance)
+            .offset(offset or None)
+            .limit(limit)
+        )
+
+    def count_statement(self, where: Sequence[ColumnElement[bool]]) -> Select:
+        """Возвращает запрос подсчета упражнений, удовлетворяющих условиям."""
+        return select(func.count()).select_from(Exercise).where(*where)
+
+    async def get_many(self, uuids: list[UUID]) -> list[Exercise]:
+        """Возвращает упражнения по списку UUID одним запросом WHERE id = ANY(...).
+
+        Args:
+            uuids (list[UUID]): Идентификаторы упражнений.
+
+        Returns:
+            list[Exercise]: Найденные упражнения в произвольном порядке.
+        """
+        ids = bindparam("ids", value=uuids, type_=ARRAY(PG_UUID(as_uuid=True)))
+        stmt = select(Exercise).where(Exercise.id == any_(ids))
+        result = await self.db.execute(stmt)
+        return list(result.scalars().all())
+
+    async def stream_all(
+        self, batch_size: int, columns: Sequence[ColumnElement] | None = None
+    ) -> AsyncScalarResult[Exercise] | AsyncResult:
+        """Открывает серверный курсор по всем упражнениям в порядке seq_number.
+
+        Записи загружаются из курсора пачками по batch_size, поэтому
+        потребление памяти не зависит от размера таблицы. Если переданы
+        столбцы, поток состоит из строк Row с этими столбцами.
+
+        Args:
+            batch_size (int): Количество записей, читаемых из курсора за раз.
+            columns (Sequence[ColumnElement] | None): Загружаемые столбцы.
+
+        Returns:
+            AsyncScalarResult[Exercise] | AsyncResult: Асинхронный поток упражнений.
+        """
+        stmt = (
+            (select(*columns) if columns else select(Exercise))
+            .order_by(Exercise.seq_number)
+            .execution_options(yield_per=batch_size)
+        )
+        if columns:
+            return await self.db.stream(stmt)
+
+        return await self.db.stream_scalars(stmt)
+
+    async def create(self, values: dict[str, Any]) -> Exercise:
+        """Добавляет упражнение выражением INSERT ... RETURNING.
+
+        Args:
+            values (dict[str, Any]): Значения полей нового упражнения.
+
+        Returns:
+            Exercise: Созданное упражнение.
+        """
+        stmt = insert(Exercise).values(**values).returning(Exercise)
+        result = await self.db.execute(stmt)
+        return result.scalar_one()
+
+    async def create_many(self, values: list[dict[str, Any]]) -> list[Row]:
+        """Добавляет пачку упражнений многострочными выражениями INSERT ... RETURNING.
+
+        Args:
+            values (list[dict[str, Any]]): Значения полей новых упражнений.
+
+        Returns:
+            list[Row]: Идентификаторы и номера созданных упражнений
+                в порядке переданных значений.
+        """
+        stmt = insert(Exercise).returning(
+            Exercise.id, Exercise.seq_number, sort_by_parameter_order=True
+        )
+        result = await self.db.execute(stmt, values)
+        return list(result.all())
+
+    async def update(self, uuid: UUID, values: dict[str, Any]) -> Exercise | None:
+        """Обновляет упражнение выражением UPDATE ... RETURNING, увеличивая его версию.
+
+        Args:
+            uuid (UUID): Идентификатор упражнения.
+            values (dict[str, Any]): Новые значения полей.
+
+        Returns:
+            Exercise | None: Обновленное упражнение или None, если оно не найдено.
+        """
+        if not values:
+            return await self.get(uuid)
+
+        stmt = (
+            update(Exercise)
+            .where(Exercise.id == uuid)
+            .values(**values, version=Exercise.version + 1)
+            .returning(Exercise)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.db.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def delete(self, uuid: UUID) -> Row | None:
+        """Удаляет упражнение выражением DELETE ... RETURNING.
+
+        Args:
+            uuid (UUID): Идентификатор упражнения.
+
+        Returns:
+            Row | None: Идентификатор и номер удаленного упражнения
+                или None, если оно не найдено.
+        """
+        stmt = (
+            delete(Exercise)
+            .where(Exercise.id == uuid)
+            .returning(Exercise.id, Exercise.seq_number)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.db.execute(stmt)
+        return result.one_or_none()
@@ -0,0 +1,101 @@
+import os
+
+from .registry import Counter, Gauge, Histogram, Registry
+
+# Каждый рабочий процесс uvicorn хранит собственные значения метрик,
+# поэтому серии различаются меткой worker (PID процесса)
+registry = Registry(const_labels={"worker": str(os.getpid())})
+
+http_requests = registry.register(
+    Counter(
+        "http_requests_total",
+        "Total number of HTTP requests.",
+        labels=("method", "route", "status"),
+    )
+)
+http_request_duration = registry.register(
+    Histogram(
+        "http_request_duration_seconds",
+        "HTTP request duration in seconds.",
+        labels=("method", "route", "status"),
+    )
+)
+http_requests_in_flight = registry.register(
+    Gauge(
+        "http_requests_in_flight",
+        "Number of HTTP requests currently being processed.",
+        labels=("method",),
+    )
+)
+db_query_duration = registry.register(
+    Histogram(
+        "db_query_duration_seconds",
+        "Database query duration in seconds.",
+        labels=("operation",),
+        buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+    )
+)
+db_pool_connections = registry.register(
+    Gauge(
+        "db_pool_connections",
+        "Number of database pool connections by state.",
+        labels=("state",),
+    )
+)
+db_pool_utilization = registry.register(
+    Gauge("db_pool_utilization", "Share of the database pool capacity checked out.")
+)
+db_pool_checkouts = registry.register(
+    Counter("db_pool_checkouts_total", "Total number of database pool checkouts.")
+)
+db_pool_checkout_timeouts = registry.register(
+    Counter("db_pool_checkout_timeouts_total", "Total number of timed out pool checkouts.")
+)
+db_pool_checkout_wait = registry.register(
+    Counter("db_pool_checkout_wait_seconds_total", "Total time spent waiting for pool checkouts.")
+)
+cache_entries = registry.register(
+    Gauge("cache_entries", "Number of entries in the cache.", labels=("cache",))
+)
+cache_events = registry.register(
+    Counter("cache_events_total", "Total number of cache events.", labels=("cache", "event"))
+)
+singleflight_calls = registry.register(
+    Counter(
+        "singleflight_calls_total",
+        "Total number of reads that queried the database (leader) or joined one in flight.",
+        labels=("flight", "outcome"),
+    )
+)
+log_queue_size = registry.register(
+    Gauge("log_queue_size", "Number of log records waiting in the logging queue.")
+)
+log_records = registry.register(
+    Counter(
+        "log_records_total",
+        "Total number of log records passed through the logging queue by outcome.",
+        labels=("outcome",),
+    )
+)
+
+__all__ = (
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "Registry",
+    "cache_entries",
+    "cache_events",
+    "db_pool_checkout_timeouts",
+    "db_pool_checkout_wait",
+    "db_pool_checkouts",
+    "db_pool_connections",
+    "db_pool_utilization",
+    "db_query_duration",
+    "http_request_duration",
+    "http_requests",
+    "http_requests_in_flight",
+    "log_queue_size",
+    "log_records",
+    "registry",
+    "singleflight_calls",
+)
@@ -0,0 +1,33 @@
+import time
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from . import db_query_duration
+
+OPERATIONS = frozenset(("SELECT", "INSERT", "UPDATE", "DELETE"))
+
+
+def observe_queries(engine: AsyncEngine) -> None:
+    """Включает учет длительности SQL запросов движка в гистограмме метрик.
+
+    Запросы группируются по первому ключевому слову выражения: SELECT,
+    INSERT, UPDATE, DELETE, остальные учитываются как OTHER.
+
+    Args:
+        engine (AsyncEngine): Движок БД.
+    """
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def start_timer(_conn, _cursor, _statement, _parameters, context, _executemany) -> None:
+        context._query_started_at = time.perf_counter()
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def observe(_conn, _cursor, statement, _parameters, context, _executemany) -> None:
+        started_at = getattr(context, "_query_started_at", None)
+        if started_at is None:
+            return
+
+        keyword = statement.lstrip()[:6].upper()
+        operation = keyword if keyword in OPERATIONS else "OTHER"
+        db_query_duration.observe(time.perf_counter() - started_at, operation)
@@ -0,0 +1,49 @@
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from . import http_request_duration, http_requests, http_requests_in_flight
+
+# Метка запросов, не сопоставленных ни одному маршруту. Сырой путь
+# не используется, чтобы число временных рядов оставалось ограниченным
+UNMATCHED_ROUTE = "unmatched"
+
+
+class MetricsMiddleware:
+    """ASGI middleware, учитывающее количество и длительность HTTP запросов.
+
+    Реализовано на уровне ASGI без BaseHTTPMiddleware, поэтому не создает
+    дополнительных задач и потоков тела ответа. Маршрут определяется по
+    шаблону пути FastAPI после маршрутизации запроса.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status = "500"
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = str(message["status"])
+
+            await send(message)
+
+        http_requests_in_flight.inc(method)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            duration = time.perf_counter() - started
+            http_requests_in_flight.dec(method)
+
+            route = scope.get("route")
+            path = route.path if route is not None else UNMATCHED_ROUTE
+            http_requests.inc(method, path, status)
+            http_request_duration.observe(duration, method, path, status)
@@ -0,0 +1,204 @@
+from bisect import bisect_left
+from collections.abc import Iterator, Sequence
+
+LabelValues = tuple[str, ...]
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+
+    pairs = ",".join(f'{name}="{_escape(str(value))}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class Metric:
+    """Базовая метрика в формате экспозиции Prometheus.
+
+    Значения хранятся отдельно для каждого набора значений меток.
+    Метрики не защищены блокировками и рассчитаны на работу в одном event loop.
+    """
+
+    type = "untyped"
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()) -> None:
+        """
+        Args:
+            name (str): Имя метрики.
+            documentation (str): Описание метрики (строка HELP).
+            labels (Sequence[str]): Имена меток.
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self._values: dict[LabelValues, float] = {}
+        # Метки, общие для всех метрик набора, задаются при регистрации
+        self.const_labels: dict[str, str] = {}
+
+    def set(self, value: float, *labels: str) -> None:
+        """Устанавливает значение метрики.
+
+        Args:
+            value (float): Новое значение.
+            *labels (str): Значения меток.
+        """
+        self._values[labels] = value
+
+    def samples(self) -> Iterator[str]:
+        """Возвращает строки значений метрики."""
+        names, values = self._label_names(), tuple(self.const_labels.values())
+        for labels, value in self._values.items():
+            yield f"{self.name}{_format_labels(names, values + labels)} {_format_value(value)}"
+
+    def _label_names(self) -> tuple[str, ...]:
+        return (*self.const_labels, *self.labels)
+
+    def render(self) -> Iterator[str]:
+        """Возвращает строки метрики вместе с заголовками HELP и TYPE."""
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} {self.type}"
+        yield from self.samples()
+
+
+class Counter(Metric):
+    """Монотонно возрастающий счетчик."""
+
+    type = "counter"
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        """Увеличивает счетчик.
+
+        Args:
+            *labels (str): Значения меток.
+            amount (float): Величина увеличения.
+        """
+        self._values[labels] = self._values.get(labels, 0.0) + amount
+
+
+class Gauge(Metric):
+    """Произвольно изменяющееся значение."""
+
+    type = "gauge"
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        """Увеличивает значение.
+
+        Args:
+            *labels (str): Значения меток.
+            amount (float): Величина увеличения.
+        """
+        self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def dec(self, *labels: str, amount: float = 1.0) -> None:
+        """Уменьшает значение.
+
+        Args:
+            *labels (str): Значения меток.
+            amount (float): Величина уменьшения.
+        """
+        self._values[labels] = self._values.get(labels, 0.0) - amount
+
+
+class Histogram(Metric):
+    """Распределение наблюдаемых значений по корзинам.
+
+    Для каждого наблюдения увеличивается только одна корзина, накопленные
+    значения корзин вычисляются при экспозиции.
+    """
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        """
+        Args:
+            name (str): Имя метрики.
+            documentation (str): Описание метрики (строка HELP).
+            labels (Sequence[str]): Имена меток.
+            buckets (Sequence[float]): Верхние границы корзин по возрастанию.
+        """
+        super().__init__(name, documentation, labels)
+        self.buckets = tuple(sorted(buckets))
+        # Значения меток -> [счетчики корзин + корзина +Inf, сумма]
+        self._series: dict[LabelValues, list] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        """Учитывает наблюдаемое значение.
+
+        Args:
+            value (float): Наблюдаемое значение.
+            *labels (str): Значения меток.
+        """
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+
+        series[0][bisect_left(self.buckets, value)] += 1
+        series[1] += value
+
+    def samples(self) -> Iterator[str]:
+        names, const = self._label_names(), tuple(self.const_labels.values())
+        for labels, (counts, total) in self._series.items():
+            cumulative = 0
+            for bound, count in zip((*self.buckets, float("inf")), counts):
+                cumulative += count
+                bucket_labels = _format_labels(
+                    (*names, "le"), (*const, *labels, _format_value(bound))
+                )
+                yield f"{self.name}_bucket{bucket_labels} {cumulative}"
+
+            series_labels = _format_labels(names, const + labels)
+            yield f"{self.name}_sum{series_labels} {_format_value(total)}"
+            yield f"{self.name}_count{series_labels} {cumulative}"
+
+
+class Registry:
+    """Набор метрик, отдаваемых в формате экспозиции Prometheus."""
+
+    def __init__(self, const_labels: dict[str, str] | None = None) -> None:
+        """
+        Args:
+            const_labels (dict[str, str] | None): Метки, добавляемые ко всем метрикам набора.
+        """
+        self.const_labels = dict(const_labels or {})
+        self._metrics: list[Metric] = []
+
+    def register(self, metric: Metric) -> Metric:
+        """Добавляет метрику в набор.
+
+        Args:
+            metric (Metric): Метрика.
+
+        Returns:
+            Metric: Та же метрика.
+        """
+        metric.const_labels = self.const_labels
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> bytes:
+        """Возвращает все метрики в текстовом формате экспозиции Prometheus.
+
+        Returns:
+            bytes: Текст экспозиции.
+        """
+        lines = [line for metric in self._metrics for line in metric.render()]
+        return ("\n".join(lines) + "\n").encode()
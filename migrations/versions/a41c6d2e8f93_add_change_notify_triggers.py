@@ -0,0 +1,61 @@
+"""add change notify triggers
+
+Revision ID: a41c6d2e8f93
+Revises: 7b3e9c1f5a20
+Create Date: 2026-10-18 12:03:17.228411
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a41c6d2e8f93'
+down_revision: Union[str, None] = '7b3e9c1f5a20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Уведомления о вставке отправляются раз на выражение, чтобы массовое
+    # добавление не порождало отдельное событие на каждую строку.
+    op.execute(
+        """
+        CREATE FUNCTION notify_exercises_change() RETURNS trigger AS $$
+        BEGIN
+            IF TG_LEVEL = 'STATEMENT' THEN
+                PERFORM pg_notify('exercises_changes', json_build_object('op', lower(TG_OP))::text);
+            ELSIF TG_OP = 'DELETE' THEN
+                PERFORM pg_notify('exercises_changes', json_build_object('op', 'delete', 'id', OLD.id)::text);
+            ELSE
+                PERFORM pg_notify('exercises_changes', json_build_object('op', 'update', 'id', NEW.id)::text);
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER exercises_notify_insert
+        AFTER INSERT ON exercises
+        FOR EACH STATEMENT EXECUTE FUNCTION notify_exercises_change()
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER exercises_notify_change
+        AFTER UPDATE OR DELETE ON exercises
+        FOR EACH ROW EXECUTE FUNCTION notify_exercises_change()
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER exercises_notify_change ON exercises")
+    op.execute("DROP TRIGGER exercises_notify_insert ON exercises")
+    op.execute("DROP FUNCTION notify_exercises_change()")
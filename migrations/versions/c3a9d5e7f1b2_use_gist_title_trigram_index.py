@@ -0,0 +1,31 @@
+"""use gist title trigram index
+
+Revision ID: c3a9d5e7f1b2
+Revises: b8e1f4a7c2d9
+Create Date: 2026-10-18 20:05:17.904562
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3a9d5e7f1b2'
+down_revision: Union[str, None] = 'b8e1f4a7c2d9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # GiST индекс поддерживает упорядочивание по расстоянию (KNN), GIN - нет
+    op.drop_index('ix_exercises_title_trgm', table_name='exercises', postgresql_using='gin', postgresql_ops={'title': 'gin_trgm_ops'})
+    op.create_index('ix_exercises_title_trgm', 'exercises', ['title'], unique=False, postgresql_using='gist', postgresql_ops={'title': 'gist_trgm_ops'})
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_exercises_title_trgm', table_name='exercises', postgresql_using='gist', postgresql_ops={'title': 'gist_trgm_ops'})
+    op.create_index('ix_exercises_title_trgm', 'exercises', ['title'], unique=False, postgresql_using='gin', postgresql_ops={'title': 'gin_trgm_ops'})
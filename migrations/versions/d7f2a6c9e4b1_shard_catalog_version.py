@@ -0,0 +1,66 @@
+"""shard catalog version
+
+Revision ID: d7f2a6c9e4b1
+Revises: c3a9d5e7f1b2
+Create Date: 2026-10-18 20:41:33.218790
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7f2a6c9e4b1'
+down_revision: Union[str, None] = 'c3a9d5e7f1b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Количество строк счетчика версии каталога
+SHARDS = 64
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Версия каталога - сумма версий строк. Каждое соединение увеличивает
+    # свою строку, поэтому одновременные изменения из разных соединений
+    # не ожидают блокировки одной строки, а транзакция блокирует не более
+    # одной строки счетчика и не может попасть во взаимную блокировку
+    op.drop_constraint('check_catalog_single_row', 'exercises_catalog', type_='check')
+    op.create_check_constraint('check_catalog_shard', 'exercises_catalog', f'id >= 0 AND id < {SHARDS}')
+    op.execute(
+        f"""
+        INSERT INTO exercises_catalog (id, version)
+        SELECT shard, 0 FROM generate_series(0, {SHARDS - 1}) AS shard
+        ON CONFLICT (id) DO NOTHING
+        """
+    )
+    op.execute(
+        f"""
+        CREATE OR REPLACE FUNCTION bump_exercises_catalog_version() RETURNS trigger AS $$
+        BEGIN
+            UPDATE exercises_catalog SET version = version + 1 WHERE id = pg_backend_pid() % {SHARDS};
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION bump_exercises_catalog_version() RETURNS trigger AS $$
+        BEGIN
+            UPDATE exercises_catalog SET version = version + 1 WHERE id = 1;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute("UPDATE exercises_catalog SET version = (SELECT sum(version) FROM exercises_catalog) WHERE id = 1")
+    op.execute("DELETE FROM exercises_catalog WHERE id <> 1")
+    op.drop_constraint('check_catalog_shard', 'exercises_catalog', type_='check')
+    op.create_check_constraint('check_catalog_single_row', 'exercises_catalog', 'id = 1')
@@ -1,4 +1,6 @@
 from .exercises import router as exercises_router
 from .health import router as health_router
+from .metrics import router as metrics_router
+from .stats import router as stats_router
 
-__all__ = ("health_router", "exercises_router")
+__all__ = ("health_router", "exercises_router", "metrics_router", "stats_router")
@@ -1,14 +1,40 @@
-from typing import Annotated
+from collections.abc import AsyncIterator
+from contextlib import nullcontext
+from typing import Annotated, Literal
 from uuid import UUID
 
-from fastapi import APIRouter, Body, Depends, HTTPException, Path, status
-from sqlalchemy import func, select
-from sqlalchemy.exc import IntegrityError
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    Header,
+    HTTPException,
+    Path,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
+from pydantic_core import to_json
+from sqlalchemy import Row
+from sqlalchemy.exc import DBAPIError, IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from database import get_db
+from caching import CatalogSnapshot, SnapshotStore, detail_cache, detail_flight, list_flight
+from configs import configs
+from database import LocalAsyncSession, get_db, get_read_db, replicas
+from database.counting import CountProvider, CountStrategy
 from database.models import Exercise
+from database.notifications import ExerciseChange, notifier
+from database.repository import SORT_KEYS, ExerciseRepository
+from database.types import ExerciseLang, ExerciseTag
 from schemas import (
+    BatchGetExerciseRequest,
+    BatchGetExerciseResponse,
+    BulkCreateExerciseResponse,
+    BulkExerciseResult,
     CreateExerciseRequest,
     CreateExerciseResponse,
     DeleteExerciseResponse,
@@ -19,49 +45,489 @@ from schemas import (
 )
 from service_logging import logger
 
-from .utils.pagination import PaginatedResponse, Pagination
+from .utils.etag import cache_headers, detail_etag, etag_matches, list_etag, not_modified
+from .utils.filters import ExerciseFilters
+from .utils.pagination import (
+    Cursor,
+    CursorDirection,
+    CursorPagination,
+    PaginatedResponse,
+    Pagination,
+)
+from .utils.streaming import (
+    StreamFormatError,
+    csv_header,
+    iter_json_items,
+    to_csv,
+    to_ndjson,
+)
 
 router = APIRouter()
 
 
+async def get_repository(db: AsyncSession = Depends(get_db)) -> ExerciseRepository:
+    """Возвращает репозиторий упражнений, работающий в сессии запроса."""
+    return ExerciseRepository(db)
+
+
+async def get_read_repository(db: AsyncSession = Depends(get_read_db)) -> ExerciseRepository:
+    """Возвращает репозиторий упражнений для чтения, работающий на реплике БД."""
+    return ExerciseRepository(db)
+
+
+def _describe_error(error: ValueError) -> str:
+    """Возвращает краткое описание ошибки разбора или валидации упражнения."""
+    if isinstance(error, ValidationError):
+        return "; ".join(
+            f"{'.'.join(map(str, err['loc'])) or 'item'}: {err['msg']}" for err in error.errors()
+        )
+
+    return str(error)
+
+
+# Столбцы схем ответа. Списки и выгрузка загружают только их в виде строк Row,
+# без создания отслеживаемых ORM объектов
+LIST_COLUMNS = [getattr(Exercise, name) for name in ExerciseResponse.model_fields]
+DETAIL_COLUMNS = [getattr(Exercise, name) for name in DetailExerciseResponse.model_fields]
+
+
+async def load_catalog_snapshot() -> CatalogSnapshot:
+    """Загружает снимок каталога упражнений с основного сервера БД."""
+    async with LocalAsyncSession() as db:
+        repo = ExerciseRepository(db)
+        # Версия читается до строк, поэтому изменение между чтениями не потеряется:
+        # снимок будет помечен устаревшим уведомлением об этом изменении
+        version = await repo.get_catalog_version()
+        result = await repo.stream_all(configs.bulk.EXPORT_BATCH_SIZE, columns=LIST_COLUMNS)
+        rows = [row async for row in result]
+
+    return CatalogSnapshot(version, rows)
+
+
+catalog_snapshot = SnapshotStore(
+    load_catalog_snapshot,
+    interval=configs.cache.SNAPSHOT_REFRESH_INTERVAL,
+    enabled=configs.cache.SNAPSHOT_ENABLE,
+)
+
+counter = CountProvider(
+    Exercise,
+    strategy=configs.pagination.COUNT_STRATEGY,
+    ttl=configs.pagination.COUNT_CACHE_TTL,
+)
+
+
+@notifier.subscribe
+def invalidate_caches(change: ExerciseChange) -> None:
+    """Сбрасывает локальные кеши, затронутые изменением каталога упражнений."""
+    counter.invalidate()
+    catalog_snapshot.invalidate()
+    if change.op == "reset":
+        detail_cache.clear()
+    elif change.id is not None:
+        detail_cache.invalidate(change.id)
+
+
+def _written(change: ExerciseChange) -> None:
+    """Сообщает о зафиксированном обработчиком запроса изменении каталога.
+
+    Чтения процесса направляются на основной сервер БД, пока реплики
+    догоняют собственную запись. Уведомления об изменениях других
+    процессов и сервисов на выбор сервера чтения не влияют.
+    """
+    replicas.stick()
+    notifier.dispatch(change)
+
+
 @router.get("/", summary="Получить список всех упражнений")
 async def get_exercises(
+    request: Request,
+    response: Response,
     pg: Annotated[Pagination, Depends()],
-    db: AsyncSession = Depends(get_db),
+    cp: Annotated[CursorPagination, Depends()],
+    filters: Annotated[ExerciseFilters, Depends()],
+    with_total: Annotated[
+        bool, Query(description="Подсчитывать ли общее количество упражнений")
+    ] = True,
+    if_none_match: Annotated[str | None, Header()] = None,
+    repo: ExerciseRepository = Depends(get_read_repository),
 ) -> PaginatedResponse[ExerciseResponse]:
-    """Постранично возвращает список всех обучающих упражнений."""
+    """Постранично возвращает список обучающих упражнений.
+
+    Поддерживает два режима пагинации: по номеру страницы (offset) и
+    курсорный (keyset). Курсорный режим включается передачей курсора
+    из полей next_cursor/prev_cursor предыдущего ответа и читает любую
+    страницу за постоянное время, независимо от ее глубины.
+
+    Упражнения фильтруются по сложности, языку, тегам и началу названия
+    и сортируются по номеру или сложности на стороне БД.
+
+    Из БД загружаются только столбцы схемы ответа, без создания ORM
+    объектов. При включенном быстром пути сериализации (EXERCISES_HTTP_FAST_JSON)
+    строки сериализуются в JSON напрямую, без создания моделей ответа.
+
+    Общее количество упражнений предоставляется поставщиком подсчета
+    согласно настроенной стратегии и может быть отключено через with_total.
+
+    Ответ помечается ETag, производным от версии каталога, поэтому условный
+    запрос к неизменившемуся каталогу получает 304 без чтения страницы.
+    Одновременные запросы одной страницы разделяют одно ее чтение из БД.
+
+    В режиме снимка каталога (EXERCISES_CACHE_SNAPSHOT_ENABLE) страница,
+    фильтрация и подсчет выполняются по снимку в памяти процесса без
+    обращения к БД, пока снимок учитывает все известные изменения.
+    """
     logger.info("Getting the exercise list...")
-    stmt = select(Exercise).offset(pg.skip).limit(pg.size)
-    result = await db.execute(stmt)
-    exercises = result.scalars().all()
+    cursor = None
+    if cp.cursor is not None:
+        try:
+            cursor = Cursor.decode(cp.cursor)
+            if cursor.sort != filters.sort:
+                raise ValueError("Cursor was issued for a different sort order.")
+
+        except ValueError:
+            detail = "Invalid pagination cursor."
+            logger.error(detail)
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=detail,
+            )
+
+    snapshot = catalog_snapshot.get()
+    query = "&".join(sorted(f"{key}={value}" for key, value in request.query_params.multi_items()))
+    version = snapshot.version if snapshot is not None else await repo.get_catalog_version()
+    etag = list_etag(version, query)
+    if etag_matches(if_none_match, etag):
+        logger.success("Exercise list not modified.")
+        return not_modified(etag)
+
+    if snapshot is not None:
+        page = _snapshot_page(snapshot, pg, cursor, filters, with_total)
+    else:
+        # Страница однозначно определяется версией каталога и разобранными параметрами
+        key = (version, pg.page, pg.size, cp.cursor, filters.key, filters.sort, with_total)
+        page = await list_flight.do(key, lambda: _load_page(repo, pg, cursor, filters, with_total))
+
+    if isinstance(page, bytes):
+        return Response(content=page, media_type="application/json", headers=cache_headers(etag))
+
+    response.headers.update(cache_headers(etag))
+    return page
+
+
+async def _load_page(
+    repo: ExerciseRepository,
+    pg: Pagination,
+    cursor: Cursor | None,
+    filters: ExerciseFilters,
+    with_total: bool,
+) -> PaginatedResponse[ExerciseResponse] | bytes:
+    """Читает страницу списка упражнений из БД.
+
+    Returns:
+        PaginatedResponse[ExerciseResponse] | bytes: Страница списка или,
+            при включенном быстром пути сериализации, ее JSON представление.
+    """
+    where = filters.clauses()
+    backward = cursor is not None and cursor.direction is CursorDirection.PREV
+    fast_json = configs.http.FAST_JSON
+    # Запрашивается на одну запись больше, чтобы узнать о наличии следующей страницы
+    exercises = await repo.list_page(
+        where,
+        sort=filters.sort,
+        limit=pg.size + 1,
+        offset=pg.skip if cursor is None else 0,
+        after=cursor.values if cursor is not None else None,
+        backward=backward,
+        columns=LIST_COLUMNS,
+    )
 
-    stmt = select(func.count()).select_from(Exercise)
-    result = await db.execute(stmt)
-    total = result.scalar_one()
+    has_more = len(exercises) > pg.size
+    exercises = exercises[1:] if backward and has_more else exercises[: pg.size]
 
-    items = [ExerciseResponse.model_validate(exercise) for exercise in exercises]
+    total, total_strategy = None, CountStrategy.SKIPPED
+    if with_total:
+        total, total_strategy = await counter.count(
+            repo.db, key=filters.key, stmt=repo.count_statement(where) if where else None
+        )
+
+    items = exercises if fast_json else [ExerciseResponse.model_validate(e) for e in exercises]
     logger.success(f"Received {len(items)} exercises.")
 
+    next_cursor = prev_cursor = None
+    if items:
+        has_next = has_more if not backward else True
+        has_prev = has_more if backward else (cursor is not None or pg.skip > 0)
+        if has_next:
+            next_cursor = _cursor(items[-1], filters.sort, CursorDirection.NEXT)
+        if has_prev:
+            prev_cursor = _cursor(items[0], filters.sort, CursorDirection.PREV)
+
+    page = PaginatedResponse[ExerciseResponse](
+        items=[] if fast_json else items,
+        page=pg.page if cursor is None else None,
+        size=pg.size,
+        total=total,
+        total_strategy=total_strategy,
+        next_cursor=next_cursor,
+        prev_cursor=prev_cursor,
+    )
+    if fast_json:
+        return page.dump_json_with_items(to_json([row._asdict() for row in items]))
+
+    return page
+
+
+def _snapshot_page(
+    snapshot: CatalogSnapshot,
+    pg: Pagination,
+    cursor: Cursor | None,
+    filters: ExerciseFilters,
+    with_total: bool,
+) -> bytes:
+    """Собирает JSON страницы списка упражнений из снимка каталога.
+
+    Returns:
+        bytes: JSON страницы списка.
+    """
+    backward = cursor is not None and cursor.direction is CursorDirection.PREV
+    selection = snapshot.select(
+        filters.key, filters.matches if filters.filtered else None, filters.sort
+    )
+    # Запрашивается на одну запись больше, чтобы узнать о наличии следующей страницы
+    indices = snapshot.page(
+        selection,
+        sort=filters.sort,
+        limit=pg.size + 1,
+        offset=pg.skip if cursor is None else 0,
+        after=cursor.values if cursor is not None else None,
+        backward=backward,
+    )
+
+    has_more = len(indices) > pg.size
+    indices = indices[1:] if backward and has_more else indices[: pg.size]
+    logger.success(f"Received {len(indices)} exercises from the catalog snapshot.")
+
+    next_cursor = prev_cursor = None
+    if indices:
+        has_next = has_more if not backward else True
+        has_prev = has_more if backward else (cursor is not None or pg.skip > 0)
+        if has_next:
+            next_cursor = _cursor(snapshot.rows[indices[-1]], filters.sort, CursorDirection.NEXT)
+        if has_prev:
+            prev_cursor = _cursor(snapshot.rows[indices[0]], filters.sort, CursorDirection.PREV)
+
+    page = PaginatedResponse[ExerciseResponse](
+        items=[],
+        page=pg.page if cursor is None else None,
+        size=pg.size,
+        total=len(selection) if with_total else None,
+        total_strategy=CountStrategy.EXACT if with_total else CountStrategy.SKIPPED,
+        next_cursor=next_cursor,
+        prev_cursor=prev_cursor,
+    )
+    return page.dump_json_with_items(snapshot.dump_json(indices))
+
+
+def _cursor(item: ExerciseResponse | Row, sort: str, direction: CursorDirection) -> str:
+    """Возвращает токен курсора, указывающий на границу страницы у данного упражнения."""
+    keys = SORT_KEYS[sort.lstrip("-")]
+    values = [getattr(item, key.key) for key in keys]
+    return Cursor(sort=sort, values=values, direction=direction).encode()
+
+
+@router.get("/search", summary="Найти упражнения по названию")
+async def search_exercises(
+    q: Annotated[str, Query(min_length=1, max_length=50, description="Поисковая строка")],
+    pg: Annotated[Pagination, Depends()],
+    repo: ExerciseRepository = Depends(get_read_repository),
+) -> PaginatedResponse[ExerciseResponse]:
+    """Постранично возвращает упражнения, название которых похоже на поисковую строку.
+
+    Результаты упорядочены по убыванию триграммного сходства названия
+    с поисковой строкой. Общее количество результатов не подсчитывается.
+    """
+    logger.info("Searching exercises by title...")
+    exercises = await repo.search(q, limit=pg.size, offset=pg.skip, columns=LIST_COLUMNS)
+
+    items = [ExerciseResponse.model_validate(exercise) for exercise in exercises]
+    logger.success(f"Found {len(items)} exercises.")
+
     return PaginatedResponse[ExerciseResponse](
         items=items,
         page=pg.page,
         size=pg.size,
-        total=total,
+        total_strategy=CountStrategy.SKIPPED,
     )
 
 
-@router.get("/{uuid}", summary="Получить детальную информацию об упражнении")
+@router.get("/export", summary="Выгрузить все упражнения")
+async def export_exercises(
+    format: Annotated[Literal["ndjson", "csv"], Query(description="Формат выгрузки")] = "ndjson",
+) -> StreamingResponse:
+    """Потоково выгружает весь каталог упражнений в формате NDJSON или CSV.
+
+    Упражнения читаются через серверный курсор пачками и отправляются
+    клиенту по мере чтения, поэтому потребление памяти не зависит
+    от размера каталога.
+    """
+    logger.info(f"Exporting the exercise catalog ({format})...")
+    media_type = "application/x-ndjson" if format == "ndjson" else "text/csv"
+
+    return StreamingResponse(
+        _export_chunks(format),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="exercises.{format}"'},
+    )
+
+
+async def _export_chunks(format: Literal["ndjson", "csv"]) -> AsyncIterator[bytes]:
+    """Генерирует фрагменты выгрузки каталога упражнений.
+
+    Сессия открывается внутри генератора, так как ответ отправляется
+    уже после завершения зависимостей обработчика.
+    """
+    if format == "csv":
+        yield csv_header(DetailExerciseResponse)
+
+    exported = 0
+    async with replicas.session() as db:
+        repo = ExerciseRepository(db)
+        result = await repo.stream_all(configs.bulk.EXPORT_BATCH_SIZE, columns=DETAIL_COLUMNS)
+        async for partition in result.partitions():
+            items = [DetailExerciseResponse.model_validate(row) for row in partition]
+            if format == "ndjson":
+                yield to_ndjson(items)
+            else:
+                yield to_csv(items)
+
+            exported += len(items)
+
+    logger.success(f"Exported {exported} exercises.")
+
+
+@router.get(
+    "/next",
+    summary="Подобрать следующее упражнение",
+    response_model=ExerciseResponse,
+)
+async def get_next_exercise(
+    difficulty: Annotated[int, Query(ge=0, description="Целевая сложность")],
+    spread: Annotated[
+        int, Query(ge=0, le=10, description="Допустимое отклонение сложности от целевой")
+    ] = 0,
+    lang: Annotated[ExerciseLang | None, Query(description="Язык упражнения")] = None,
+    tags: Annotated[
+        list[ExerciseTag], Query(description="Теги, которые есть у упражнения")
+    ] = [],
+    exclude: Annotated[
+        list[UUID], Query(max_length=100, description="Уже пройденные упражнения")
+    ] = [],
+    order: Annotated[
+        Literal["random", "sequential"], Query(description="Способ выбора упражнения")
+    ] = "random",
+    after: Annotated[
+        int, Query(ge=0, description="Номер упражнения, после которого выбирается следующее")
+    ] = 0,
+    repo: ExerciseRepository = Depends(get_read_repository),
+) -> Response:
+    """Возвращает упражнение со сложностью в диапазоне difficulty ± spread.
+
+    В случайном режиме упражнение выбирается случайно внутри диапазона,
+    в последовательном - упражнение с наименьшим номером больше after.
+    Упражнения из exclude не выбираются.
+
+    Из снимка каталога (EXERCISES_CACHE_SNAPSHOT_ENABLE) упражнение выбирается
+    бинарным поиском по строкам, упорядоченным по сложности. Иначе выполняется
+    один запрос к БД, который для каждой сложности диапазона читает по индексу
+    (difficulty, seq_number) первое подходящее упражнение после случайной точки
+    или после after, без ORDER BY random().
+    """
+    logger.info("Picking the next exercise...")
+    low, high = max(difficulty - spread, 0), difficulty + spread
+    exclude_ids = set(exclude)
+
+    snapshot = catalog_snapshot.get()
+    if snapshot is not None:
+        filters = ExerciseFilters(lang=lang, tags=tags)
+        selection = snapshot.select(
+            filters.key, filters.matches if filters.filtered else None, "difficulty"
+        )
+        if order == "random":
+            index = snapshot.pick_random(selection, low, high, exclude_ids)
+        else:
+            index = snapshot.pick_next(selection, low, high, after, exclude_ids)
+
+        exercise = snapshot.rows[index] if index is not None else None
+        content = snapshot.encoded[index] if index is not None else None
+
+    else:
+        where = ExerciseFilters(lang=lang, tags=tags).clauses()
+        if exclude_ids:
+            where.append(Exercise.id.not_in(exclude_ids))
+
+        start = repo.random_seq_number() if order == "random" else after
+        exercise = await repo.next_in_band(where, low, high, after=start, columns=LIST_COLUMNS)
+        if exercise is None and order == "random":
+            # Случайная точка оказалась после последнего подходящего упражнения
+            exercise = await repo.next_in_band(where, low, high, columns=LIST_COLUMNS)
+
+        content = to_json(exercise._asdict()) if exercise is not None else None
+
+    if exercise is None:
+        detail = "No matching exercise found."
+        logger.error(detail)
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=detail,
+        )
+
+    logger.success(f"Exercise picked: ({exercise.seq_number}){exercise.id}")
+    headers = {"Cache-Control": "no-store"} if order == "random" else None
+    return Response(content=content, media_type="application/json", headers=headers)
+
+
+@router.get(
+    "/{uuid}",
+    summary="Получить детальную информацию об упражнении",
+    response_model=DetailExerciseResponse,
+)
 async def get_exercise(
     uuid: Annotated[UUID, Path(...)],
-    db: AsyncSession = Depends(get_db),
-) -> DetailExerciseResponse:
-    """Возвращает полную информацию о конкретном упражнении по его UUID."""
+    if_none_match: Annotated[str | None, Header()] = None,
+    repo: ExerciseRepository = Depends(get_read_repository),
+) -> Response:
+    """Возвращает полную информацию о конкретном упражнении по его UUID.
+
+    Сериализованный ответ кешируется в памяти процесса и сбрасывается
+    при изменении или удалении упражнения. Ответ помечается ETag,
+    производным от версии упражнения, поэтому условный запрос к
+    неизменившемуся упражнению получает 304 без чтения его полей.
+
+    Одновременные запросы одного упражнения при промахе кеша разделяют
+    одно чтение из БД.
+    """
     logger.info("Getting information about an exercise...")
-    stmt = select(Exercise).where(Exercise.id == uuid)
-    result = await db.execute(stmt)
-    exercise = result.scalar_one_or_none()
-
-    if exercise is None:
+    cached = detail_cache.get(uuid)
+    if cached is not None:
+        etag, content = cached
+        if etag_matches(if_none_match, etag):
+            logger.success(f"Exercise not modified: {uuid}")
+            return not_modified(etag)
+
+        logger.success(f"Exercise received from cache: {uuid}")
+        return Response(content=content, media_type="application/json", headers=cache_headers(etag))
+
+    epoch = detail_cache.epoch
+    if if_none_match:
+        version = await repo.get_version(uuid)
+        if version is not None and etag_matches(if_none_match, detail_etag(uuid, version)):
+            logger.success(f"Exercise not modified: {uuid}")
+            return not_modified(detail_etag(uuid, version))
+
+    # Эпоха в ключе не дает присоединиться к чтению, начатому до изменения упражнения
+    loaded = await detail_flight.do((uuid, epoch), lambda: _load_exercise(repo, uuid, epoch))
+    if loaded is None:
         detail = "Exercise not found."
         logger.error(detail)
         raise HTTPException(
@@ -69,33 +535,78 @@ async def get_exercise(
             detail=detail,
         )
 
-    item = DetailExerciseResponse.model_validate(exercise)
-    logger.success(f"Exercise received: ({item.seq_number}){item.id}")
+    etag, content = loaded
+    return Response(content=content, media_type="application/json", headers=cache_headers(etag))
 
-    return item
+
+async def _load_exercise(
+    repo: ExerciseRepository, uuid: UUID, epoch: int
+) -> tuple[str, bytes] | None:
+    """Читает упражнение из БД, сериализует его и сохраняет в кеш.
+
+    Returns:
+        tuple[str, bytes] | None: ETag и JSON представление упражнения
+            или None, если упражнение не найдено.
+    """
+    if configs.http.FAST_JSON:
+        exercise = await repo.get_columns(uuid, [*DETAIL_COLUMNS, Exercise.version])
+    else:
+        exercise = await repo.get(uuid)
+
+    if exercise is None:
+        return None
+
+    etag = detail_etag(exercise.id, exercise.version)
+    if configs.http.FAST_JSON:
+        content = to_json({column.key: getattr(exercise, column.key) for column in DETAIL_COLUMNS})
+    else:
+        content = DetailExerciseResponse.model_validate(exercise).model_dump_json().encode()
+
+    detail_cache.set(uuid, (etag, content), epoch)
+    logger.success(f"Exercise received: ({exercise.seq_number}){exercise.id}")
+
+    return etag, content
+
+
+@router.post("/batch-get", summary="Получить детальную информацию о нескольких упражнениях")
+async def get_exercises_batch(
+    data: Annotated[BatchGetExerciseRequest, Body(...)],
+    repo: ExerciseRepository = Depends(get_read_repository),
+) -> BatchGetExerciseResponse:
+    """Возвращает полную информацию об упражнениях по списку UUID одним запросом к БД.
+
+    Упражнения возвращаются в порядке запроса, повторяющиеся UUID учитываются
+    один раз, а не найденные UUID перечисляются отдельно.
+    """
+    logger.info("Getting information about a batch of exercises...")
+    uuids = list(dict.fromkeys(data.ids))
+    found = {exercise.id: exercise for exercise in await repo.get_many(uuids)}
+
+    items = [DetailExerciseResponse.model_validate(found[uuid]) for uuid in uuids if uuid in found]
+    missing = [uuid for uuid in uuids if uuid not in found]
+    if missing:
+        logger.warning(f"Exercises not found: {len(missing)}")
+
+    logger.success(f"Received {len(items)} exercises.")
+
+    return BatchGetExerciseResponse(items=items, missing=missing)
 
 
 @router.post("/", summary="Добавить упражнение в систему")
 async def create_text(
     data: Annotated[CreateExerciseRequest, Body(...)],
-    db: AsyncSession = Depends(get_db),
+    repo: ExerciseRepository = Depends(get_repository),
 ) -> CreateExerciseResponse:
     """Добавляет новое упражнение в систему."""
 
     logger.info("Creating an exercise...")
     try:
-        exercise = Exercise(
-            title=data.title,
-            difficulty=data.difficulty,
-            tags=data.tags,
-            text_id=data.text_id,
-        )
-        db.add(exercise)
-        await db.commit()
-        await db.refresh(exercise)
+        exercise = await repo.create(data.model_dump())
+        await repo.db.commit()
+        _written(ExerciseChange(op="insert", id=exercise.id))
 
     except IntegrityError:
-        await db.rollback()
+        await repo.db.rollback()
         detail = "Exercise with this data already exists."
         logger.error(detail)
         raise HTTPException(
@@ -104,7 +615,7 @@ async def create_text(
         )
 
     except Exception as error:
-        await db.rollback()
+        await repo.db.rollback()
         detail = f"An error ocured while creating exercise: {error}"
         logger.error(detail)
         raise HTTPException(
@@ -118,18 +629,190 @@ async def create_text(
     return item
 
 
+@router.post(
+    "/bulk",
+    summary="Массово добавить упражнения в систему",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "description": "Поток упражнений в формате NDJSON или JSON массив",
+            "content": {
+                "application/x-ndjson": {"schema": {"type": "string"}},
+                "application/json": {
+                    "schema": {
+                        "type": "array",
+                        "items": {"$ref": "#/components/schemas/CreateExerciseRequest"},
+                    }
+                },
+            },
+        }
+    },
+)
+async def create_texts_bulk(
+    request: Request,
+    response: Response,
+    mode: Annotated[
+        Literal["atomic", "best_effort"],
+        Query(description="atomic - все или ничего, best_effort - добавить все корректные"),
+    ] = "atomic",
+    repo: ExerciseRepository = Depends(get_repository),
+) -> BulkCreateExerciseResponse:
+    """Добавляет в систему пакет упражнений, переданный потоком.
+
+    Тело запроса читается и проверяется по мере поступления, а корректные
+    упражнения добавляются пачками многострочными INSERT, поэтому объем
+    занимаемой памяти не зависит от размера пакета.
+
+    В режиме atomic любая ошибка отменяет добавление всего пакета (ответ 422).
+    В режиме best_effort каждая пачка фиксируется отдельно, а отклоняются
+    только некорректные упражнения. Если поток оказывается поврежден или
+    превышает допустимое число упражнений после фиксации части пачек,
+    ответ 400 содержит итог по каждому упражнению и описание ошибки.
+    """
+    logger.info(f"Bulk creating exercises ({mode})...")
+    atomic = mode == "atomic"
+    results: list[BulkExerciseResult] = []
+    batch: list[tuple[BulkExerciseResult, dict]] = []
+    aborted = False
+    stream_error = None
+
+    async def flush() -> None:
+        nonlocal aborted
+        if not batch:
+            return
+
+        try:
+            # В режиме atomic пачка вставляется в точке сохранения: ошибка не прерывает
+            # транзакцию, и некорректные упражнения можно найти по одному
+            async with repo.db.begin_nested() if atomic else nullcontext():
+                rows = await repo.create_many([values for _, values in batch])
+
+            if not atomic:
+                await repo.db.commit()
+
+            for (result, _), row in zip(batch, rows):
+                result.status, result.id, result.seq_number = "created", row.id, row.seq_number
+
+        except DBAPIError:
+            if atomic:
+                aborted = True
+                # Пачка отклонена целиком - выясняем, какие именно упражнения некорректны.
+                # Остальные упражнения пачки остаются пропущенными
+                for result, values in batch:
+                    try:
+                        async with repo.db.begin_nested():
+                            await repo.create_many([values])
+
+                    except DBAPIError as error:
+                        result.status, result.error = "failed", str(error.orig)
+            else:
+                await repo.db.rollback()
+                # Пачка отклонена целиком - выясняем, какие именно упражнения некорректны
+                for result, values in batch:
+                    try:
+                        [row] = await repo.create_many([values])
+                        await repo.db.commit()
+                        result.status, result.id, result.seq_number = (
+                            "created",
+                            row.id,
+                            row.seq_number,
+                        )
+
+                    except DBAPIError as error:
+                        await repo.db.rollback()
+                        result.status, result.error = "failed", str(error.orig)
+
+        batch.clear()
+
+    try:
+        items = iter_json_items(request.stream(), configs.bulk.MAX_ITEM_SIZE)
+        async for item in items:
+            if len(results) >= configs.bulk.MAX_ITEMS:
+                raise StreamFormatError(
+                    f"Too many items in bulk request (limit {configs.bulk.MAX_ITEMS})."
+                )
+
+            result = BulkExerciseResult(index=len(results), status="skipped")
+            results.append(result)
+            try:
+                if isinstance(item, ValueError):
+                    raise item
+
+                data = CreateExerciseRequest.model_validate(item)
+
+            except ValueError as error:
+                aborted = aborted or atomic
+                result.status, result.error = "failed", _describe_error(error)
+                continue
+
+            if not aborted:
+                batch.append((result, data.model_dump()))
+                if len(batch) >= configs.bulk.BATCH_SIZE:
+                    await flush()
+
+        if not aborted:
+            await flush()
+
+        if atomic and not aborted:
+            await repo.db.commit()
+
+    except StreamFormatError as error:
+        await repo.db.rollback()
+        detail = f"Invalid bulk request body: {error}"
+        logger.error(detail)
+        if atomic or not any(result.status == "created" for result in results):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=detail,
+            )
+
+        # Уже зафиксированные пачки не отменить - клиент получает итог по каждому упражнению
+        stream_error = detail
+        response.status_code = status.HTTP_400_BAD_REQUEST
+
+    except Exception as error:
+        await repo.db.rollback()
+        detail = f"An error ocured while creating exercises: {error}"
+        logger.error(detail)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=detail,
+        )
+
+    if aborted:
+        await repo.db.rollback()
+        for result in results:
+            if result.status == "created":
+                result.status, result.id, result.seq_number = "skipped", None, None
+
+        response.status_code = status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    created = sum(result.status == "created" for result in results)
+    failed = sum(result.status == "failed" for result in results)
+    if created:
+        _written(ExerciseChange(op="insert"))
+
+    if failed:
+        logger.warning(f"Bulk request has {failed} rejected exercises.")
+
+    logger.success(f"Exercises have been created in bulk: {created}")
+
+    return BulkCreateExerciseResponse(
+        mode=mode, created=created, failed=failed, items=results, error=stream_error
+    )
+
+
 @router.delete("/{uuid}", summary="Удалить упражнение из системы")
 async def delete_text(
     uuid: Annotated[UUID, Path(...)],
-    db: AsyncSession = Depends(get_db),
+    repo: ExerciseRepository = Depends(get_repository),
 ) -> DeleteExerciseResponse:
     """Удаляет упражнение из системы по его UUID."""
     logger.info("Deleting an exercise...")
-    stmt = select(Exercise).where(Exercise.id == uuid)
-    result = await db.execute(stmt)
-    exercise = result.scalar_one_or_none()
+    deleted = await repo.delete(uuid)
 
-    if exercise is None:
+    if deleted is None:
+        await repo.db.rollback()
         detail = "Exercise not found."
         logger.error(detail)
         raise HTTPException(
@@ -137,10 +820,10 @@ async def delete_text(
             detail=detail,
         )
 
-    await db.delete(exercise)
-    await db.commit()
+    await repo.db.commit()
+    _written(ExerciseChange(op="delete", id=uuid))
 
-    item = DeleteExerciseResponse.model_validate(exercise)
+    item = DeleteExerciseResponse.model_validate(deleted)
     logger.success(f"Exercise has been deleted: ({item.seq_number}){item.id}")
 
     return item
@@ -150,33 +833,18 @@ async def delete_text(
 async def update_text(
     uuid: Annotated[UUID, Path(...)],
     data: Annotated[UpdateExerciseRequest, Body(...)],
-    db: AsyncSession = Depends(get_db),
+    repo: ExerciseRepository = Depends(get_repository),
 ) -> UpdateExerciseResponse:
     """Обновляет данные упражнения по его UUID."""
     logger.info("Updating an exercise...")
-    stmt = select(Exercise).where(Exercise.id == uuid)
-    result = await db.execute(stmt)
-    exercise = result.scalar_one_or_none()
-
-    if exercise is None:
-        detail = "Exercise not found."
-        logger.error(detail)
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Exercise not found.",
-        )
-
     try:
-        data = data.model_dump(exclude_none=True)
-        for field in data:
-            setattr(exercise, field, data[field])
-
-        db.add(exercise)
-        await db.commit()
-        await db.refresh(exercise)
+        exercise = await repo.update(uuid, data.model_dump(exclude_none=True))
+        if exercise is not None:
+            await repo.db.commit()
+            _written(ExerciseChange(op="update", id=uuid))
 
     except IntegrityError:
-        await db.rollback()
+        await repo.db.rollback()
         detail = "Exercise with this data already exists."
         logger.error(detail)
         raise HTTPException(
@@ -185,13 +853,22 @@ async def update_text(
         )
 
     except Exception as error:
-        await db.rollback()
+        await repo.db.rollback()
         detail = f"An error ocured while updating exercise: {error}"
         logger.error(detail)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=detail,
         )
+
+    if exercise is None:
+        detail = "Exercise not found."
+        logger.error(detail)
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=detail,
+        )
+
     item = UpdateExerciseResponse.model_validate(exercise)
     logger.success(f"Exercise has been updated: ({item.seq_number}){item.id}")
 
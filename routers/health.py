@@ -2,13 +2,25 @@ import datetime
 import platform
 import socket
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Response, status
 from fastapi.responses import JSONResponse
+from pydantic_core import to_json
 
+from database import readiness
 from service_logging import logger
 
 router = APIRouter(prefix="/health")
 
+# Данные о хост-системе не меняются за время работы процесса
+SYSTEM = {
+    "hostname": socket.gethostname(),
+    "os": platform.system(),
+    "os_version": platform.version(),
+}
+
+# Ответ пробы живости не зависит от состояния сервиса и сериализуется один раз
+LIVE_CONTENT = to_json({"status": "alive"})
+
 
 @router.get(path="", summary="Проверка состояния", tags=["Health"])
 async def health_check() -> JSONResponse:
@@ -18,11 +30,7 @@ async def health_check() -> JSONResponse:
     try:
         health_status = {
             "status": "healthy",
-            "system": {
-                "hostname": socket.gethostname(),
-                "os": platform.system(),
-                "os_version": platform.version(),
-            },
+            "system": SYSTEM,
             "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
         }
 
@@ -34,3 +42,24 @@ async def health_check() -> JSONResponse:
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail=f"Health check failed: {str(error)}",
         )
+
+
+@router.get(path="/live", summary="Проба живости", tags=["Health"])
+async def liveness() -> Response:
+    """Подтверждает, что процесс сервиса запущен и обрабатывает запросы.
+
+    Не обращается к БД и не пишет в лог, поэтому может вызываться сколь угодно часто.
+    """
+    return Response(content=LIVE_CONTENT, media_type="application/json")
+
+
+@router.get(path="/ready", summary="Проба готовности", tags=["Health"])
+async def readiness_check() -> Response:
+    """Сообщает, готов ли сервис принимать запросы.
+
+    Возвращает последний результат фоновой проверки доступности БД,
+    заполненности пула соединений и версии схемы БД, не выполняя
+    запросов к БД. Если сервис не готов, отвечает 503.
+    """
+    status_code = status.HTTP_200_OK if readiness.ready else status.HTTP_503_SERVICE_UNAVAILABLE
+    return Response(content=readiness.content, status_code=status_code, media_type="application/json")
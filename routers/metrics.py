@@ -0,0 +1,65 @@
+from fastapi import APIRouter, Response
+
+from caching import detail_cache, detail_flight, list_flight
+from database import engine
+from metrics import (
+    cache_entries,
+    cache_events,
+    db_pool_checkout_timeouts,
+    db_pool_checkout_wait,
+    db_pool_checkouts,
+    db_pool_connections,
+    db_pool_utilization,
+    log_queue_size,
+    log_records,
+    registry,
+    singleflight_calls,
+)
+from service_logging import log_queue
+
+from .exercises import catalog_snapshot
+
+router = APIRouter()
+
+# Версия текстового формата экспозиции Prometheus
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _collect() -> None:
+    """Обновляет метрики, значения которых считываются в момент экспозиции."""
+    pool = engine.pool.snapshot()
+    for state in ("checked_in", "checked_out", "overflow"):
+        db_pool_connections.set(pool[state], state)
+
+    db_pool_utilization.set(pool["utilization"])
+    db_pool_checkouts.set(pool["checkouts"])
+    db_pool_checkout_timeouts.set(pool["timeouts"])
+    db_pool_checkout_wait.set(pool["wait_seconds_total"])
+
+    stats = detail_cache.stats()
+    cache_entries.set(stats["size"], "detail")
+    for event in ("hits", "misses", "evictions", "expirations", "invalidations"):
+        cache_events.set(stats[event], "detail", event)
+
+    stats = catalog_snapshot.stats()
+    cache_entries.set(stats["size"], "snapshot")
+    for event in ("hits", "misses", "loads", "failures"):
+        cache_events.set(stats[event], "snapshot", event)
+
+    for flight, calls in (("detail", detail_flight), ("list", list_flight)):
+        stats = calls.stats()
+        for outcome in ("leaders", "coalesced"):
+            singleflight_calls.set(stats[outcome], flight, outcome)
+
+    if log_queue is not None:
+        stats = log_queue.stats()
+        log_queue_size.set(stats["queued"])
+        for outcome in ("enqueued", "dropped", "written", "errors"):
+            log_records.set(stats[outcome], outcome)
+
+
+@router.get(path="/metrics", summary="Метрики Prometheus", tags=["Stats"])
+async def metrics() -> Response:
+    """Возвращает метрики сервиса в текстовом формате экспозиции Prometheus."""
+    _collect()
+    return Response(content=registry.render(), media_type=CONTENT_TYPE)
@@ -0,0 +1,29 @@
+from fastapi import APIRouter
+
+from caching import detail_cache, detail_flight, list_flight
+from database import engine
+from service_logging import logger
+
+from .exercises import catalog_snapshot
+
+router = APIRouter(prefix="/stats")
+
+
+@router.get(path="/cache", summary="Статистика кешей", tags=["Stats"])
+async def cache_stats() -> dict[str, dict[str, int]]:
+    """Возвращает счетчики попаданий, промахов и вытеснений кешей сервиса
+    и счетчики объединения одновременных чтений."""
+    logger.info("Getting cache statistics...")
+    return {
+        "detail": detail_cache.stats(),
+        "detail_singleflight": detail_flight.stats(),
+        "list_singleflight": list_flight.stats(),
+        "snapshot": catalog_snapshot.stats(),
+    }
+
+
+@router.get(path="/pool", summary="Статистика пула соединений с БД", tags=["Stats"])
+async def pool_stats() -> dict[str, int | float]:
+    """Возвращает состояние пула соединений и время ожидания выдачи соединений."""
+    logger.info("Getting connection pool statistics...")
+    return engine.pool.snapshot()
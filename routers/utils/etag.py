@@ -0,0 +1,68 @@
+import hashlib
+from uuid import UUID
+
+from fastapi import Response, status
+
+from configs import configs
+
+
+def detail_etag(uuid: UUID, version: int) -> str:
+    """Возвращает сильный ETag упражнения, производный от версии строки.
+
+    Args:
+        uuid (UUID): Идентификатор упражнения.
+        version (int): Версия упражнения.
+
+    Returns:
+        str: Значение заголовка ETag.
+    """
+    return f'"{uuid.hex}.{version}"'
+
+
+def list_etag(catalog_version: int, query: str) -> str:
+    """Возвращает слабый ETag страницы списка, производный от версии каталога.
+
+    ETag слабый, так как общее количество объектов на странице может быть
+    получено из кеша или оценки и не определяется версией каталога однозначно.
+
+    Args:
+        catalog_version (int): Версия каталога упражнений.
+        query (str): Строка запроса, определяющая содержимое страницы.
+
+    Returns:
+        str: Значение заголовка ETag.
+    """
+    digest = hashlib.blake2b(query.encode(), digest_size=8).hexdigest()
+    return f'W/"{catalog_version}.{digest}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Проверяет заголовок If-None-Match по правилам слабого сравнения.
+
+    Args:
+        if_none_match (str | None): Значение заголовка If-None-Match.
+        etag (str): Текущий ETag ресурса.
+
+    Returns:
+        bool: True, если клиент уже имеет актуальную версию ресурса.
+    """
+    if not if_none_match:
+        return False
+
+    if if_none_match.strip() == "*":
+        return True
+
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+
+def cache_headers(etag: str) -> dict[str, str]:
+    """Возвращает заголовки кеширования для ответа с данным ETag."""
+    max_age = configs.http.CACHE_MAX_AGE
+    cache_control = f"max-age={max_age}, must-revalidate" if max_age > 0 else "no-cache"
+    return {"ETag": etag, "Cache-Control": cache_control}
+
+
+def not_modified(etag: str) -> Response:
+    """Возвращает ответ 304 Not Modified без тела."""
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers(etag))
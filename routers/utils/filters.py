@@ -0,0 +1,79 @@
+from typing import Annotated, Literal
+
+from fastapi import Query
+from pydantic import BaseModel, Field
+from sqlalchemy import ColumnElement, Row
+
+from database.models import Exercise
+from database.repository import LIKE_ESCAPES
+from database.types import ExerciseLang, ExerciseTag
+
+ExerciseSort = Literal["seq_number", "-seq_number", "difficulty", "-difficulty"]
+
+
+class ExerciseFilters(BaseModel):
+    """Класс Query параметров фильтрации и сортировки списка упражнений."""
+
+    difficulty_min: int | None = Field(ge=0, default=None, description="Минимальная сложность")
+    difficulty_max: int | None = Field(ge=0, default=None, description="Максимальная сложность")
+    lang: ExerciseLang | None = Field(default=None, description="Язык упражнения")
+    tags: list[ExerciseTag] = Field(default=[], description="Теги, которые есть у упражнения")
+    title_prefix: str | None = Field(
+        min_length=1, max_length=50, default=None, description="Начало названия упражнения"
+    )
+    sort: ExerciseSort = Field(
+        default="seq_number", description="Поле сортировки, '-' - по убыванию"
+    )
+
+    def __init__(
+        self,
+        tags: Annotated[
+            list[ExerciseTag], Query(description="Теги, которые есть у упражнения")
+        ] = [],
+        **data,
+    ) -> None:
+        # Без явного Query списочный параметр в Depends() считается телом запроса
+        super().__init__(tags=tags, **data)
+
+    def clauses(self) -> list[ColumnElement[bool]]:
+        """Возвращает условия выборки, соответствующие фильтрам."""
+        clauses = []
+        if self.difficulty_min is not None:
+            clauses.append(Exercise.difficulty >= self.difficulty_min)
+
+        if self.difficulty_max is not None:
+            clauses.append(Exercise.difficulty <= self.difficulty_max)
+
+        if self.lang is not None:
+            clauses.append(Exercise.lang == self.lang)
+
+        if self.tags:
+            clauses.append(Exercise.tags.op("@>")(self.tags))
+
+        if self.title_prefix is not None:
+            # Шаблон передается целиком, чтобы планировщик мог использовать
+            # индекс ix_exercises_title_prefix (text_pattern_ops) по префиксу
+            escaped = self.title_prefix.translate(LIKE_ESCAPES)
+            clauses.append(Exercise.title.like(f"{escaped}%", escape="/"))
+
+        return clauses
+
+    def matches(self, exercise: Row | Exercise) -> bool:
+        """Проверяет упражнение в памяти процесса по тем же условиям, что и clauses()."""
+        return (
+            (self.difficulty_min is None or exercise.difficulty >= self.difficulty_min)
+            and (self.difficulty_max is None or exercise.difficulty <= self.difficulty_max)
+            and (self.lang is None or exercise.lang == self.lang)
+            and all(tag in exercise.tags for tag in self.tags)
+            and (self.title_prefix is None or exercise.title.startswith(self.title_prefix))
+        )
+
+    @property
+    def filtered(self) -> bool:
+        """Заданы ли фильтры, ограничивающие набор записей."""
+        return self.key != "{}"
+
+    @property
+    def key(self) -> str:
+        """Ключ, однозначно описывающий набор отфильтрованных записей."""
+        return self.model_dump_json(exclude={"sort"}, exclude_defaults=True)
@@ -1,6 +1,11 @@
-from typing import Generic, TypeVar
+import base64
+from enum import Enum
+from typing import Generic, Self, TypeVar
 
-from pydantic import BaseModel, Field, computed_field
+from pydantic import BaseModel, Field, computed_field, model_validator
+
+from database.counting import CountStrategy
+from database.repository import SORT_KEYS
 
 M = TypeVar("M", bound=BaseModel)
 
@@ -18,16 +23,111 @@ class Pagination(BaseModel):
         return (self.page - 1) * self.size
 
 
+class CursorPagination(BaseModel):
+    """Класс Query параметров курсорной (keyset) пагинации.
+
+    Если курсор передан, номер страницы игнорируется, а выборка
+    продолжается от позиции, закодированной в курсоре.
+    """
+
+    cursor: str | None = Field(
+        default=None,
+        description="Курсор страницы (next_cursor или prev_cursor из предыдущего ответа)",
+    )
+
+
+class CursorDirection(str, Enum):
+    """Направление чтения относительно позиции курсора."""
+
+    NEXT = "next"
+    PREV = "prev"
+
+
+class Cursor(BaseModel):
+    """Позиция keyset-пагинации в отсортированном списке.
+
+    Хранит значения ключа сортировки граничной записи. Последним значением
+    ключа всегда является seq_number, однозначно упорядочивающий записи.
+    """
+
+    sort: str = Field(default="seq_number", description="Сортировка, для которой выдан курсор")
+    values: list[int] = Field(min_length=1, description="Значения ключа граничной записи")
+    direction: CursorDirection = Field(description="Направление чтения")
+
+    @model_validator(mode="after")
+    def check_key(self) -> Self:
+        """Проверяет, что значения курсора соответствуют ключу его сортировки."""
+        keys = SORT_KEYS.get(self.sort.lstrip("-"))
+        if keys is None:
+            raise ValueError(f"Unknown cursor sort: {self.sort}.")
+
+        if len(self.values) != len(keys):
+            raise ValueError(f"Cursor for sort {self.sort} must hold {len(keys)} values.")
+
+        return self
+
+    def encode(self) -> str:
+        """Кодирует курсор в непрозрачный для клиента токен.
+
+        Returns:
+            str: Токен курсора.
+        """
+        raw = self.model_dump_json().encode()
+        return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+    @classmethod
+    def decode(cls, token: str) -> Self:
+        """Восстанавливает курсор из токена.
+
+        Args:
+            token (str): Токен курсора.
+
+        Raises:
+            ValueError: Токен поврежден или имеет неверный формат.
+
+        Returns:
+            Cursor: Позиция keyset-пагинации.
+        """
+        padding = "=" * (-len(token) % 4)
+        raw = base64.urlsafe_b64decode(token + padding)
+        return cls.model_validate_json(raw)
+
+
 class PaginatedResponse(BaseModel, Generic[M]):
     """Класс ответа с пагинацией."""
 
     items: list[M] = Field(description="Список объектов")
-    page: int = Field(gt=0, description="Номер страницы")
+    page: int | None = Field(
+        gt=0, default=None, description="Номер страницы (отсутствует при курсорной пагинации)"
+    )
     size: int = Field(ge=0, description="Размер страницы")
-    total: int = Field(ge=0, description="Всего объектов")
+    total: int | None = Field(ge=0, default=None, description="Всего объектов")
+    total_strategy: CountStrategy = Field(
+        default=CountStrategy.EXACT, description="Способ получения общего количества объектов"
+    )
+    next_cursor: str | None = Field(default=None, description="Курсор следующей страницы")
+    prev_cursor: str | None = Field(default=None, description="Курсор предыдущей страницы")
+
+    def dump_json_with_items(self, items: bytes) -> bytes:
+        """Сериализует ответ, подставляя заранее сериализованный список объектов.
+
+        Позволяет не создавать модели для каждого объекта страницы, если
+        объекты уже сериализованы напрямую из строк БД.
+
+        Args:
+            items (bytes): JSON массив объектов страницы.
+
+        Returns:
+            bytes: JSON ответа.
+        """
+        envelope = self.model_dump_json(exclude={"items"}).encode()
+        return b'{"items":' + items + b"," + envelope[1:]
 
     @computed_field(description="Всего страниц")
     @property
-    def total_pages(self) -> int:
+    def total_pages(self) -> int | None:
         """Количество страниц всего."""
+        if self.total is None or self.size == 0:
+            return None
+
         return (self.total + self.size - 1) // self.size
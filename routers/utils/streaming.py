@@ -0,0 +1,234 @@
+import codecs
+import csv
+import io
+import json
+from collections.abc import AsyncIterator, Sequence
+from typing import Any
+
+from pydantic import BaseModel
+
+_WHITESPACE = " \t\r\n"
+_decoder = json.JSONDecoder()
+
+
+class StreamFormatError(ValueError):
+    """Поток нельзя разобрать как NDJSON или JSON массив."""
+
+
+async def iter_json_items(
+    chunks: AsyncIterator[bytes], max_item_size: int
+) -> AsyncIterator[Any | json.JSONDecodeError]:
+    """Инкрементально разбирает тело запроса на отдельные JSON объекты.
+
+    Формат определяется по первому значащему символу: '[' означает JSON
+    массив, иначе поток считается NDJSON (один объект на строку). В памяти
+    одновременно находится не более одного незавершенного объекта.
+
+    Для NDJSON ошибка разбора строки не прерывает поток: вместо объекта
+    возвращается исключение JSONDecodeError. Ошибка в JSON массиве делает
+    продолжение разбора невозможным и приводит к StreamFormatError.
+
+    Args:
+        chunks (AsyncIterator[bytes]): Поток фрагментов тела запроса.
+        max_item_size (int): Максимальный размер одного объекта в символах.
+
+    Raises:
+        StreamFormatError: Поток поврежден или объект превышает допустимый размер.
+
+    Yields:
+        Any | json.JSONDecodeError: Разобранный объект или ошибка разбора строки NDJSON.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    buffer = ""
+    array: _ArraySplitter | None = None
+    ndjson = False
+
+    async for chunk in chunks:
+        text = decoder.decode(chunk)
+        if array is None and not ndjson:
+            buffer = (buffer + text).lstrip(_WHITESPACE)
+            if not buffer:
+                continue
+
+            if buffer.startswith("["):
+                array, text, buffer = _ArraySplitter(), buffer[1:], ""
+            else:
+                ndjson, text, buffer = True, buffer, ""
+
+        if array is not None:
+            items, error = array.feed(text)
+            pending = array.buffer
+        else:
+            items, buffer = _split_lines(buffer + text)
+            error, pending = None, buffer
+
+        for item in items:
+            yield item
+
+        if error is not None:
+            raise error
+
+        if len(pending) > max_item_size:
+            raise StreamFormatError("Item exceeds the maximum allowed size.")
+
+    text = decoder.decode(b"", final=True)
+    if array is not None:
+        items, error = array.feed(text, final=True)
+        for item in items:
+            yield item
+
+        if error is not None:
+            raise error
+
+    elif ndjson:
+        items, _ = _split_lines(buffer + text + "\n")
+        for item in items:
+            yield item
+
+
+def _split_lines(buffer: str) -> tuple[list[Any], str]:
+    items = []
+    *lines, rest = buffer.split("\n")
+    for line in lines:
+        if not line.strip(_WHITESPACE):
+            continue
+
+        try:
+            items.append(json.loads(line))
+        except json.JSONDecodeError as error:
+            items.append(error)
+
+    return items, rest
+
+
+class _ArraySplitter:
+    """Разбирает элементы JSON массива, получаемого по частям.
+
+    Открывающая скобка массива к моменту создания уже прочитана. Элемент
+    возвращается, только когда он получен целиком, поэтому результат
+    не зависит от того, как тело запроса разбито на фрагменты.
+    """
+
+    # Ожидаемый следующий токен
+    FIRST, VALUE, SEPARATOR, END = range(4)
+
+    def __init__(self) -> None:
+        self.buffer = ""
+        self.state = self.FIRST
+
+    def feed(self, text: str, final: bool = False) -> tuple[list[Any], StreamFormatError | None]:
+        """Добавляет фрагмент текста и возвращает полученные целиком элементы.
+
+        Args:
+            text (str): Очередной фрагмент текста.
+            final (bool): Фрагмент последний, продолжения не будет.
+
+        Returns:
+            tuple[list[Any], StreamFormatError | None]: Элементы и ошибка
+                формата, если она обнаружена после них.
+        """
+        buffer = self.buffer + text
+        items: list[Any] = []
+        error = None
+        pos = 0
+        while True:
+            while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                pos += 1
+
+            if pos >= len(buffer):
+                break
+
+            char = buffer[pos]
+            if self.state == self.END:
+                error = StreamFormatError("Unexpected data after the JSON array.")
+                break
+
+            if self.state == self.SEPARATOR or (self.state == self.FIRST and char == "]"):
+                if char == ",":
+                    self.state = self.VALUE
+                elif char == "]":
+                    self.state = self.END
+                else:
+                    error = StreamFormatError("Expected ',' or ']' between array items.")
+                    break
+
+                pos += 1
+                continue
+
+            if char in ",]":
+                error = StreamFormatError("Expected an array item.")
+                break
+
+            try:
+                item, end = _decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if final:
+                    error = StreamFormatError("Malformed JSON array item.")
+                # Иначе элемент еще не получен целиком - дочитываем поток
+                break
+
+            # Число, за которым не следует разделитель, может продолжиться
+            # в следующем фрагменте: "4." или "1e" разбираются как 4 и 1
+            if (
+                not final
+                and char not in '{["'
+                and (end == len(buffer) or buffer[end] not in _WHITESPACE + ",]")
+            ):
+                break
+
+            items.append(item)
+            self.state = self.SEPARATOR
+            pos = end
+
+        self.buffer = buffer[pos:]
+        if final and error is None and self.state != self.END:
+            error = StreamFormatError("Malformed or unterminated JSON array.")
+
+        return items, error
+
+
+def to_ndjson(models: Sequence[BaseModel]) -> bytes:
+    """Сериализует модели в NDJSON, по одной модели на строку.
+
+    Args:
+        models (Sequence[BaseModel]): Сериализуемые модели.
+
+    Returns:
+        bytes: Фрагмент NDJSON потока.
+    """
+    return "".join(model.model_dump_json() + "\n" for model in models).encode()
+
+
+def csv_header(model: type[BaseModel]) -> bytes:
+    """Возвращает строку заголовка CSV с именами полей модели.
+
+    Args:
+        model (type[BaseModel]): Класс сериализуемых моделей.
+
+    Returns:
+        bytes: Строка заголовка CSV.
+    """
+    output = io.StringIO()
+    csv.writer(output).writerow(model.model_fields.keys())
+    return output.getvalue().encode()
+
+
+def to_csv(models: Sequence[BaseModel]) -> bytes:
+    """Сериализует модели в строки CSV. Списки объединяются через ';'.
+
+    Args:
+        models (Sequence[BaseModel]): Сериализуемые модели одного типа.
+
+    Returns:
+        bytes: Фрагмент CSV потока.
+    """
+    output = io.StringIO()
+    writer = csv.writer(output)
+    for model in models:
+        data = model.model_dump(mode="json")
+        writer.writerow(
+            ";".join(map(str, value)) if isinstance(value, list) else value
+            for value in data.values()
+        )
+
+    return output.getvalue().encode()
@@ -1,4 +1,8 @@
 from .schemas import (
+    BatchGetExerciseRequest,
+    BatchGetExerciseResponse,
+    BulkCreateExerciseResponse,
+    BulkExerciseResult,
     CreateExerciseRequest,
     CreateExerciseResponse,
     DeleteExerciseResponse,
@@ -16,4 +20,8 @@ __all__ = (
     "DeleteExerciseResponse",
     "UpdateExerciseRequest",
     "UpdateExerciseResponse",
+    "BulkExerciseResult",
+    "BulkCreateExerciseResponse",
+    "BatchGetExerciseRequest",
+    "BatchGetExerciseResponse",
 )
@@ -1,3 +1,4 @@
+from typing import Literal
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -138,3 +139,46 @@ class UpdateExerciseResponse(BaseSchema):
     tags: list[ExerciseTag] = Field(
         description="Теги упражнения", default=[], examples=TAGS_EXAMPLES
     )
+
+
+class BulkExerciseResult(BaseSchema):
+    """Результат добавления одного упражнения из пакета."""
+
+    index: int = Field(description="Порядковый номер упражнения в пакете", ge=0)
+    status: Literal["created", "failed", "skipped"] = Field(description="Итог обработки")
+    id: UUID | None = Field(
+        description="Идентификатор упражнения", default=None, examples=ID_EXAMPLES
+    )
+    seq_number: int | None = Field(
+        description="Номер упражнения", gt=0, default=None, examples=SEQ_NUMBER_EXAMPLES
+    )
+    error: str | None = Field(description="Причина ошибки", default=None)
+
+
+class BulkCreateExerciseResponse(BaseSchema):
+    """Данные, отправляемые в ответ на запрос массового добавления упражнений."""
+
+    mode: Literal["atomic", "best_effort"] = Field(description="Режим добавления")
+    created: int = Field(description="Количество добавленных упражнений", ge=0)
+    failed: int = Field(description="Количество отклоненных упражнений", ge=0)
+    items: list[BulkExerciseResult] = Field(description="Результаты по каждому упражнению")
+    error: str | None = Field(description="Ошибка, прервавшая обработку пакета", default=None)
+
+
+class BatchGetExerciseRequest(BaseSchema):
+    """Данные для получения деталей сразу о нескольких упражнениях."""
+
+    ids: list[UUID] = Field(
+        description="Идентификаторы упражнений", min_length=1, max_length=500, examples=[ID_EXAMPLES]
+    )
+
+
+class BatchGetExerciseResponse(BaseSchema):
+    """Данные, отправляемые в ответ на запрос получения нескольких упражнений."""
+
+    items: list[DetailExerciseResponse] = Field(
+        description="Найденные упражнения в порядке запроса"
+    )
+    missing: list[UUID] = Field(
+        description="Идентификаторы, упражнения по которым не найдены", examples=[ID_EXAMPLES]
+    )
@@ -1,5 +1,5 @@
 from .setup import setup_logger
 
-logger = setup_logger()
+logger, log_queue = setup_logger()
 
-__all__ = ("logger",)
+__all__ = ("logger", "log_queue")
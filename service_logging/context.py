@@ -0,0 +1,5 @@
+from contextvars import ContextVar
+
+# Идентификатор обрабатываемого запроса. Устанавливается RequestIDMiddleware
+# и доступен в любом коде, выполняемом в рамках запроса
+request_id: ContextVar[str | None] = ContextVar("request_id", default=None)
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import json
+import socket
+import traceback
+import zlib
+from typing import Literal
+
+import loguru
+from graypy.handler import GELFTruncatingChunker
+
+# Уровни syslog, которыми GELF обозначает важность записи
+SYSLOG_LEVELS = {
+    "TRACE": 7,
+    "DEBUG": 7,
+    "INFO": 6,
+    "SUCCESS": 6,
+    "WARNING": 4,
+    "ERROR": 3,
+    "CRITICAL": 2,
+}
+
+
+def gelf_message(record: loguru.Record, host: str, facility: str | None = None) -> dict:
+    """Возвращает сообщение GELF 1.1, построенное из записи лога loguru.
+
+    Поле facility обязательно для усечения сообщений, не помещающихся
+    в предельное число UDP чанков GELF.
+
+    Args:
+        record (loguru.Record): Запись лога.
+        host (str): Имя хоста-источника.
+        facility (str | None): Источник записи. По умолчанию имя логера.
+
+    Returns:
+        dict: Сообщение GELF.
+    """
+    message = {
+        "version": "1.1",
+        "host": host,
+        "short_message": record["message"],
+        "timestamp": record["time"].timestamp(),
+        "level": SYSLOG_LEVELS.get(record["level"].name, 6),
+        "facility": facility or record["name"],
+        "_level_name": record["level"].name,
+        "_logger": record["name"],
+        "_file": record["file"].name,
+        "_line": record["line"],
+        "_function": record["function"],
+    }
+    if record["exception"] is not None:
+        message["full_message"] = "".join(traceback.format_exception(*record["exception"]))
+
+    for key, value in record["extra"].items():
+        # Поле _id зарезервировано GELF
+        if key != "id":
+            message[f"_{key}"] = value
+
+    return message
+
+
+class GELFSender:
+    """Пакетно отправляет записи лога в Graylog по протоколу GELF.
+
+    По UDP каждое сообщение сжимается и при необходимости разбивается
+    на чанки GELF. По TCP сообщения пакета передаются одной записью
+    в сокет, разделенные нулевым байтом.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        protocol: Literal["udp", "tcp"] = "udp",
+        chunk_size: int = 1420,
+        facility: str | None = None,
+    ) -> None:
+        """
+        Args:
+            host (str): Адрес Graylog.
+            port (int): Порт GELF входа Graylog.
+            protocol (Literal["udp", "tcp"]): Транспорт.
+            chunk_size (int): Максимальный размер UDP датаграммы в байтах.
+            facility (str | None): Источник записей, например имя сервиса.
+        """
+        self.address = (host, port)
+        self.protocol = protocol
+        self.chunk_size = chunk_size
+        self.facility = facility
+        self.source = socket.gethostname()
+        self._chunker = GELFTruncatingChunker(chunk_size=chunk_size, compress=True)
+        self._socket: socket.socket | None = None
+
+    def __call__(self, messages: list[loguru.Message]) -> None:
+        """Отправляет пакет записей лога.
+
+        Args:
+            messages (list[loguru.Message]): Сообщения loguru с исходными записями.
+        """
+        packed = [
+            json.dumps(gelf_message(message.record, self.source, self.facility), default=str).encode()
+            for message in messages
+        ]
+        if self.protocol == "tcp":
+            self._send_tcp(b"\0".join(packed) + b"\0")
+        else:
+            self._send_udp(packed)
+
+    def close(self) -> None:
+        """Закрывает сокет."""
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+
+    def _send_udp(self, packed: list[bytes]) -> None:
+        if self._socket is None:
+            self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+
+        for message in packed:
+            compressed = zlib.compress(message)
+            if len(compressed) <= self.chunk_size:
+                self._socket.sendto(compressed, self.address)
+                continue
+
+            for chunk in self._chunker.chunk_message(compressed):
+                self._socket.sendto(chunk, self.address)
+
+    def _send_tcp(self, payload: bytes) -> None:
+        # Одна повторная попытка с новым соединением, если Graylog закрыл старое
+        for attempt in range(2):
+            try:
+                if self._socket is None:
+                    self._socket = socket.create_connection(self.address, timeout=5.0)
+
+                self._socket.sendall(payload)
+                return
+
+            except OSError:
+                self.close()
+                if attempt:
+                    raise
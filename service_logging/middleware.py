@@ -0,0 +1,67 @@
+import random
+import re
+
+from loguru import logger
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .context import request_id
+
+HEADER = b"x-request-id"
+
+# Допустимый идентификатор запроса от клиента. Ограничение набора символов
+# защищает формат логов и комментарии SQL запросов от внедрения
+VALID_REQUEST_ID = re.compile(r"[A-Za-z0-9._:-]{1,64}")
+
+
+def new_request_id() -> str:
+    """Возвращает новый идентификатор запроса из 16 шестнадцатеричных символов.
+
+    Идентификатор не является криптографически стойким и служит только
+    для связывания записей лога одного запроса.
+    """
+    return f"{random.getrandbits(64):016x}"
+
+
+class RequestIDMiddleware:
+    """ASGI middleware, назначающее запросу идентификатор.
+
+    Идентификатор берется из заголовка X-Request-ID, если клиент передал
+    корректное значение, иначе генерируется. Он добавляется в контекст
+    логера (request_hash), в переменную контекста request_id и в заголовок
+    X-Request-ID ответа.
+
+    Реализовано на уровне ASGI без BaseHTTPMiddleware, поэтому не создает
+    дополнительных задач и не буферизует потоковые ответы.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        value = None
+        for name, header in scope["headers"]:
+            if name == HEADER:
+                value = header.decode("latin-1")
+                break
+
+        if value is None or not VALID_REQUEST_ID.fullmatch(value):
+            value = new_request_id()
+
+        encoded = value.encode()
+
+        async def send_with_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), (HEADER, encoded)]
+
+            await send(message)
+
+        token = request_id.set(value)
+        try:
+            with logger.contextualize(request_hash=value):
+                await self.app(scope, receive, send_with_id)
+        finally:
+            request_id.reset(token)
@@ -1,12 +1,17 @@
 from __future__ import annotations
 
 import sys
+from typing import TextIO
 
-import graypy
 import loguru
 from loguru import logger
 
 from configs import configs
+from configs.graylog import GraylogConfiguration
+from configs.logging import LoggingConfiguration
+
+from .gelf import GELFSender
+from .sinks import JSONWriter, QueueSink, StreamWriter, Writer
 
 
 def loguru_formatter(record: loguru.Record) -> str:
@@ -36,38 +41,84 @@ def loguru_formatter(record: loguru.Record) -> str:
     )
 
 
-def setup_logger() -> loguru.Logger:
+def message_formatter(_record: loguru.Record) -> str:
+    """Возвращает формат, не выполняющий форматирование в вызывающем коде.
+
+    Используется, когда получатели строят вывод из исходной записи лога
+    (JSON, GELF), поэтому исключение также не форматируется заранее.
+    """
+    return "{message}"
+
+
+def setup_logger(
+    stream: TextIO = sys.stdout,
+    config: LoggingConfiguration = configs.logging,
+    graylog: GraylogConfiguration = configs.graylog,
+) -> tuple[loguru.Logger, QueueSink | None]:
     """Функция инициализации кастомного логера loguru.
 
-    В процессе инициализации устанавливается хендлер stdout,
-    с уровнем DEBUG и кастомным оформлением формата лога.
+    В процессе инициализации устанавливается вывод в stdout в текстовом
+    формате с кастомным оформлением либо в формате JSON Lines.
 
     Дополнительно, если в конфигурации проекта установлена
-    переменная GRAYLOG_ENABLE, подключается GELF хендлер
-    для оправки логов в Graylog.
+    переменная GRAYLOG_ENABLE, подключается пакетная отправка
+    логов в Graylog по GELF.
+
+    Если включен режим очереди, запись выполняется фоновым потоком,
+    и вызовы логера не блокируют event loop вводом-выводом.
+
+    Args:
+        stream (TextIO): Поток вывода логов.
+        config (LoggingConfiguration): Настройки логирования.
+        graylog (GraylogConfiguration): Настройки Graylog.
+
+    Returns:
+        tuple[loguru.Logger, QueueSink | None]: Логер и очередь записи,
+            если включен режим очереди.
     """
     logger.remove()
 
-    logger.add(
-        sink=sys.stdout,  # ?
-        format=loguru_formatter,
-        level="DEBUG",
-        colorize=True,
-        backtrace=True,
-        diagnose=True,
-    )
-
-    if configs.graylog.ENABLE:
-        gelf_handler = graypy.GELFUDPHandler(
-            configs.graylog.HOST,
-            configs.graylog.PORT,
+    writers: list[Writer] = []
+    if config.FORMAT == "json":
+        writers.append(JSONWriter(stream))
+    else:
+        writers.append(StreamWriter(stream))
+
+    if graylog.ENABLE:
+        writers.append(
+            GELFSender(
+                graylog.HOST,
+                graylog.PORT,
+                graylog.PROTOCOL,
+                graylog.CHUNK_SIZE,
+                facility=configs.SERVICE_NAME,
+            )
         )
-        logger.add(
-            sink=gelf_handler,
-            format=loguru_formatter,
-            level="DEBUG",
-            backtrace=True,
-            diagnose=True,
+
+    log_queue = None
+    if config.QUEUE_ENABLE:
+        log_queue = QueueSink(
+            writers,
+            maxsize=config.QUEUE_SIZE,
+            batch_size=config.BATCH_SIZE,
+            flush_interval=config.FLUSH_INTERVAL,
         )
+        log_queue.start()
+        sink = log_queue
+    else:
+
+        def sink(message: loguru.Message) -> None:
+            for writer in writers:
+                writer([message])
+
+    text = config.FORMAT == "text"
+    logger.add(
+        sink=sink,
+        format=loguru_formatter if text else message_formatter,
+        level=config.LEVEL,
+        colorize=text,
+        backtrace=config.DIAGNOSE,
+        diagnose=config.DIAGNOSE,
+    )
 
-    return logger.bind(service=configs.SERVICE_NAME)
+    return logger.bind(service=configs.SERVICE_NAME), log_queue
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import atexit
+import json
+import queue
+import sys
+import threading
+import traceback
+from collections.abc import Callable
+from typing import TextIO
+
+import loguru
+
+# Получатель пакета сообщений loguru: поток вывода, отправитель GELF и т.д.
+Writer = Callable[[list["loguru.Message"]], None]
+
+
+class StreamWriter:
+    """Записывает пакет отформатированных сообщений в поток одной операцией."""
+
+    def __init__(self, stream: TextIO) -> None:
+        self.stream = stream
+
+    def __call__(self, messages: list[loguru.Message]) -> None:
+        self.stream.write("".join(messages))
+        self.stream.flush()
+
+
+class JSONWriter:
+    """Записывает пакет сообщений в поток в формате JSON Lines."""
+
+    def __init__(self, stream: TextIO) -> None:
+        self.stream = stream
+
+    def __call__(self, messages: list[loguru.Message]) -> None:
+        self.stream.write("".join(json_line(message.record) for message in messages))
+        self.stream.flush()
+
+
+def json_line(record: loguru.Record) -> str:
+    """Возвращает запись лога в виде строки JSON Lines.
+
+    Args:
+        record (loguru.Record): Запись лога.
+
+    Returns:
+        str: Строка JSON с переводом строки в конце.
+    """
+    data = {
+        "time": record["time"].isoformat(),
+        "level": record["level"].name,
+        "message": record["message"],
+        "logger": record["name"],
+        "file": record["file"].name,
+        "line": record["line"],
+        **record["extra"],
+    }
+    if record["exception"] is not None:
+        data["exception"] = "".join(traceback.format_exception(*record["exception"]))
+
+    return json.dumps(data, ensure_ascii=False, default=str) + "\n"
+
+
+class QueueSink:
+    """Sink loguru, передающий запись и вывод сообщений фоновому потоку.
+
+    Вызов sink только помещает сообщение в ограниченную очередь и не
+    выполняет ввод-вывод в event loop. Фоновый поток забирает сообщения
+    пакетами и передает их получателям. Если очередь заполнена, сообщение
+    отбрасывается и учитывается в счетчике dropped.
+    """
+
+    def __init__(
+        self,
+        writers: list[Writer],
+        maxsize: int = 10_000,
+        batch_size: int = 256,
+        flush_interval: float = 0.5,
+    ) -> None:
+        """
+        Args:
+            writers (list[Writer]): Получатели пакетов сообщений.
+            maxsize (int): Максимальный размер очереди.
+            batch_size (int): Максимальный размер пакета.
+            flush_interval (float): Время ожидания новых сообщений в секундах.
+        """
+        self.writers = writers
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: queue.Queue[loguru.Message | None] = queue.Queue(maxsize)
+        self._thread: threading.Thread | None = None
+
+        self.enqueued = 0
+        self.dropped = 0
+        self.written = 0
+        self.errors = 0
+
+    def __call__(self, message: loguru.Message) -> None:
+        try:
+            self._queue.put_nowait(message)
+        except queue.Full:
+            self.dropped += 1
+            return
+
+        self.enqueued += 1
+
+    def start(self) -> None:
+        """Запускает фоновый поток записи."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+            self._thread.start()
+            atexit.register(self.stop)
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Дописывает накопленные сообщения и останавливает фоновый поток.
+
+        Args:
+            timeout (float): Максимальное время ожидания в секундах.
+        """
+        if self._thread is not None:
+            try:
+                # Маркер остановки ждет места в очереди, чтобы не потерять сообщения
+                self._queue.put(None, timeout=timeout)
+            except queue.Full:
+                pass
+
+            self._thread.join(timeout)
+            self._thread = None
+
+    def stats(self) -> dict[str, int]:
+        """Возвращает счетчики работы очереди."""
+        return {
+            "queued": self._queue.qsize(),
+            "enqueued": self.enqueued,
+            "dropped": self.dropped,
+            "written": self.written,
+            "errors": self.errors,
+        }
+
+    def _run(self) -> None:
+        running = True
+        while running:
+            try:
+                batch = [self._queue.get(timeout=self.flush_interval)]
+            except queue.Empty:
+                continue
+
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            if None in batch:
+                running = False
+                batch = [message for message in batch if message is not None]
+
+            if batch:
+                self._write(batch)
+
+    def _write(self, batch: list[loguru.Message]) -> None:
+        for writer in self.writers:
+            try:
+                writer(batch)
+            except Exception as error:
+                # Логгер недоступен внутри собственного sink
+                self.errors += 1
+                print(f"Log writer {type(writer).__name__} failed: {error}", file=sys.stderr)
+
+        self.written += len(batch)
@@ -1,13 +1,67 @@
+import random
+import sys
+
 import uvicorn
+from uvicorn.main import STARTUP_FAILURE
+from uvicorn.supervisors import Multiprocess
 
 from configs import configs
 
+
+class WorkerConfig(uvicorn.Config):
+    """Конфигурация uvicorn со случайной добавкой к лимиту запросов процесса.
+
+    load() выполняется в каждом рабочем процессе, в том числе перезапущенном,
+    поэтому процессы, запущенные одновременно, перезапускаются в разное время,
+    а не все сразу.
+    """
+
+    def __init__(self, *args, limit_max_requests_jitter: int = 0, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.limit_max_requests_jitter = limit_max_requests_jitter
+
+    def load(self) -> None:
+        if self.limit_max_requests and self.limit_max_requests_jitter:
+            self.limit_max_requests += random.randint(0, self.limit_max_requests_jitter)
+
+        super().load()
+
+
 if __name__ == "__main__":
-    uvicorn.run(
-        "app:service",
-        host="0.0.0.0",
-        port=8068,
-        reload=configs.DEBUG_MODE,
-        date_header=True,
-        use_colors=True,
-    )
+    server = configs.server
+    if configs.DEBUG_MODE:
+        # Один процесс с перезапуском при изменении исходного кода
+        uvicorn.run(
+            "app:service",
+            host=server.HOST,
+            port=server.PORT,
+            reload=True,
+            date_header=True,
+            use_colors=True,
+        )
+    else:
+        # Несколько рабочих процессов; uvloop и httptools выбираются, если установлены
+        config = WorkerConfig(
+            "app:service",
+            host=server.HOST,
+            port=server.PORT,
+            workers=server.WORKERS,
+            loop=server.LOOP,
+            http=server.HTTP,
+            backlog=server.BACKLOG,
+            timeout_keep_alive=server.KEEP_ALIVE_TIMEOUT,
+            limit_max_requests=server.LIMIT_MAX_REQUESTS or None,
+            limit_max_requests_jitter=server.LIMIT_MAX_REQUESTS_JITTER,
+            timeout_graceful_shutdown=server.GRACEFUL_SHUTDOWN_TIMEOUT,
+            date_header=True,
+            server_header=False,
+            use_colors=False,
+        )
+        # То же, что uvicorn.run(), но с собственным классом конфигурации
+        process = uvicorn.Server(config=config)
+        if config.workers > 1:
+            Multiprocess(config, target=process.run, sockets=[config.bind_socket()]).run()
+        else:
+            process.run()
+            if not process.started:
+                sys.exit(STARTUP_FAILURE)
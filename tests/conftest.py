@@ -0,0 +1,5 @@
+import os
+
+# Обязательные настройки сервиса. Тесты не подключаются к БД
+os.environ.setdefault("EXERCISES_DB_POSTGRES_HOST", "localhost")
+os.environ.setdefault("EXERCISES_DB_POSTGRES_PASSWORD", "test")
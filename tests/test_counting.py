@@ -0,0 +1,71 @@
+import asyncio
+import time
+
+import pytest
+from sqlalchemy import func, select
+
+from database.counting import CountProvider, CountStrategy
+from database.models import Exercise
+
+
+class FakeResult:
+    def __init__(self, value: int) -> None:
+        self.value = value
+
+    def scalar_one(self) -> int:
+        return self.value
+
+
+class FakeSession:
+    def __init__(self) -> None:
+        self.queries = 0
+
+    async def execute(self, stmt, params=None) -> FakeResult:
+        self.queries += 1
+        return FakeResult(self.queries)
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    now = [1000.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    return now
+
+
+def count(provider: CountProvider, db: FakeSession, key: str) -> tuple[int, CountStrategy]:
+    stmt = select(func.count()).select_from(Exercise)
+    return asyncio.run(provider.count(db, key, stmt))
+
+
+def test_cached_count_is_reused_until_expired(clock: list[float]) -> None:
+    provider = CountProvider(Exercise, "cached", ttl=10)
+    db = FakeSession()
+
+    assert count(provider, db, "a") == (1, CountStrategy.EXACT)
+    assert count(provider, db, "a") == (1, CountStrategy.CACHED)
+
+    clock[0] += 10
+    assert count(provider, db, "a") == (2, CountStrategy.EXACT)
+
+
+def test_cache_is_bounded(clock: list[float]) -> None:
+    provider = CountProvider(Exercise, "cached", ttl=10, max_entries=4)
+    db = FakeSession()
+
+    for key in range(10):
+        count(provider, db, str(key))
+        assert len(provider._cache) <= 4
+
+
+def test_expired_entries_are_pruned_first(clock: list[float]) -> None:
+    provider = CountProvider(Exercise, "cached", ttl=10, max_entries=3)
+    db = FakeSession()
+    count(provider, db, "old")
+    clock[0] += 5
+    count(provider, db, "a")
+    count(provider, db, "b")
+    clock[0] += 5
+
+    count(provider, db, "c")
+
+    assert sorted(provider._cache) == ["a", "b", "c"]
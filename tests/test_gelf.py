@@ -0,0 +1,54 @@
+import json
+import random
+import string
+import zlib
+
+import pytest
+from graypy.handler import GELFChunkOverflowWarning
+from loguru import logger
+
+from service_logging.gelf import GELFSender, gelf_message
+
+# Заголовок чанка GELF: магические байты, id сообщения, номер и число чанков
+CHUNK_HEADER_SIZE = 12
+
+
+class FakeSocket:
+    def __init__(self) -> None:
+        self.sent: list[bytes] = []
+
+    def sendto(self, data: bytes, _address) -> None:
+        self.sent.append(data)
+
+
+@pytest.fixture
+def messages() -> list:
+    captured = []
+    handler = logger.add(captured.append, format="{message}")
+    yield captured
+    logger.remove(handler)
+
+
+def test_message_has_facility(messages: list) -> None:
+    logger.info("hello")
+    [message] = messages
+
+    assert gelf_message(message.record, "host")["facility"] == __name__
+    assert gelf_message(message.record, "host", "service")["facility"] == "service"
+
+
+def test_chunk_overflowing_message_is_truncated(messages: list) -> None:
+    generator = random.Random(7)
+    logger.info("".join(generator.choices(string.ascii_letters, k=200_000)))
+
+    sender = GELFSender("127.0.0.1", 12201, chunk_size=100, facility="service")
+    sender._socket = FakeSocket()
+    with pytest.warns(GELFChunkOverflowWarning):
+        sender(messages)
+
+    chunks = sender._socket.sent
+    assert 1 < len(chunks) <= 128
+    packed = zlib.decompress(b"".join(chunk[CHUNK_HEADER_SIZE:] for chunk in chunks))
+    truncated = json.loads(packed)
+    assert truncated["facility"] == "service"
+    assert truncated["_chunk_overflow"] is True
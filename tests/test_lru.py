@@ -0,0 +1,81 @@
+import time
+
+import pytest
+
+from caching.lru import LRUCache
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    now = [1000.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_get_returns_stored_value() -> None:
+    cache: LRUCache[str, int] = LRUCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_evicts_least_recently_used() -> None:
+    cache: LRUCache[str, int] = LRUCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+
+
+def test_expired_entry_is_dropped(clock: list[float]) -> None:
+    cache: LRUCache[str, int] = LRUCache(maxsize=2, ttl=10)
+    cache.set("a", 1)
+
+    clock[0] += 9.9
+    assert cache.get("a") == 1
+
+    clock[0] += 0.1
+    assert cache.get("a") is None
+    assert cache.stats()["expirations"] == 1
+    assert cache.stats()["size"] == 0
+
+
+def test_zero_size_disables_cache() -> None:
+    cache: LRUCache[str, int] = LRUCache(maxsize=0, ttl=60)
+    cache.set("a", 1)
+
+    assert cache.get("a") is None
+
+
+def test_stale_epoch_is_not_stored() -> None:
+    cache: LRUCache[str, int] = LRUCache(maxsize=2, ttl=60)
+    epoch = cache.epoch
+    cache.invalidate("a")
+    cache.set("a", 1, epoch=epoch)
+
+    assert cache.get("a") is None
+
+    cache.set("a", 2, epoch=cache.epoch)
+    assert cache.get("a") == 2
+
+
+def test_invalidate_and_clear() -> None:
+    cache: LRUCache[str, int] = LRUCache(maxsize=4, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    cache.invalidate("a")
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+
+    cache.clear()
+    assert cache.get("b") is None
+    assert cache.stats()["invalidations"] == 2
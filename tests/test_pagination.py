@@ -0,0 +1,42 @@
+import base64
+import json
+
+import pytest
+
+from routers.utils.pagination import Cursor, CursorDirection
+
+
+def token(payload: dict) -> str:
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).rstrip(b"=").decode()
+
+
+@pytest.mark.parametrize(
+    ("sort", "values"),
+    [("seq_number", [7]), ("-seq_number", [7]), ("difficulty", [3, 7]), ("-difficulty", [3, 7])],
+)
+def test_round_trip(sort: str, values: list[int]) -> None:
+    cursor = Cursor(sort=sort, values=values, direction=CursorDirection.PREV)
+
+    assert Cursor.decode(cursor.encode()) == cursor
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"sort": "difficulty", "values": [3], "direction": "next"},
+        {"sort": "seq_number", "values": [3, 7], "direction": "next"},
+        {"sort": "seq_number", "values": [], "direction": "next"},
+        {"sort": "title", "values": [3], "direction": "next"},
+        {"sort": "seq_number", "values": [3], "direction": "sideways"},
+        {"sort": "seq_number", "values": ["x"], "direction": "next"},
+    ],
+)
+def test_rejects_invalid_payload(payload: dict) -> None:
+    with pytest.raises(ValueError):
+        Cursor.decode(token(payload))
+
+
+@pytest.mark.parametrize("value", ["not base64!", "e30", "bm90IGpzb24"])
+def test_rejects_corrupted_token(value: str) -> None:
+    with pytest.raises(ValueError):
+        Cursor.decode(value)
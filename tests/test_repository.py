@@ -0,0 +1,28 @@
+from sqlalchemy import Integer
+from sqlalchemy.dialects import postgresql
+
+from database.models import Exercise
+from database.repository import ExerciseRepository
+
+
+def compile_sql(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+def test_random_start_is_integer() -> None:
+    start = ExerciseRepository.random_seq_number()
+    probe = Exercise.seq_number > start
+    sql = compile_sql(probe)
+
+    assert isinstance(start.type, Integer)
+    assert isinstance(probe.right.type, Integer)
+    assert "CAST(floor(random() * max(exercises.seq_number)) AS INTEGER)" in sql
+
+
+
+def test_search_orders_by_distance_only() -> None:
+    sql = compile_sql(ExerciseRepository(None).search_statement("гласн", limit=10))
+    order_by = sql.split("ORDER BY", 1)[1]
+
+    # Любой дополнительный ключ заставит планировщик сортировать поверх KNN скана индекса
+    assert order_by.split("LIMIT")[0].strip() == "exercises.title <->> %(title_1)s::VARCHAR"
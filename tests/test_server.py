@@ -0,0 +1,33 @@
+from pathlib import Path
+
+import pytest
+
+from configs.server import available_cpus
+from metrics.registry import Counter, Histogram, Registry
+
+
+@pytest.mark.parametrize(
+    ("cpu_max", "limit"),
+    [("max 100000", None), ("150000 100000", 2), ("50000 100000", 1), ("garbage", None)],
+)
+def test_available_cpus_respects_quota(tmp_path: Path, cpu_max: str, limit: int | None) -> None:
+    path = tmp_path / "cpu.max"
+    path.write_text(cpu_max)
+    unlimited = available_cpus(tmp_path / "missing")
+
+    expected = unlimited if limit is None else min(unlimited, limit)
+    assert available_cpus(path) == expected
+
+
+def test_registry_adds_const_labels() -> None:
+    registry = Registry(const_labels={"worker": "42"})
+    requests = registry.register(Counter("requests_total", "Requests.", labels=("route",)))
+    duration = registry.register(Histogram("duration_seconds", "Duration.", buckets=(1.0,)))
+    requests.inc("/")
+    duration.observe(0.5)
+
+    lines = registry.render().decode().splitlines()
+
+    assert 'requests_total{worker="42",route="/"} 1' in lines
+    assert 'duration_seconds_bucket{worker="42",le="1"} 1' in lines
+    assert 'duration_seconds_count{worker="42"} 1' in lines
@@ -0,0 +1,117 @@
+import asyncio
+
+import pytest
+
+from caching.singleflight import SingleFlight
+
+
+def test_concurrent_calls_share_one_result() -> None:
+    flight: SingleFlight[str, int] = SingleFlight()
+    calls = 0
+
+    async def load() -> int:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return 42
+
+    async def main() -> list[int]:
+        return await asyncio.gather(*(flight.do("key", load) for _ in range(5)))
+
+    assert asyncio.run(main()) == [42] * 5
+    assert calls == 1
+    assert flight.stats() == {"in_flight": 0, "leaders": 1, "coalesced": 4}
+
+
+def test_different_keys_are_not_coalesced() -> None:
+    flight: SingleFlight[str, str] = SingleFlight()
+
+    async def main() -> list[str]:
+        async def load(key: str) -> str:
+            await asyncio.sleep(0.01)
+            return key
+
+        return await asyncio.gather(*(flight.do(key, lambda key=key: load(key)) for key in "ab"))
+
+    assert asyncio.run(main()) == ["a", "b"]
+    assert flight.stats()["leaders"] == 2
+
+
+def test_exception_is_shared() -> None:
+    flight: SingleFlight[str, int] = SingleFlight()
+
+    async def load() -> int:
+        await asyncio.sleep(0.01)
+        raise LookupError("missing")
+
+    async def main() -> list:
+        return await asyncio.gather(
+            *(flight.do("key", load) for _ in range(3)), return_exceptions=True
+        )
+
+    results = asyncio.run(main())
+    assert all(isinstance(result, LookupError) for result in results)
+    assert flight.stats()["leaders"] == 1
+
+
+def test_follower_retries_when_leader_is_cancelled() -> None:
+    flight: SingleFlight[str, int] = SingleFlight()
+    calls = 0
+
+    async def load() -> int:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return calls
+
+    async def main() -> int:
+        leader = asyncio.create_task(flight.do("key", load))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(flight.do("key", load))
+        await asyncio.sleep(0)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+
+        return await follower
+
+    assert asyncio.run(main()) == 2
+    assert calls == 2
+
+
+def test_cancelled_follower_does_not_cancel_leader() -> None:
+    flight: SingleFlight[str, int] = SingleFlight()
+
+    async def load() -> int:
+        await asyncio.sleep(0.01)
+        return 1
+
+    async def main() -> int:
+        leader = asyncio.create_task(flight.do("key", load))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(flight.do("key", load))
+        await asyncio.sleep(0)
+        follower.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await follower
+
+        return await leader
+
+    assert asyncio.run(main()) == 1
+
+
+def test_disabled_runs_every_call() -> None:
+    flight: SingleFlight[str, int] = SingleFlight(enabled=False)
+    calls = 0
+
+    async def load() -> int:
+        nonlocal calls
+        calls += 1
+        call = calls
+        await asyncio.sleep(0)
+        return call
+
+    async def main() -> list[int]:
+        return await asyncio.gather(*(flight.do("key", load) for _ in range(3)))
+
+    assert sorted(asyncio.run(main())) == [1, 2, 3]
@@ -0,0 +1,164 @@
+import json
+import random
+import uuid
+from collections import namedtuple
+
+import pytest
+
+from caching.snapshot import CatalogSnapshot
+
+Row = namedtuple("Row", ["id", "seq_number", "difficulty", "tags"])
+
+
+def make_rows(count: int, seed: int = 7) -> list[Row]:
+    generator = random.Random(seed)
+    seqs = generator.sample(range(1, count * 3), count)
+    return [
+        Row(uuid.UUID(int=seq), seq, generator.randint(0, 9), ["A"] if seq % 2 else ["B"])
+        for seq in seqs
+    ]
+
+
+def key(row: Row, sort: str) -> tuple[int, ...]:
+    if sort.lstrip("-") == "difficulty":
+        return (row.difficulty, row.seq_number)
+
+    return (row.seq_number,)
+
+
+def reference_page(
+    rows: list[Row], sort: str, limit: int, offset: int, after, backward: bool
+) -> list[int]:
+    """Повторяет семантику ExerciseRepository.list_page() на списке."""
+    descending = sort.startswith("-") != backward
+    ordered = sorted(rows, key=lambda row: key(row, sort), reverse=descending)
+    if after is not None:
+        after = tuple(after)
+        ordered = [
+            row
+            for row in ordered
+            if (key(row, sort) < after if descending else key(row, sort) > after)
+        ]
+
+    page = ordered[offset : offset + limit]
+    if backward:
+        page.reverse()
+
+    return [row.seq_number for row in page]
+
+
+@pytest.fixture(scope="module")
+def rows() -> list[Row]:
+    return make_rows(60)
+
+
+@pytest.fixture(scope="module")
+def snapshot(rows: list[Row]) -> CatalogSnapshot:
+    return CatalogSnapshot(version=3, rows=rows)
+
+
+@pytest.mark.parametrize("sort", ["seq_number", "-seq_number", "difficulty", "-difficulty"])
+@pytest.mark.parametrize("backward", [False, True])
+def test_page_matches_database_order(
+    snapshot: CatalogSnapshot, rows: list[Row], sort: str, backward: bool
+) -> None:
+    selection = snapshot.select("{}", None, sort)
+    anchors = [None, *(key(row, sort) for row in rows[::7])]
+    for after in anchors:
+        if backward and after is None:
+            continue
+
+        for limit, offset in [(10, 0), (5, 3), (100, 0), (0, 0), (10, 58)]:
+            expected = reference_page(rows, sort, limit, offset, after, backward)
+            indices = snapshot.page(selection, sort, limit, offset, after, backward)
+
+            assert [snapshot.rows[index].seq_number for index in indices] == expected
+
+
+def test_select_filters_and_memoises(snapshot: CatalogSnapshot, rows: list[Row]) -> None:
+    calls = 0
+
+    def predicate(row: Row) -> bool:
+        nonlocal calls
+        calls += 1
+        return "A" in row.tags
+
+    first = snapshot.select('{"tags":["A"]}', predicate, "-difficulty")
+    second = snapshot.select('{"tags":["A"]}', predicate, "difficulty")
+
+    assert first is second
+    assert calls == len(rows)
+    assert [snapshot.rows[index].seq_number for index in first] == [
+        row.seq_number
+        for row in sorted(rows, key=lambda row: key(row, "difficulty"))
+        if "A" in row.tags
+    ]
+
+
+def test_selection_memo_is_bounded(rows: list[Row]) -> None:
+    snapshot = CatalogSnapshot(version=1, rows=rows, max_selections=2)
+    for number in range(5):
+        snapshot.select(str(number), lambda row: True, "seq_number")
+
+    assert len(snapshot._selections) <= 2
+
+
+def test_dump_json(snapshot: CatalogSnapshot, rows: list[Row]) -> None:
+    selection = snapshot.select("{}", None, "seq_number")
+    indices = snapshot.page(selection, "seq_number", limit=3)
+
+    assert [item["seq_number"] for item in json.loads(snapshot.dump_json(indices))] == sorted(
+        row.seq_number for row in rows
+    )[:3]
+    assert snapshot.dump_json([]) == b"[]"
+
+
+def in_band(row: Row, low: int, high: int, exclude: set) -> bool:
+    return low <= row.difficulty <= high and row.id not in exclude
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_pick_next_returns_smallest_following_number(
+    snapshot: CatalogSnapshot, rows: list[Row], seed: int
+) -> None:
+    generator = random.Random(seed)
+    selection = snapshot.select("{}", None, "difficulty")
+    for _ in range(50):
+        low = generator.randint(0, 9)
+        high = low + generator.randint(0, 3)
+        after = generator.randint(0, 180)
+        exclude = {row.id for row in generator.sample(rows, 20)}
+
+        candidates = [
+            row.seq_number
+            for row in rows
+            if in_band(row, low, high, exclude) and row.seq_number > after
+        ]
+        index = snapshot.pick_next(selection, low, high, after, exclude)
+
+        if candidates:
+            assert snapshot.rows[index].seq_number == min(candidates)
+        else:
+            assert index is None
+
+
+def test_pick_random_stays_in_band(snapshot: CatalogSnapshot, rows: list[Row]) -> None:
+    selection = snapshot.select("{}", None, "difficulty")
+    exclude = {row.id for row in rows if row.difficulty == 4}
+    allowed = {row.seq_number for row in rows if in_band(row, 3, 5, exclude)}
+
+    picked = {
+        snapshot.rows[snapshot.pick_random(selection, 3, 5, exclude)].seq_number
+        for _ in range(500)
+    }
+
+    assert picked == allowed
+
+
+def test_pick_random_without_candidates(snapshot: CatalogSnapshot, rows: list[Row]) -> None:
+    selection = snapshot.select("{}", None, "difficulty")
+    exclude = {row.id for row in rows if row.difficulty == 2}
+
+    assert snapshot.pick_random(selection, 20, 30) is None
+    assert snapshot.pick_random(selection, 2, 2, exclude) is None
+    assert snapshot.pick_next(selection, 2, 2, 0, exclude) is None
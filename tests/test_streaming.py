@@ -0,0 +1,82 @@
+import asyncio
+import json
+
+import pytest
+
+from routers.utils.streaming import StreamFormatError, iter_json_items
+
+
+def parse(body: str, chunk_size: int | None = None, max_item_size: int = 1024) -> list:
+    data = body.encode()
+    size = chunk_size or max(len(data), 1)
+
+    async def chunks():
+        for start in range(0, len(data), size):
+            yield data[start : start + size]
+
+    async def collect():
+        return [item async for item in iter_json_items(chunks(), max_item_size)]
+
+    return asyncio.run(collect())
+
+
+@pytest.mark.parametrize("chunk_size", [None, 1, 2, 3, 7])
+@pytest.mark.parametrize(
+    "body",
+    [
+        '[{"a": 1}, {"b": [1, 2]}, "x,]", 123, 4.5e3, true, null]',
+        " [ ] ",
+        '[123, 456]',
+        '[{"title": "Чтение"}]',
+    ],
+)
+def test_array_does_not_depend_on_chunking(body: str, chunk_size: int | None) -> None:
+    assert parse(body, chunk_size) == json.loads(body)
+
+
+@pytest.mark.parametrize("chunk_size", [None, 1])
+@pytest.mark.parametrize(
+    "body",
+    [
+        '[{"a":1} {"b":2}]',
+        '[{"a":1},,{"b":2}]',
+        '[,{"a":1}]',
+        '[{"a":1},]',
+        '[{"a":1}',
+        '[{"a":1}] {"b":2}',
+        "[12",
+    ],
+)
+def test_array_rejects_invalid_json(body: str, chunk_size: int | None) -> None:
+    with pytest.raises(StreamFormatError):
+        parse(body, chunk_size)
+
+
+def test_array_yields_items_before_error() -> None:
+    items = []
+
+    async def collect():
+        async def chunks():
+            yield b'[{"a":1}, {"b":2} {"c":3}]'
+
+        async for item in iter_json_items(chunks(), 1024):
+            items.append(item)
+
+    with pytest.raises(StreamFormatError):
+        asyncio.run(collect())
+
+    assert items == [{"a": 1}, {"b": 2}]
+
+
+@pytest.mark.parametrize("chunk_size", [None, 1, 5])
+def test_ndjson_reports_bad_lines_and_continues(chunk_size: int | None) -> None:
+    items = parse('{"a": 1}\nnot json\n\n{"b": 2}', chunk_size)
+
+    assert items[0] == {"a": 1}
+    assert isinstance(items[1], json.JSONDecodeError)
+    assert items[2] == {"b": 2}
+
+
+def test_item_size_limit() -> None:
+    with pytest.raises(StreamFormatError):
+        parse('[{"a": "' + "x" * 100 + '"}]', chunk_size=10, max_item_size=50)